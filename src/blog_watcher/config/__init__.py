@@ -1,6 +1,6 @@
 from .errors import ConfigError
 from .loader import load_config
-from .models import AppConfig, BlogConfig, SlackConfig
+from .models import AppConfig, BlogConfig, HttpConfig, RetentionConfig, SchedulerConfig, SlackConfig, StorageConfig
 from .provider import ConfigProvider, FileConfigProvider, StaticConfigProvider
 
 __all__ = [
@@ -9,7 +9,11 @@ __all__ = [
     "ConfigError",
     "ConfigProvider",
     "FileConfigProvider",
+    "HttpConfig",
+    "RetentionConfig",
+    "SchedulerConfig",
     "SlackConfig",
     "StaticConfigProvider",
+    "StorageConfig",
     "load_config",
 ]
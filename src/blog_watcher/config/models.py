@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 from urllib.parse import urlparse
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from blog_watcher.detection.urls.normalizer import normalize_url
 
@@ -57,11 +57,185 @@ class BlogConfig(BaseModel):
         return normalize_url(self.url)
 
 
+class RetentionConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    raw_days: int = 7
+    hourly_days: int = 90
+    daily_days: int | None = None
+    interval_minutes: int = 60
+    batch_size: int = 1000
+    vacuum_pages: int = 1000
+
+    @field_validator("raw_days", "hourly_days", "daily_days", "interval_minutes", "batch_size")
+    @classmethod
+    def _validate_positive(cls, value: int | None) -> int | None:
+        if value is not None and value <= 0:
+            msg = "must be positive"
+            raise ValueError(msg)
+        return value
+
+    @field_validator("vacuum_pages")
+    @classmethod
+    def _validate_vacuum_pages(cls, value: int) -> int:
+        if value < 0:
+            msg = "must be non-negative"
+            raise ValueError(msg)
+        return value
+
+    @model_validator(mode="after")
+    def _validate_tiers(self) -> RetentionConfig:
+        if self.hourly_days < self.raw_days:
+            msg = "hourly_days must be at least raw_days"
+            raise ValueError(msg)
+        return self
+
+
+class SchedulerConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    interval_seconds: int = 60
+    mode: Literal["cycle", "queue", "spread"] = "cycle"
+    workers: int = 4
+    adaptive: bool = False
+    min_interval_seconds: int = 60
+    max_interval_seconds: int = 21600
+    backoff_factor: float = 1.5
+    change_fraction: float = 0.1
+    jitter: float = 0.1
+    check_timeout_seconds: float | None = None
+    cycle_deadline_seconds: float | None = None
+
+    @field_validator("interval_seconds", "workers", "min_interval_seconds", "max_interval_seconds")
+    @classmethod
+    def _validate_positive(cls, value: int) -> int:
+        if value <= 0:
+            msg = "must be positive"
+            raise ValueError(msg)
+        return value
+
+    @field_validator("check_timeout_seconds", "cycle_deadline_seconds")
+    @classmethod
+    def _validate_optional_positive(cls, value: float | None) -> float | None:
+        if value is not None and value <= 0:
+            msg = "must be positive"
+            raise ValueError(msg)
+        return value
+
+    @field_validator("backoff_factor")
+    @classmethod
+    def _validate_backoff_factor(cls, value: float) -> float:
+        if value < 1:
+            msg = "must be at least 1"
+            raise ValueError(msg)
+        return value
+
+    @field_validator("change_fraction")
+    @classmethod
+    def _validate_change_fraction(cls, value: float) -> float:
+        if not 0 < value <= 1:
+            msg = "must be in (0, 1]"
+            raise ValueError(msg)
+        return value
+
+    @field_validator("jitter")
+    @classmethod
+    def _validate_jitter(cls, value: float) -> float:
+        if not 0 <= value < 1:
+            msg = "must be in [0, 1)"
+            raise ValueError(msg)
+        return value
+
+    @model_validator(mode="after")
+    def _validate_bounds(self) -> SchedulerConfig:
+        if self.max_interval_seconds < self.min_interval_seconds:
+            msg = "max_interval_seconds must be at least min_interval_seconds"
+            raise ValueError(msg)
+        return self
+
+
+class StorageConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    compact_unchanged_checks: bool = False
+    backfill_batch_size: int = 1000
+
+    @field_validator("backfill_batch_size")
+    @classmethod
+    def _validate_backfill_batch_size(cls, value: int) -> int:
+        if value <= 0:
+            msg = "must be positive"
+            raise ValueError(msg)
+        return value
+
+
+class HttpConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    connect_timeout_seconds: float = 10.0
+    read_timeout_seconds: float = 10.0
+    write_timeout_seconds: float = 10.0
+    pool_timeout_seconds: float = 10.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 5.0
+    http2: bool = False
+    memo_ttl_seconds: float = 30.0
+    # Size bound of the on-disk response cache; 0 turns it off.
+    cache_max_megabytes: int = 64
+    # Failed fetches in a row that open a host's circuit; 0 turns the breaker off.
+    breaker_failure_threshold: int = 5
+    breaker_cooldown_seconds: float = 300.0
+    # Bodies larger than this are written to a temporary file instead of memory; 0 turns spooling off.
+    spool_threshold_megabytes: int = 8
+
+    @field_validator(
+        "connect_timeout_seconds",
+        "read_timeout_seconds",
+        "write_timeout_seconds",
+        "pool_timeout_seconds",
+        "max_connections",
+        "breaker_cooldown_seconds",
+    )
+    @classmethod
+    def _validate_positive(cls, value: float) -> float:
+        if value <= 0:
+            msg = "must be positive"
+            raise ValueError(msg)
+        return value
+
+    @field_validator(
+        "max_keepalive_connections",
+        "keepalive_expiry_seconds",
+        "memo_ttl_seconds",
+        "cache_max_megabytes",
+        "breaker_failure_threshold",
+        "spool_threshold_megabytes",
+    )
+    @classmethod
+    def _validate_non_negative(cls, value: float) -> float:
+        if value < 0:
+            msg = "must be non-negative"
+            raise ValueError(msg)
+        return value
+
+    @model_validator(mode="after")
+    def _validate_pool(self) -> HttpConfig:
+        if self.max_keepalive_connections > self.max_connections:
+            msg = "max_keepalive_connections cannot exceed max_connections"
+            raise ValueError(msg)
+        return self
+
+
 class AppConfig(BaseModel):
     model_config = ConfigDict(frozen=True, extra="forbid")
 
     slack: SlackConfig
     blogs: list[BlogConfig]
+    retention: RetentionConfig = Field(default_factory=RetentionConfig)
+    storage: StorageConfig = Field(default_factory=StorageConfig)
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
+    http: HttpConfig = Field(default_factory=HttpConfig)
 
     @field_validator("blogs")
     @classmethod
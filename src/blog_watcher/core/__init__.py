@@ -1,4 +1,17 @@
-from blog_watcher.core.scheduler import WatcherScheduler
+from blog_watcher.core.backfill import BackfillScheduler
+from blog_watcher.core.polling import AdaptivePolling, ErrorBackoff, PollingPolicy
+from blog_watcher.core.retention import RetentionScheduler
+from blog_watcher.core.scheduler import QueueScheduler, WatcherScheduler, spread_offset
 from blog_watcher.core.watcher import BlogWatcher
 
-__all__ = ["BlogWatcher", "WatcherScheduler"]
+__all__ = [
+    "AdaptivePolling",
+    "BackfillScheduler",
+    "BlogWatcher",
+    "ErrorBackoff",
+    "PollingPolicy",
+    "QueueScheduler",
+    "RetentionScheduler",
+    "WatcherScheduler",
+    "spread_offset",
+]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from typing import TYPE_CHECKING
+
+from blog_watcher.observability import get_logger
+
+if TYPE_CHECKING:
+    from blog_watcher.storage import SchemaBackfill
+
+logger = get_logger(__name__)
+
+
+class BackfillScheduler:
+    """Drains pending migration backfills in the background, then exits."""
+
+    def __init__(self, backfill: SchemaBackfill) -> None:
+        self._backfill = backfill
+        self._task: asyncio.Task[None] | None = None
+        self._stop_event = asyncio.Event()
+
+    async def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._stop_event.set()
+        await self._task
+        self._task = None
+
+    async def run_once(self) -> None:
+        rows = 0
+        batches = 0
+        while not self._stop_event.is_set() and self._backfill.pending():
+            rows += self._backfill.run_batch()
+            batches += 1
+            # Let pending checks write between batches.
+            await asyncio.sleep(0)
+        if batches:
+            logger.info("schema_backfill_completed", rows=rows, batches=batches, remaining=self._backfill.pending())
+
+    async def _run(self) -> None:
+        try:
+            await self.run_once()
+        except sqlite3.Error as exc:
+            # Progress is committed per batch; the next start resumes where this one stopped.
+            logger.warning("schema_backfill_failed", error=str(exc))
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from blog_watcher.storage import CheckHistoryRepository
+
+
+@dataclass(frozen=True, slots=True)
+class PollingPolicy:
+    min_interval: timedelta = timedelta(minutes=1)
+    max_interval: timedelta = timedelta(hours=6)
+    backoff_factor: float = 1.5
+    # Poll roughly 1 / change_fraction times per expected gap between posts.
+    change_fraction: float = 0.1
+    jitter: float = 0.1
+    history_window: int = 5
+
+    def __post_init__(self) -> None:
+        if self.min_interval <= timedelta(0):
+            msg = "min_interval must be positive"
+            raise ValueError(msg)
+        if self.max_interval < self.min_interval:
+            msg = "max_interval cannot be shorter than min_interval"
+            raise ValueError(msg)
+        if self.backoff_factor < 1:
+            msg = "backoff_factor must be at least 1"
+            raise ValueError(msg)
+        if not 0 < self.change_fraction <= 1:
+            msg = "change_fraction must be in (0, 1]"
+            raise ValueError(msg)
+        if not 0 <= self.jitter < 1:
+            msg = "jitter must be in [0, 1)"
+            raise ValueError(msg)
+        if self.history_window < 1:
+            msg = "history_window must be positive"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True, slots=True)
+class ErrorBackoff:
+    """Delay before retrying a blog whose last ``n`` checks failed: ``base * 2 ** (n - 1)``, capped."""
+
+    base: timedelta = timedelta(minutes=1)
+    max_interval: timedelta = timedelta(hours=6)
+
+    def __post_init__(self) -> None:
+        if self.base <= timedelta(0):
+            msg = "base must be positive"
+            raise ValueError(msg)
+        if self.max_interval < self.base:
+            msg = "max_interval cannot be shorter than base"
+            raise ValueError(msg)
+
+    def delay(self, consecutive_errors: int) -> timedelta:
+        delay: timedelta = min(self.base * 2 ** max(consecutive_errors - 1, 0), self.max_interval)
+        return delay
+
+
+class AdaptivePolling:
+    """Per-blog check intervals that follow each blog's posting rate.
+
+    A change resets the blog to ``min_interval``. Every quiet check multiplies the
+    interval by ``backoff_factor`` up to ``max_interval``, but never beyond
+    ``change_fraction`` of the blog's typical gap between posts, estimated from its
+    recent changed checks. The next due time is jittered so blogs drift apart.
+    """
+
+    def __init__(self, policy: PollingPolicy, history_repo: CheckHistoryRepository, *, rng: random.Random | None = None) -> None:
+        self._policy = policy
+        self._history_repo = history_repo
+        self._rng = rng or random.Random()  # noqa: S311 - jitter, not security
+        self._intervals: dict[str, timedelta] = {}
+        self._next_due: dict[str, datetime] = {}
+
+    @property
+    def policy(self) -> PollingPolicy:
+        return self._policy
+
+    def next_due(self, blog_id: str) -> datetime | None:
+        return self._next_due.get(blog_id)
+
+    def is_due(self, blog_id: str, now: datetime) -> bool:
+        due = self._next_due.get(blog_id)
+        return due is None or now >= due
+
+    def record(self, blog_id: str, *, changed: bool, last_changed_at: datetime | None, now: datetime) -> datetime:
+        """Schedule the next check after one that finished at ``now`` and return its due time."""
+        interval = self._next_interval(blog_id, changed=changed, last_changed_at=last_changed_at, now=now)
+        self._intervals[blog_id] = interval
+        spread = interval * self._rng.uniform(-self._policy.jitter, self._policy.jitter)
+        due = now + max(interval + spread, self._policy.min_interval)
+        self._next_due[blog_id] = due
+        return due
+
+    def forget(self, blog_id: str) -> None:
+        self._intervals.pop(blog_id, None)
+        self._next_due.pop(blog_id, None)
+
+    def _next_interval(self, blog_id: str, *, changed: bool, last_changed_at: datetime | None, now: datetime) -> timedelta:
+        policy = self._policy
+        if changed:
+            return policy.min_interval
+        period = self._posting_period(blog_id, last_changed_at=last_changed_at, now=now)
+        ceiling = policy.max_interval if period is None else min(period * policy.change_fraction, policy.max_interval)
+        previous = self._intervals.get(blog_id)
+        if previous is not None:
+            interval = min(previous * policy.backoff_factor, ceiling)
+        elif period is not None:
+            # After a restart, resume from the learned rate instead of starting over at min_interval.
+            interval = ceiling
+        else:
+            interval = policy.min_interval
+        return max(interval, policy.min_interval)
+
+    def _posting_period(self, blog_id: str, *, last_changed_at: datetime | None, now: datetime) -> timedelta | None:
+        changes = [entry.checked_at for entry in self._history_repo.list_by_blog_id(blog_id, changed_only=True, limit=self._policy.history_window)]
+        if last_changed_at is not None and (not changes or last_changed_at > changes[0]):
+            changes.insert(0, last_changed_at)
+        if not changes:
+            return None
+        # The silence since the latest change counts as a gap once it outgrows the others.
+        gaps = [newer - older for newer, older in pairwise(changes)]
+        gaps.append(now - changes[0])
+        return max(sum(gaps, timedelta(0)) / len(gaps), now - changes[0])
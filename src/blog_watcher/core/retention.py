@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from blog_watcher.observability import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from blog_watcher.storage import HistoryRetention
+
+logger = get_logger(__name__)
+
+
+class RetentionScheduler:
+    def __init__(self, interval_seconds: int, retention: HistoryRetention) -> None:
+        if interval_seconds <= 0:
+            msg = "interval_seconds must be positive"
+            raise ValueError(msg)
+
+        self._interval_seconds = interval_seconds
+        self._retention = retention
+        self._task: asyncio.Task[None] | None = None
+        self._stop_event = asyncio.Event()
+
+    async def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._stop_event.set()
+        await self._task
+        self._task = None
+
+    async def run_once(self) -> None:
+        now = datetime.now(UTC)
+        raw = await self._drain(lambda: self._retention.rollup_raw_batch(now=now))
+        hourly = await self._drain(lambda: self._retention.rollup_hourly_batch(now=now))
+        daily = await self._drain(lambda: self._retention.prune_daily_batch(now=now))
+        self._retention.incremental_vacuum()
+        logger.info("history_retention_completed", raw_rows=raw, hourly_rows=hourly, daily_rows=daily)
+
+    async def _drain(self, step: Callable[[], int]) -> int:
+        total = 0
+        while not self._stop_event.is_set():
+            removed = step()
+            total += removed
+            if removed < self._retention.policy.batch_size:
+                break
+            # Let pending checks write between batches.
+            await asyncio.sleep(0)
+        return total
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await self.run_once()
+            except sqlite3.Error as exc:
+                logger.warning("history_retention_failed", error=str(exc))
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self._interval_seconds)
+            except TimeoutError:
+                continue
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+import hashlib
+import heapq
+import itertools
+import math
+import time
+from typing import TYPE_CHECKING, Protocol
+
+from blog_watcher.observability import METRICS, get_logger
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable
+    from datetime import datetime
+
+    from blog_watcher.config import BlogConfig
+    from blog_watcher.observability import MetricsRegistry
+
+logger = get_logger(__name__)
 
 
 class WatcherScheduler:
-    def __init__(self, interval_seconds: int, watcher: object) -> None:
+    """Runs ``watcher.check_all`` on fixed ticks every ``interval_seconds``.
+
+    Ticks that pass while a cycle is still running are skipped rather than queued,
+    so an overrunning cycle never overlaps the next one or starts a backlog of them.
+    """
+
+    def __init__(self, interval_seconds: int, watcher: object, *, metrics: MetricsRegistry | None = None) -> None:
         if interval_seconds <= 0:
             msg = "interval_seconds must be positive"
             raise ValueError(msg)
@@ -18,9 +37,15 @@ class WatcherScheduler:
 
         self._interval_seconds = interval_seconds
         self._watcher = watcher
+        self._metrics = metrics or METRICS
+        self._cycles_overrun = self._metrics.counter("cycles_overrun")
         self._task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
 
+    @property
+    def interval_seconds(self) -> int:
+        return self._interval_seconds
+
     async def start(self) -> None:
         if self._task is not None and not self._task.done():
             return
@@ -35,12 +60,164 @@ class WatcherScheduler:
         self._task = None
 
     async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + self._interval_seconds
         while not self._stop_event.is_set():
-            await asyncio.sleep(self._interval_seconds)
+            await asyncio.sleep(max(next_tick - loop.time(), 0))
             if self._stop_event.is_set():
                 break
+            started = loop.time()
             await self._maybe_await(self._watcher.check_all())
+            finished = loop.time()
+            next_tick += self._interval_seconds
+            if finished > next_tick:
+                skipped = math.floor((finished - next_tick) / self._interval_seconds) + 1
+                next_tick += skipped * self._interval_seconds
+                self._cycles_overrun.inc()
+                logger.warning("watch_cycle_overrun", elapsed_seconds=round(finished - started, 3), skipped_ticks=skipped)
+            self._metrics.report()
 
     async def _maybe_await(self, result: Awaitable[object] | object) -> None:
         if asyncio.iscoroutine(result):
             await result
+
+
+def spread_offset(blog_id: str, interval_seconds: float) -> float:
+    """Stable offset in ``[0, interval_seconds)`` for ``blog_id``, the same across restarts."""
+    digest = hashlib.blake2b(blog_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest) / 2**64 * interval_seconds
+
+
+class BlogCheckRunner(Protocol):
+    def load_blogs(self) -> list[BlogConfig] | None: ...
+
+    async def check_blog(self, blog: BlogConfig) -> datetime | None: ...
+
+
+class QueueScheduler:
+    """Checks each blog when it is due instead of all blogs on one tick.
+
+    Blogs wait in a heap keyed by their next due time. A dispatcher hands due blogs
+    to ``workers`` concurrent workers, and every finished check is pushed back with
+    its next due time: the one adaptive polling returns, or the previous due time
+    plus ``interval_seconds`` so start times never drift. The blog list is reloaded
+    every ``interval_seconds``; new blogs are due at once and removed ones are dropped.
+
+    With ``spread``, a new blog is first due at its :func:`spread_offset` within the
+    interval instead, so fixed-interval checks are spread evenly over time rather
+    than all landing at startup.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: int,
+        watcher: BlogCheckRunner,
+        *,
+        workers: int = 4,
+        spread: bool = False,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        if interval_seconds <= 0:
+            msg = "interval_seconds must be positive"
+            raise ValueError(msg)
+        if workers <= 0:
+            msg = "workers must be positive"
+            raise ValueError(msg)
+
+        self._interval_seconds = interval_seconds
+        self._watcher = watcher
+        self._workers = workers
+        self._spread = spread
+        self._metrics = metrics or METRICS
+        self._heap: list[tuple[float, int, str]] = []
+        self._order = itertools.count()
+        self._blogs: dict[str, BlogConfig] = {}
+        # Blogs that are in the heap or being checked; each blog is in exactly one place.
+        self._scheduled: set[str] = set()
+        self._queue: asyncio.Queue[tuple[BlogConfig, float] | None] = asyncio.Queue(maxsize=workers)
+        self._wake = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def interval_seconds(self) -> int:
+        return self._interval_seconds
+
+    async def start(self) -> None:
+        if self._tasks and not all(task.done() for task in self._tasks):
+            return
+        self._stop_event.clear()
+        self._tasks = [asyncio.create_task(self._dispatch())]
+        self._tasks += [asyncio.create_task(self._work()) for _ in range(self._workers)]
+
+    async def shutdown(self) -> None:
+        if not self._tasks:
+            return
+        self._stop_event.set()
+        self._wake.set()
+        dispatcher, *workers = self._tasks
+        await dispatcher
+        for _ in workers:
+            await self._queue.put(None)
+        await asyncio.gather(*workers)
+        self._tasks = []
+
+    def _push(self, due: float, blog_id: str) -> None:
+        heapq.heappush(self._heap, (due, next(self._order), blog_id))
+        self._scheduled.add(blog_id)
+
+    def _refresh(self, now: float) -> None:
+        blogs = self._watcher.load_blogs()
+        if blogs is None:
+            return
+        self._blogs = {blog.blog_id: blog for blog in blogs}
+        for blog_id in self._blogs.keys() - self._scheduled:
+            self._push(self._first_due(blog_id, now), blog_id)
+
+    def _first_due(self, blog_id: str, now: float) -> float:
+        if not self._spread:
+            return now
+        window_start = now - now % self._interval_seconds
+        due = window_start + spread_offset(blog_id, self._interval_seconds)
+        return due if due >= now else due + self._interval_seconds
+
+    async def _dispatch(self) -> None:
+        next_refresh = 0.0
+        while not self._stop_event.is_set():
+            now = time.time()
+            if now >= next_refresh:
+                if next_refresh:
+                    self._metrics.report()
+                self._refresh(now)
+                next_refresh = now + self._interval_seconds
+            if self._heap and self._heap[0][0] <= now:
+                due, _, blog_id = heapq.heappop(self._heap)
+                blog = self._blogs.get(blog_id)
+                if blog is None:
+                    self._scheduled.discard(blog_id)
+                    continue
+                await self._queue.put((blog, due))
+                continue
+            timeout = min(self._heap[0][0] if self._heap else math.inf, next_refresh) - now
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except TimeoutError:
+                continue
+
+    async def _work(self) -> None:
+        while (item := await self._queue.get()) is not None:
+            blog, due = item
+            if self._stop_event.is_set():
+                continue
+            next_due: datetime | None = None
+            try:
+                next_due = await self._watcher.check_blog(blog)
+            except Exception:
+                # One failing blog must not take a worker down with it.
+                logger.exception("blog_check_failed", blog_id=blog.blog_id)
+            if blog.blog_id not in self._blogs:
+                self._scheduled.discard(blog.blog_id)
+                continue
+            self._push(next_due.timestamp() if next_due is not None else max(due + self._interval_seconds, time.time()), blog.blog_id)
+            self._wake.set()
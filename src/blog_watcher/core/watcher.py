@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import replace
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Protocol
 
+import httpx
+
 from blog_watcher.config import ConfigError, ConfigProvider
+from blog_watcher.core.polling import ErrorBackoff
+from blog_watcher.detection.http_fetcher import FetchStatusError
 from blog_watcher.notification import Notification, Notifier
-from blog_watcher.observability import get_logger
+from blog_watcher.observability import METRICS, get_logger
 from blog_watcher.storage import BlogState, BlogStateRepository, CheckHistory, CheckHistoryRepository
 
 if TYPE_CHECKING:
+    from datetime import timedelta
+
     from blog_watcher.config import BlogConfig
+    from blog_watcher.core.polling import AdaptivePolling
     from blog_watcher.detection.models import DetectionResult
+    from blog_watcher.observability import MetricsRegistry
 
 logger = get_logger(__name__)
 
@@ -21,7 +31,20 @@ class Detector(Protocol):
 
 
 class BlogWatcher:
-    def __init__(
+    """Checks blogs, persists the results and sends notifications.
+
+    ``check_timeout`` bounds a single check. ``cycle_deadline`` is a soft budget for
+    :meth:`check_all`: once it has passed, the remaining blogs are deferred and go
+    first in the next cycle, so one slow blog cannot hold back all the others.
+
+    A check that fails or times out is recorded in ``check_history`` with its error
+    and HTTP status, and counted in ``BlogState.consecutive_errors``. The blog is
+    then skipped until ``error_backoff`` says to retry it; the other blogs carry on.
+    A notification that cannot be sent does not fail the check: it is kept and sent
+    again after the blog's next successful check.
+    """
+
+    def __init__(  # noqa: PLR0913
         self,
         *,
         config_provider: ConfigProvider,
@@ -29,36 +52,113 @@ class BlogWatcher:
         notifier: Notifier,
         state_repo: BlogStateRepository,
         history_repo: CheckHistoryRepository,
+        polling: AdaptivePolling | None = None,
+        check_timeout: timedelta | None = None,
+        cycle_deadline: timedelta | None = None,
+        error_backoff: ErrorBackoff | None = None,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         self._config_provider = config_provider
         self._detector = detector
         self._notifier = notifier
         self._state_repo = state_repo
         self._history_repo = history_repo
-
-    async def check_all(self) -> None:
+        self._polling = polling
+        self._check_timeout = check_timeout
+        self._cycle_deadline = cycle_deadline
+        self._error_backoff = error_backoff or ErrorBackoff()
+        self._deferred: set[str] = set()
+        self._consecutive_errors: dict[str, int] = {}
+        self._retry_at: dict[str, datetime] = {}
+        self._pending_notifications: dict[str, Notification] = {}
+        registry = metrics or METRICS
+        self._checks_deferred = registry.counter("checks_deferred")
+        self._checks_timed_out = registry.counter("checks_timed_out")
+        self._checks_failed = registry.counter("checks_failed")
+        self._notifications_failed = registry.counter("notifications_failed")
+
+    def load_blogs(self) -> list[BlogConfig] | None:
+        """Return the configured blogs, or None when the config cannot be reloaded."""
         try:
             config = self._config_provider.get()
         except ConfigError as exc:
             logger.warning("config_reload_failed", error=str(exc))
-            return
-
-        logger.info("watch_cycle_started", blogs=len(config.blogs))
+            return None
+        return config.blogs
 
-        for blog in config.blogs:
-            result = await self._detector.check(blog)
-            self._persist_result(result)
-
-            if result.is_initial:
-                await self._notifier.send(Notification(title=f"Initial sync completed: {blog.name}", body=blog.name, url=blog.url))
-                logger.info("initial_sync_completed", blog_id=result.blog_id, url=blog.url)
-            elif result.changed:
-                await self._notifier.send(Notification(title=f"Blog updated: {blog.name}", body=blog.name, url=blog.url))
-                logger.info("change_detected", blog_id=result.blog_id, url=blog.url)
-
-        logger.info("watch_cycle_completed", blogs=len(config.blogs))
+    async def check_all(self) -> None:
+        blogs = self.load_blogs()
+        if blogs is None:
+            return
 
-    def _persist_result(self, result: DetectionResult) -> None:
+        cycle_started_at = datetime.now(UTC)
+        deadline = None if self._cycle_deadline is None else time.monotonic() + self._cycle_deadline.total_seconds()
+        due = [blog for blog in blogs if self._is_due(blog.blog_id, cycle_started_at)]
+        # Blogs deferred by the previous cycle go first; sorting is stable for the rest.
+        due.sort(key=lambda blog: blog.blog_id not in self._deferred)
+        logger.info("watch_cycle_started", blogs=len(blogs), due=len(due))
+
+        deferred: list[str] = []
+        with self._state_repo.prefetch(blog.blog_id for blog in due):
+            for blog in due:
+                if deferred or (deadline is not None and time.monotonic() >= deadline):
+                    deferred.append(blog.blog_id)
+                    continue
+                await self.check_blog(blog)
+
+        self._deferred = set(deferred)
+        if deferred:
+            self._checks_deferred.inc(len(deferred))
+            logger.warning("watch_cycle_deadline_reached", deferred=len(deferred))
+        logger.info("watch_cycle_completed", blogs=len(blogs), checked=len(due) - len(deferred), deferred=len(deferred))
+
+    def _is_due(self, blog_id: str, now: datetime) -> bool:
+        retry_at = self._retry_at.get(blog_id)
+        if retry_at is not None and now < retry_at:
+            return False
+        return self._polling is None or self._polling.is_due(blog_id, now)
+
+    async def check_blog(self, blog: BlogConfig) -> datetime | None:
+        """Check one blog, persist and notify; return when it should be checked next, if adaptive polling or an error says so."""
+        started_at = datetime.now(UTC)
+        try:
+            async with asyncio.timeout(None if self._check_timeout is None else self._check_timeout.total_seconds()):
+                result = await self._detector.check(blog)
+        except TimeoutError:
+            self._checks_timed_out.inc()
+            logger.warning("blog_check_timed_out", blog_id=blog.blog_id, url=blog.url)
+            return self._record_failure(blog, error="check timed out", http_status=None)
+        except Exception as exc:  # noqa: BLE001 - one broken blog must not stop the others
+            return self._record_failure(blog, error=f"{type(exc).__name__}: {exc}", http_status=_http_status(exc))
+        self._consecutive_errors.pop(blog.blog_id, None)
+        self._retry_at.pop(blog.blog_id, None)
+        state = self._persist_result(result, started_at=started_at)
+        next_due = None
+        if self._polling is not None:
+            changed = result.changed and not result.is_initial
+            next_due = self._polling.record(result.blog_id, changed=changed, last_changed_at=state.last_changed_at, now=state.last_checked_at)
+
+        notification = self._pending_notifications.pop(blog.blog_id, None)
+        if result.is_initial:
+            notification = Notification(title=f"Initial sync completed: {blog.name}", body=blog.name, url=blog.url)
+            logger.info("initial_sync_completed", blog_id=result.blog_id, url=blog.url)
+        elif result.changed:
+            notification = Notification(title=f"Blog updated: {blog.name}", body=blog.name, url=blog.url)
+            logger.info("change_detected", blog_id=result.blog_id, url=blog.url)
+        if notification is not None:
+            await self._notify(blog, notification)
+        return next_due
+
+    async def _notify(self, blog: BlogConfig, notification: Notification) -> None:
+        try:
+            await self._notifier.send(notification)
+        except Exception as exc:  # noqa: BLE001 - a failing webhook must not stop the other blogs
+            # The new state is already stored, so the change would not be seen again: resend on the next successful check.
+            self._pending_notifications[blog.blog_id] = notification
+            self._notifications_failed.inc()
+            logger.warning("notification_failed", blog_id=blog.blog_id, url=blog.url, error=f"{type(exc).__name__}: {exc}")
+
+    def _persist_result(self, result: DetectionResult, *, started_at: datetime) -> BlogState:
         now = datetime.now(UTC)
         state = self._state_repo.get(result.blog_id)
         if state is None:
@@ -79,6 +179,10 @@ class BlogWatcher:
                 last_changed_at=last_changed_at,
                 consecutive_errors=0,
             )
+        elif state.last_checked_at >= started_at:
+            # The detector already recorded this check; keep its timestamps so an
+            # unchanged result leaves nothing new to write.
+            state = replace(state, url_fingerprint=result.url_fingerprint)
         else:
             last_changed_at = state.last_changed_at
 
@@ -90,6 +194,7 @@ class BlogWatcher:
                 url_fingerprint=result.url_fingerprint,
                 last_checked_at=now,
                 last_changed_at=last_changed_at,
+                consecutive_errors=0,
             )
         self._state_repo.upsert(state)
 
@@ -102,4 +207,47 @@ class BlogWatcher:
             url_fingerprint=result.url_fingerprint,
             error_message=None,
         )
-        self._history_repo.add(history)
+        self._history_repo.record(history)
+        return state
+
+    def _record_failure(self, blog: BlogConfig, *, error: str, http_status: int | None) -> datetime:
+        """Record a failed check and return when the blog may be retried."""
+        now = datetime.now(UTC)
+        state = self._state_repo.get(blog.blog_id)
+        # Blogs that never synced have no state row; their count lives in memory until the first success.
+        errors = self._consecutive_errors.get(blog.blog_id, state.consecutive_errors if state is not None else 0) + 1
+        self._consecutive_errors[blog.blog_id] = errors
+        if state is not None:
+            self._state_repo.upsert(replace(state, consecutive_errors=errors))
+        self._history_repo.record(
+            CheckHistory(
+                blog_id=blog.blog_id,
+                checked_at=now,
+                http_status=http_status,
+                skipped=False,
+                changed=False,
+                url_fingerprint=None,
+                error_message=error,
+            )
+        )
+        retry_at = now + self._error_backoff.delay(errors)
+        self._retry_at[blog.blog_id] = retry_at
+        self._checks_failed.inc()
+        logger.warning(
+            "blog_check_failed",
+            blog_id=blog.blog_id,
+            url=blog.url,
+            error=error,
+            http_status=http_status,
+            consecutive_errors=errors,
+            retry_at=retry_at.isoformat(),
+        )
+        return retry_at
+
+
+def _http_status(exc: Exception) -> int | None:
+    if isinstance(exc, FetchStatusError):
+        return exc.status_code
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code
+    return None
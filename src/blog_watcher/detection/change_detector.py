@@ -3,11 +3,15 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Protocol
 
+from blog_watcher.detection.discovery import DiscoveryBackoff
 from blog_watcher.detection.feed import FeedChangeDetector
+from blog_watcher.detection.http_fetcher import FetchStatusError
 from blog_watcher.detection.models import DetectionResult, DetectorConfig
-from blog_watcher.detection.sitemap import SitemapChangeDetector
+from blog_watcher.detection.robots import RobotsCache
+from blog_watcher.detection.sitemap import SitemapChangeDetector, SitemapChildCache
 from blog_watcher.storage.models import BlogState
 
 if TYPE_CHECKING:
@@ -32,6 +36,8 @@ class _CheckContext:
     feed_last_modified: str | None = None
     sitemap_etag: str | None = None
     sitemap_last_modified: str | None = None
+    feed_body_hash: str | None = None
+    sitemap_body_hash: str | None = None
 
 
 class ChangeDetector:
@@ -41,21 +47,34 @@ class ChangeDetector:
         fetcher: Fetcher,
         state_repo: StateRepository,
         config: DetectorConfig | None = None,
+        robots: RobotsCache | None = None,
+        discovery: DiscoveryBackoff | None = None,
     ) -> None:
         self._fetcher = fetcher
         self._state_repo = state_repo
         self._config = config or DetectorConfig()
+        # Shared across checks: blogs on one host reuse a single robots.txt fetch, discovery misses are remembered,
+        # and unchanged child sitemaps behind an index are not parsed again.
+        self._robots = robots or RobotsCache(fetcher)
+        self._discovery = discovery or DiscoveryBackoff()
+        self._sitemap_children = SitemapChildCache()
 
     async def check(self, blog: BlogConfig) -> DetectionResult:
         previous_state = self._state_repo.get(blog.blog_id)
         fetch_result = await self._fetch_html(blog.url)
 
-        feed_detector = FeedChangeDetector(fetcher=self._fetcher, config=self._config)
+        feed_detector = FeedChangeDetector(fetcher=self._fetcher, config=self._config, discovery=self._discovery)
         feed_result = await feed_detector.detect(fetch_result, blog.url, previous_state)
 
         sitemap_result = None
         if not feed_result.changed:
-            sitemap_detector = SitemapChangeDetector(fetcher=self._fetcher, config=self._config)
+            sitemap_detector = SitemapChangeDetector(
+                fetcher=self._fetcher,
+                config=self._config,
+                robots=self._robots,
+                discovery=self._discovery,
+                children=self._sitemap_children,
+            )
             sitemap_result = await sitemap_detector.detect(blog.url, previous_state)
 
         sitemap_changed = sitemap_result.changed if sitemap_result is not None else False
@@ -78,6 +97,8 @@ class ChangeDetector:
             feed_last_modified=feed_result.last_modified,
             sitemap_etag=sitemap_result.etag if sitemap_result is not None else None,
             sitemap_last_modified=sitemap_result.last_modified if sitemap_result is not None else None,
+            feed_body_hash=feed_result.body_hash,
+            sitemap_body_hash=sitemap_result.body_hash if sitemap_result is not None else None,
         )
 
         self._persist_state(context, changed=changed, previous_state=previous_state, is_initial=is_initial)
@@ -85,8 +106,10 @@ class ChangeDetector:
 
     async def _fetch_html(self, url: str) -> FetchResult:
         result = await self._fetcher.fetch(url)
-        if result.content is None:
-            msg = "fetch_result.content is None"
+        if result.status_code >= HTTPStatus.BAD_REQUEST:
+            raise FetchStatusError(url, result.status_code)
+        if not result.has_body:
+            msg = "fetch_result has no body"
             raise ValueError(msg)
         return result
 
@@ -120,6 +143,8 @@ class ChangeDetector:
             feed_last_modified=context.feed_last_modified,
             sitemap_etag=context.sitemap_etag,
             sitemap_last_modified=context.sitemap_last_modified,
+            feed_body_hash=context.feed_body_hash,
+            sitemap_body_hash=context.sitemap_body_hash,
         )
         self._state_repo.upsert(new_state)
 
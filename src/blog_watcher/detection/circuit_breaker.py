@@ -0,0 +1,142 @@
+"""Per-host circuit breaker for the fetch layer."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from typing import TYPE_CHECKING, Protocol
+
+import httpx
+
+from blog_watcher.observability import METRICS, MetricsRegistry, get_logger
+from blog_watcher.storage.models import HostCircuit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = get_logger(__name__)
+
+# What a fetch raises once retries are exhausted and the host looks unhealthy; 4xx answers are not failures.
+_HOST_FAILURES = (httpx.TransportError, httpx.HTTPStatusError)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of fetching from a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_at: datetime | None) -> None:
+        super().__init__(f"circuit open for {host}")
+        self.host = host
+        self.retry_at = retry_at
+
+
+class HostCircuitStore(Protocol):
+    def get(self, host: str) -> HostCircuit | None: ...
+    def upsert(self, circuit: HostCircuit) -> None: ...
+    def delete(self, host: str) -> bool: ...
+
+
+class HostCircuitBreaker:
+    """Stops fetching from hosts that keep failing.
+
+    ``failure_threshold`` failed fetches in a row open a host's circuit: requests
+    to it fail at once with :class:`CircuitOpenError` for ``cooldown``. After that
+    a single trial request is let through (half-open); success closes the circuit,
+    failure opens it for another ``cooldown``. With a ``store`` the state survives
+    restarts, so a dead host is not retried by every blog on startup.
+    """
+
+    def __init__(
+        self,
+        store: HostCircuitStore | None = None,
+        *,
+        failure_threshold: int = 5,
+        cooldown: timedelta = timedelta(minutes=5),
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        if failure_threshold <= 0:
+            msg = "failure_threshold must be positive"
+            raise ValueError(msg)
+        if cooldown <= timedelta(0):
+            msg = "cooldown must be positive"
+            raise ValueError(msg)
+        self._store = store
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._circuits: dict[str, HostCircuit | None] = {}
+        self._trials: set[str] = set()
+        self._rejected = (metrics or METRICS).counter("circuit_rejected")
+
+    def state(self, host: str) -> CircuitState:
+        circuit = self._get(host)
+        return CircuitState(circuit.state) if circuit is not None else CircuitState.CLOSED
+
+    @contextmanager
+    def guard(self, host: str) -> Iterator[None]:
+        """Admit one fetch from ``host`` and record how it went."""
+        self._admit(host)
+        try:
+            yield
+        except _HOST_FAILURES:
+            self._record_failure(host)
+            raise
+        except BaseException:
+            # Cancelled or failed for reasons unrelated to the host; let another trial through.
+            self._trials.discard(host)
+            raise
+        self._record_success(host)
+
+    def _admit(self, host: str) -> None:
+        circuit = self._get(host)
+        if circuit is None or circuit.state == CircuitState.CLOSED:
+            return
+        now = datetime.now(UTC)
+        if host in self._trials or (circuit.state == CircuitState.OPEN and circuit.retry_at is not None and now < circuit.retry_at):
+            self._rejected.inc()
+            logger.debug("circuit_rejected", host=host, state=circuit.state)
+            raise CircuitOpenError(host, circuit.retry_at)
+        self._trials.add(host)
+        if circuit.state != CircuitState.HALF_OPEN:
+            self._put(replace(circuit, state=CircuitState.HALF_OPEN, changed_at=now))
+            logger.info("circuit_half_open", host=host)
+
+    def _record_failure(self, host: str) -> None:
+        now = datetime.now(UTC)
+        circuit = self._get(host)
+        failures = circuit.failures + 1 if circuit is not None else 1
+        trial = host in self._trials
+        self._trials.discard(host)
+        if trial or failures >= self._failure_threshold:
+            retry_at = now + self._cooldown
+            self._put(HostCircuit(host=host, state=CircuitState.OPEN, failures=failures, changed_at=now, retry_at=retry_at))
+            logger.warning("circuit_opened", host=host, failures=failures, retry_at=retry_at.isoformat())
+            return
+        self._put(HostCircuit(host=host, state=CircuitState.CLOSED, failures=failures, changed_at=now, retry_at=None))
+
+    def _record_success(self, host: str) -> None:
+        self._trials.discard(host)
+        circuit = self._get(host)
+        if circuit is None:
+            return
+        self._circuits[host] = None
+        if self._store is not None:
+            self._store.delete(host)
+        if circuit.state != CircuitState.CLOSED:
+            logger.info("circuit_closed", host=host)
+
+    def _put(self, circuit: HostCircuit) -> None:
+        self._circuits[circuit.host] = circuit
+        if self._store is not None:
+            self._store.upsert(circuit)
+
+    def _get(self, host: str) -> HostCircuit | None:
+        if host not in self._circuits:
+            self._circuits[host] = self._store.get(host) if self._store is not None else None
+        return self._circuits[host]
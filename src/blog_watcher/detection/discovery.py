@@ -0,0 +1,83 @@
+"""Negative cache for feed and sitemap discovery."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from typing import Protocol
+
+from blog_watcher.observability import get_logger
+from blog_watcher.storage.models import DiscoveryMiss
+
+logger = get_logger(__name__)
+
+
+class DiscoveryKind(StrEnum):
+    FEED = "feed"
+    SITEMAP = "sitemap"
+
+
+class DiscoveryMissStore(Protocol):
+    def get(self, blog_id: str, kind: str) -> DiscoveryMiss | None: ...
+    def upsert(self, miss: DiscoveryMiss) -> None: ...
+    def delete(self, blog_id: str, kind: str) -> bool: ...
+
+
+class DiscoveryBackoff:
+    """Remembers blogs where probing the common feed or sitemap paths found nothing.
+
+    After ``n`` misses in a row the common paths are not probed again for
+    ``base_interval * 2 ** (n - 1)``, capped at ``max_interval``. A hit clears the
+    record. Locations a blog declares itself (``<link rel="alternate">``,
+    ``Sitemap:`` in robots.txt) are always probed; only guessing is backed off.
+    """
+
+    def __init__(
+        self,
+        store: DiscoveryMissStore | None = None,
+        *,
+        base_interval: timedelta = timedelta(hours=1),
+        max_interval: timedelta = timedelta(days=1),
+    ) -> None:
+        if base_interval <= timedelta(0):
+            msg = "base_interval must be positive"
+            raise ValueError(msg)
+        if max_interval < base_interval:
+            msg = "max_interval cannot be shorter than base_interval"
+            raise ValueError(msg)
+        self._store = store
+        self._base_interval = base_interval
+        self._max_interval = max_interval
+        self._misses: dict[tuple[str, DiscoveryKind], DiscoveryMiss | None] = {}
+
+    def should_probe(self, blog_id: str, kind: DiscoveryKind, *, now: datetime | None = None) -> bool:
+        miss = self._get(blog_id, kind)
+        if miss is None or (now or datetime.now(UTC)) >= miss.retry_after:
+            return True
+        logger.debug("discovery_probe_skipped", blog_id=blog_id, kind=kind, retry_after=miss.retry_after.isoformat())
+        return False
+
+    def record_miss(self, blog_id: str, kind: DiscoveryKind, *, now: datetime | None = None) -> DiscoveryMiss:
+        now = now or datetime.now(UTC)
+        previous = self._get(blog_id, kind)
+        misses = previous.misses + 1 if previous is not None else 1
+        interval = min(self._base_interval * 2 ** (misses - 1), self._max_interval)
+        miss = DiscoveryMiss(blog_id=blog_id, kind=kind, misses=misses, last_probed_at=now, retry_after=now + interval)
+        self._misses[blog_id, kind] = miss
+        if self._store is not None:
+            self._store.upsert(miss)
+        logger.info("discovery_missed", blog_id=blog_id, kind=kind, misses=misses, retry_after=miss.retry_after.isoformat())
+        return miss
+
+    def record_hit(self, blog_id: str, kind: DiscoveryKind) -> None:
+        if self._get(blog_id, kind) is None:
+            return
+        self._misses[blog_id, kind] = None
+        if self._store is not None:
+            self._store.delete(blog_id, kind)
+
+    def _get(self, blog_id: str, kind: DiscoveryKind) -> DiscoveryMiss | None:
+        key = (blog_id, kind)
+        if key not in self._misses:
+            self._misses[key] = self._store.get(blog_id, kind) if self._store is not None else None
+        return self._misses[key]
@@ -4,9 +4,12 @@ import json
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from blog_watcher.detection.discovery import DiscoveryBackoff, DiscoveryKind
 from blog_watcher.detection.feed.detector import detect_feed_urls, parse_feed
-from blog_watcher.detection.models import DetectorConfig, is_cache_fresh
+from blog_watcher.detection.models import DetectorConfig, is_cache_fresh, is_same_body
+from blog_watcher.detection.probing import first_in_order
 from blog_watcher.detection.urls.fingerprinter import fingerprint_urls
+from blog_watcher.detection.urls.normalizer import normalize_url
 
 if TYPE_CHECKING:
     from blog_watcher.detection.feed.detector import ParsedFeed
@@ -23,12 +26,14 @@ class FeedDetectionResult:
     ok: bool
     etag: str | None = None
     last_modified: str | None = None
+    body_hash: str | None = None
 
 
 class FeedChangeDetector:
-    def __init__(self, *, fetcher: Fetcher, config: DetectorConfig | None = None) -> None:
+    def __init__(self, *, fetcher: Fetcher, config: DetectorConfig | None = None, discovery: DiscoveryBackoff | None = None) -> None:
         self._fetcher = fetcher
         self._config = config or DetectorConfig()
+        self._discovery = discovery or DiscoveryBackoff()
 
     async def detect(self, fetch_result: FetchResult, base_url: str, previous_state: BlogState | None) -> FeedDetectionResult:
         if previous_state is not None and previous_state.feed_url and is_cache_fresh(previous_state.last_checked_at, self._config.cache_ttl_days):
@@ -36,15 +41,19 @@ class FeedChangeDetector:
             if cached is not None:
                 return cached
 
-        discovery = detect_feed_urls(fetch_result.content, base_url)
+        discovery = detect_feed_urls(fetch_result.text, base_url)
+        blog_id = normalize_url(base_url)
+        guessing = not discovery.discovered
+        if guessing and not self._discovery.should_probe(blog_id, DiscoveryKind.FEED):
+            return self._not_found()
 
-        for feed_url in discovery.candidates:
-            parsed, fetch_result = await self._try_fetch_and_parse(feed_url)
-            if parsed is None:
-                continue
+        found = await first_in_order(discovery.candidates, self._probe_feed, concurrency=self._config.probe_concurrency)
+        if found is not None:
+            feed_url, (parsed, fetch_result) = found
             entry_keys = tuple(entry.id for entry in parsed.entries)
             fingerprint = fingerprint_urls(list(entry_keys))
             changed = self._detect_feed_changes(entry_keys, previous_state)
+            self._discovery.record_hit(blog_id, DiscoveryKind.FEED)
             return FeedDetectionResult(
                 feed_url=feed_url,
                 entry_keys=entry_keys,
@@ -53,8 +62,15 @@ class FeedChangeDetector:
                 ok=True,
                 etag=fetch_result.etag,
                 last_modified=fetch_result.last_modified,
+                body_hash=fetch_result.body_hash,
             )
 
+        if guessing:
+            self._discovery.record_miss(blog_id, DiscoveryKind.FEED)
+        return self._not_found()
+
+    @staticmethod
+    def _not_found() -> FeedDetectionResult:
         return FeedDetectionResult(
             feed_url=None,
             entry_keys=(),
@@ -67,19 +83,18 @@ class FeedChangeDetector:
         etag = previous_state.feed_etag if previous_state else None
         last_modified = previous_state.feed_last_modified if previous_state else None
         fetch_result = await self._fetcher.fetch(feed_url, etag=etag, last_modified=last_modified)
-        if fetch_result.content is None:
-            if not fetch_result.is_modified and previous_state is not None:
-                return FeedDetectionResult(
-                    feed_url=feed_url,
-                    entry_keys=tuple(json.loads(previous_state.recent_entry_keys)) if previous_state.recent_entry_keys else (),
-                    fingerprint=previous_state.url_fingerprint or "",
-                    changed=False,
-                    ok=True,
-                    etag=fetch_result.etag or etag,
-                    last_modified=fetch_result.last_modified or last_modified,
-                )
-            return None
-        parsed = parse_feed(fetch_result.content, feed_url)
+        if previous_state is not None and is_same_body(fetch_result, previous_state.feed_body_hash):
+            return FeedDetectionResult(
+                feed_url=feed_url,
+                entry_keys=tuple(json.loads(previous_state.recent_entry_keys)) if previous_state.recent_entry_keys else (),
+                fingerprint=previous_state.url_fingerprint or "",
+                changed=False,
+                ok=True,
+                etag=fetch_result.etag or etag,
+                last_modified=fetch_result.last_modified or last_modified,
+                body_hash=previous_state.feed_body_hash,
+            )
+        parsed = _parse_body(fetch_result, feed_url)
         if parsed is None:
             return None
         entry_keys = tuple(entry.id for entry in parsed.entries)
@@ -93,13 +108,13 @@ class FeedChangeDetector:
             ok=True,
             etag=fetch_result.etag,
             last_modified=fetch_result.last_modified,
+            body_hash=fetch_result.body_hash,
         )
 
-    async def _try_fetch_and_parse(self, feed_url: str) -> tuple[ParsedFeed | None, FetchResult]:
+    async def _probe_feed(self, feed_url: str) -> tuple[ParsedFeed, FetchResult] | None:
         feed_result = await self._fetcher.fetch(feed_url)
-        if feed_result.content is None:
-            return None, feed_result
-        return parse_feed(feed_result.content, feed_url), feed_result
+        parsed = _parse_body(feed_result, feed_url)
+        return (parsed, feed_result) if parsed is not None else None
 
     def _detect_feed_changes(self, entry_keys: tuple[str, ...], previous_state: BlogState | None) -> bool:
         if not entry_keys or previous_state is None:
@@ -108,3 +123,11 @@ class FeedChangeDetector:
         if previous_state.recent_entry_keys:
             previous_entry_keys = tuple(json.loads(previous_state.recent_entry_keys))
         return entry_keys != previous_entry_keys
+
+
+def _parse_body(fetch_result: FetchResult, feed_url: str) -> ParsedFeed | None:
+    body = fetch_result.open_body()
+    if body is None:
+        return None
+    with body:
+        return parse_feed(body, feed_url, encoding=fetch_result.encoding)
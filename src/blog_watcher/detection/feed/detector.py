@@ -13,6 +13,7 @@ from blog_watcher.detection.urls.html_parser import parse_html
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from typing import IO
 
 
 @dataclass(frozen=True, slots=True)
@@ -76,8 +77,14 @@ def detect_feed_urls(html: str | None, base_url: str) -> FeedUrlDiscovery:
     return FeedUrlDiscovery(discovered=discovered, fallbacks=fallbacks)
 
 
-def parse_feed(content: str, feed_url: str) -> ParsedFeed | None:
-    parsed = feedparser.parse(content or "")
+def parse_feed(content: bytes | str | IO[bytes], feed_url: str, *, encoding: str | None = None) -> ParsedFeed | None:
+    """Parse a feed, preferably from raw bytes or a binary stream so feedparser applies the document's own encoding.
+
+    ``encoding`` is the charset declared in the HTTP ``Content-Type``, which takes
+    precedence over the XML declaration (RFC 7303 section 3.2).
+    """
+    headers = {"content-type": f"application/xml; charset={encoding}"} if encoding else None
+    parsed = feedparser.parse(content or b"", response_headers=headers)
 
     feed_title = getattr(parsed.feed, "title", None) if hasattr(parsed, "feed") else None
     if not feed_title:
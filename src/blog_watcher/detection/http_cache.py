@@ -0,0 +1,183 @@
+"""Private HTTP cache in front of a fetcher, after RFC 9111."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Protocol
+
+from blog_watcher.detection.http_fetcher import FetchResult, hash_body
+from blog_watcher.observability import METRICS, MetricsRegistry, get_logger
+from blog_watcher.storage.models import HttpCacheEntry
+
+if TYPE_CHECKING:
+    from blog_watcher.detection.http_fetcher import Fetcher
+
+logger = get_logger(__name__)
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# How long a URL that answered no-store or was too large to keep bypasses the cache.
+_UNCACHEABLE_TTL = timedelta(hours=1)
+
+
+class HttpCacheStore(Protocol):
+    def get(self, url: str) -> HttpCacheEntry | None: ...
+    def get_body(self, body_hash: str) -> bytes | None: ...
+    def put(self, entry: HttpCacheEntry, body: bytes) -> None: ...
+    def update(self, entry: HttpCacheEntry) -> None: ...
+    def delete(self, url: str) -> bool: ...
+    def evict(self, max_bytes: int) -> int: ...
+
+
+def _weak_etag(etag: str) -> str:
+    return etag.removeprefix("W/")
+
+
+def _validators_match(entry: HttpCacheEntry, etag: str | None, last_modified: str | None) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 section 13.2.2).
+    if etag is not None:
+        return entry.etag is not None and _weak_etag(entry.etag) == _weak_etag(etag)
+    return last_modified is not None and entry.last_modified == last_modified
+
+
+def _is_reusable(result: FetchResult) -> bool:
+    fresh = result.freshness_lifetime is not None and result.freshness_lifetime > timedelta(0)
+    return fresh or result.etag is not None or result.last_modified is not None
+
+
+class CachingFetcher:
+    """Serves fresh responses from ``store`` and revalidates stale ones.
+
+    A stored 200 stays fresh for its ``Cache-Control: max-age``/``Expires`` lifetime;
+    responses without one are stored but revalidated on every use. Callers' own
+    validators are answered locally: a cached response matching them comes back as
+    a 304. URLs not in the cache are fetched unconditionally so the body can be
+    stored, except ones that answered ``no-store`` or were too large to keep within
+    the last hour. Responses that are never fresh and carry neither ``ETag`` nor
+    ``Last-Modified`` are not stored either, as they could never be reused. Stored
+    bodies are kept under ``max_bytes`` by evicting the least recently used entries.
+    """
+
+    def __init__(
+        self, fetcher: Fetcher, store: HttpCacheStore, *, max_bytes: int = _DEFAULT_MAX_BYTES, metrics: MetricsRegistry | None = None
+    ) -> None:
+        if max_bytes <= 0:
+            msg = "max_bytes must be positive"
+            raise ValueError(msg)
+        self._fetcher = fetcher
+        self._store = store
+        self._max_bytes = max_bytes
+        # URL -> time.monotonic() deadline until which it bypasses the cache.
+        self._uncacheable: dict[str, float] = {}
+        registry = metrics or METRICS
+        self._hits = registry.counter("http_cache_hits")
+        self._misses = registry.counter("http_cache_misses")
+        self._revalidations = registry.counter("http_cache_revalidations")
+        self._evictions = registry.counter("http_cache_evictions")
+
+    async def fetch(
+        self,
+        url: str,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> FetchResult:
+        entry = self._store.get(url)
+        body = self._store.get_body(entry.body_hash) if entry is not None else None
+        if entry is None or body is None:
+            self._misses.inc()
+            if self._uncacheable.get(url, 0.0) > time.monotonic():
+                return await self._fetcher.fetch(url, etag=etag, last_modified=last_modified)
+            result = await self._fetcher.fetch(url)
+            stored = self._store_result(url, result)
+            return result if stored is None else self._respond(stored, result.content or b"", etag, last_modified)
+
+        now = datetime.now(UTC)
+        if entry.expires_at > now:
+            self._hits.inc()
+            entry = replace(entry, last_used_at=now)
+            self._store.update(entry)
+            return self._respond(entry, body, etag, last_modified)
+
+        self._revalidations.inc()
+        result = await self._fetcher.fetch(url, etag=entry.etag, last_modified=entry.last_modified)
+        if result.status_code != HTTPStatus.NOT_MODIFIED or result.no_store:
+            stored = self._store_result(url, result)
+            return result if stored is None else self._respond(stored, result.content or b"", etag, last_modified)
+        # A 304 refreshes the stored response's freshness and validators (RFC 9111 section 4.3.4).
+        now = datetime.now(UTC)
+        entry = replace(
+            entry,
+            etag=result.etag or entry.etag,
+            last_modified=result.last_modified or entry.last_modified,
+            stored_at=now,
+            expires_at=now + (result.freshness_lifetime or timedelta(0)),
+            last_used_at=now,
+        )
+        self._store.update(entry)
+        return self._respond(entry, body, etag, last_modified)
+
+    def _store_result(self, url: str, result: FetchResult) -> HttpCacheEntry | None:
+        """Store a cacheable response and return its entry; drop the URL's entry otherwise."""
+        if result.status_code != HTTPStatus.OK or result.content is None or result.no_store or not _is_reusable(result):
+            # Spooled bodies are too large to keep and unvalidated ones could only be refetched in full;
+            # like no-store ones, they are fetched with the caller's validators.
+            if result.status_code == HTTPStatus.OK:
+                self._mark_uncacheable(url)
+            self._store.delete(url)
+            return None
+        self._uncacheable.pop(url, None)
+        now = datetime.now(UTC)
+        entry = HttpCacheEntry(
+            url=url,
+            status=result.status_code,
+            etag=result.etag,
+            last_modified=result.last_modified,
+            body_hash=result.body_hash or hash_body(result.content),
+            stored_at=now,
+            expires_at=now + (result.freshness_lifetime or timedelta(0)),
+            last_used_at=now,
+            encoding=result.encoding,
+        )
+        self._store.put(entry, result.content)
+        evicted = self._store.evict(self._max_bytes)
+        if evicted:
+            self._evictions.inc(evicted)
+            logger.info("http_cache_evicted", entries=evicted, max_bytes=self._max_bytes)
+        return entry
+
+    def _mark_uncacheable(self, url: str) -> None:
+        now = time.monotonic()
+        # Entries share one TTL, so insertion order is expiry order: drop expired ones from the front.
+        while self._uncacheable:
+            oldest = next(iter(self._uncacheable))
+            if self._uncacheable[oldest] > now:
+                break
+            del self._uncacheable[oldest]
+        self._uncacheable.pop(url, None)
+        self._uncacheable[url] = now + _UNCACHEABLE_TTL.total_seconds()
+
+    @staticmethod
+    def _respond(entry: HttpCacheEntry, body: bytes, etag: str | None, last_modified: str | None) -> FetchResult:
+        fresh_for = max(entry.expires_at - datetime.now(UTC), timedelta(0))
+        if _validators_match(entry, etag, last_modified):
+            return FetchResult(
+                status_code=HTTPStatus.NOT_MODIFIED,
+                content=None,
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+                is_modified=False,
+                freshness_lifetime=fresh_for,
+            )
+        return FetchResult(
+            status_code=entry.status,
+            content=body,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+            is_modified=True,
+            freshness_lifetime=fresh_for,
+            body_hash=entry.body_hash,
+            encoding=entry.encoding,
+        )
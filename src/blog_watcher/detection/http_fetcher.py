@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import hashlib
+import importlib.util
+import io
+import tempfile
+import time
+import weakref
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
 from enum import StrEnum
 from http import HTTPStatus
-from typing import Protocol
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, BinaryIO, Protocol
+from urllib.parse import urlsplit
 
 import httpx
 from tenacity import (
@@ -13,25 +25,144 @@ from tenacity import (
     wait_exponential,
 )
 
-from blog_watcher.observability import get_logger
+from blog_watcher.observability import METRICS, MetricsRegistry, get_logger
+
+if TYPE_CHECKING:
+    from blog_watcher.detection.circuit_breaker import HostCircuitBreaker
 
 logger = get_logger(__name__)
 
+_BODY_HASH_SIZE = 32
+_DEFAULT_SPOOL_THRESHOLD = 8 * 1024 * 1024
+# Origins given their own connection counters; the rest share ``<other>`` so the report stays bounded.
+_MAX_TRACKED_ORIGINS = 64
+
 
 class HTTPHeader(StrEnum):
     IF_NONE_MATCH = "If-None-Match"
     IF_MODIFIED_SINCE = "If-Modified-Since"
     ETAG = "ETag"
     LAST_MODIFIED = "Last-Modified"
+    ACCEPT_ENCODING = "Accept-Encoding"
+    CONTENT_ENCODING = "Content-Encoding"
+    CACHE_CONTROL = "Cache-Control"
+    EXPIRES = "Expires"
+    DATE = "Date"
+
+
+def _cache_directives(headers: httpx.Headers) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in headers.get(HTTPHeader.CACHE_CONTROL, "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def freshness_lifetime(headers: httpx.Headers) -> timedelta | None:
+    """How long a response stays fresh per RFC 9111 section 4.2.1, or None when the headers do not say.
+
+    ``no-store`` and ``no-cache`` count as zero; ``max-age`` wins over ``Expires``.
+    """
+    directives = _cache_directives(headers)
+    if "no-store" in directives or "no-cache" in directives:
+        return timedelta(0)
+    max_age = directives.get("max-age")
+    if max_age is not None and max_age.isdigit():
+        return timedelta(seconds=int(max_age))
+    expires = headers.get(HTTPHeader.EXPIRES)
+    date = headers.get(HTTPHeader.DATE)
+    if expires is None or date is None:
+        return None
+    try:
+        lifetime: timedelta = parsedate_to_datetime(expires) - parsedate_to_datetime(date)
+    except (TypeError, ValueError):
+        # An invalid Expires means "already expired".
+        return timedelta(0)
+    return max(lifetime, timedelta(0))
+
+
+def accept_encoding() -> str:
+    """Codings httpx can decode here, best compression first; br and zstd need optional packages."""
+    codings = []
+    if importlib.util.find_spec("zstandard") is not None:
+        codings.append("zstd")
+    if importlib.util.find_spec("brotli") is not None or importlib.util.find_spec("brotlicffi") is not None:
+        codings.append("br")
+    return ", ".join([*codings, "gzip", "deflate"])
+
+
+def hash_body(body: bytes) -> str:
+    """Hex digest of a decoded response body, sized to be stored like a URL fingerprint."""
+    return hashlib.blake2b(body, digest_size=_BODY_HASH_SIZE).hexdigest()
+
+
+class FetchStatusError(Exception):
+    """A page the check depends on answered with an error status."""
+
+    def __init__(self, url: str, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code} for {url}")
+        self.url = url
+        self.status_code = status_code
+
+
+class SpooledBody:
+    """A response body written to a temporary file, removed once nothing refers to it."""
+
+    def __init__(self, path: Path, size: int) -> None:
+        self.path = path
+        self.size = size
+        self._remove = weakref.finalize(self, path.unlink, missing_ok=True)
+
+    def open(self) -> BinaryIO:
+        return self.path.open("rb")
 
 
 @dataclass(frozen=True, slots=True)
 class FetchResult:
     status_code: int
-    content: str | None
+    # Body after Content-Encoding was decoded; XML parsers read the charset from the document itself.
+    content: bytes | None
     etag: str | None
     last_modified: str | None
     is_modified: bool
+    # Body bytes as received and after Content-Encoding was decoded.
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    content_encoding: str | None = None
+    freshness_lifetime: timedelta | None = None
+    # Cache-Control: no-store; the response must not be kept by a cache.
+    no_store: bool = False
+    # hash_body() of the decoded body, so a detector can tell an identical 200 from a new one without parsing it.
+    body_hash: str | None = None
+    # Charset from the Content-Type header, if any.
+    encoding: str | None = None
+    # Set instead of content when the body outgrew the fetcher's spool threshold.
+    spool: SpooledBody | None = None
+
+    @property
+    def has_body(self) -> bool:
+        return self.content is not None or self.spool is not None
+
+    def open_body(self) -> BinaryIO | None:
+        """A fresh stream over the body, reading a spooled one from disk."""
+        if self.spool is not None:
+            return self.spool.open()
+        return io.BytesIO(self.content) if self.content is not None else None
+
+    @property
+    def text(self) -> str | None:
+        """The body decoded with ``encoding``, or UTF-8 when none or an unknown one was declared.
+
+        Decoded on every access, so only HTML and plain-text bodies should need it.
+        """
+        content = self.spool.path.read_bytes() if self.spool is not None else self.content
+        if content is None:
+            return None
+        try:
+            return content.decode(self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return content.decode("utf-8", errors="replace")
 
 
 class Fetcher(Protocol):
@@ -44,9 +175,126 @@ class Fetcher(Protocol):
     ) -> FetchResult: ...
 
 
+@dataclass(slots=True)
+class _Flight:
+    task: asyncio.Task[FetchResult]
+    waiters: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class _Body:
+    content: bytes | None
+    spool: SpooledBody | None
+    size: int
+    digest: str
+
+
+class _BodyBuffer:
+    """Hashes a body as it arrives, moving it from memory to a temporary file past ``threshold`` bytes."""
+
+    def __init__(self, threshold: int | None) -> None:
+        self._threshold = threshold
+        self._digest = hashlib.blake2b(digest_size=_BODY_HASH_SIZE)
+        self._buffer = bytearray()
+        self._size = 0
+        self._file: IO[bytes] | None = None
+
+    def write(self, chunk: bytes) -> None:
+        self._digest.update(chunk)
+        self._size += len(chunk)
+        if self._file is None and self._threshold is not None and self._size > self._threshold:
+            self._file = tempfile.NamedTemporaryFile(prefix="blog-watcher-", suffix=".body", delete=False)  # noqa: SIM115 - handed to SpooledBody
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._buffer += chunk
+
+    def finish(self) -> _Body:
+        if self._file is None:
+            return _Body(content=bytes(self._buffer), spool=None, size=self._size, digest=self._digest.hexdigest())
+        self._file.close()
+        spool = SpooledBody(Path(self._file.name), self._size)
+        return _Body(content=None, spool=spool, size=self._size, digest=self._digest.hexdigest())
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            Path(self._file.name).unlink(missing_ok=True)
+
+
+@dataclass(frozen=True, slots=True)
+class _Memo:
+    expires_at: float
+    result: FetchResult = field(repr=False)
+
+
+class _ConnectionTrace:
+    """httpcore trace hook that counts the connections a request had to open."""
+
+    def __init__(self) -> None:
+        self.opened = 0
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:  # noqa: ARG002 - httpcore trace signature
+        if event_name == "connection.connect_tcp.complete":
+            self.opened += 1
+
+
 class HttpFetcher:
-    def __init__(self, client: httpx.AsyncClient) -> None:
+    """Conditional GETs with retries.
+
+    Requests and newly opened connections are counted per origin in the metrics
+    registry (``http_requests:<origin>``, ``http_connections_opened:<origin>``), so
+    keep-alive and HTTP/2 connection reuse can be checked from the metrics report.
+    Only the first 64 origins seen get their own counters; later ones are counted
+    under ``<other>``.
+
+    Identical requests (same URL and validators) share one GET: callers arriving
+    while it is in flight wait for the same response, and callers within
+    ``memo_ttl`` of its completion get it straight from memory. Blogs that resolve
+    to the same feed, sitemap or robots.txt therefore cost one request per cycle.
+    The shared request is cancelled only when every caller waiting on it is.
+
+    With a ``breaker``, requests to a host whose circuit is open fail at once with
+    ``CircuitOpenError`` instead of spending retries on it.
+
+    Bodies are read as a stream. One larger than ``spool_threshold`` bytes is
+    written to a temporary file as it arrives and returned as ``FetchResult.spool``,
+    so a sitemap near the 50 MB protocol limit never sits in memory whole.
+    ``None`` keeps every body in memory.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        memo_ttl: timedelta = timedelta(seconds=30),
+        breaker: HostCircuitBreaker | None = None,
+        spool_threshold: int | None = _DEFAULT_SPOOL_THRESHOLD,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        if memo_ttl < timedelta(0):
+            msg = "memo_ttl must be non-negative"
+            raise ValueError(msg)
+        if spool_threshold is not None and spool_threshold <= 0:
+            msg = "spool_threshold must be positive"
+            raise ValueError(msg)
         self._client = client
+        self._breaker = breaker
+        self._spool_threshold = spool_threshold
+        self._memo_ttl = memo_ttl.total_seconds()
+        self._flights: dict[tuple[str, str | None, str | None], _Flight] = {}
+        self._memo: dict[tuple[str, str | None, str | None], _Memo] = {}
+        self._metrics = metrics or METRICS
+        self._in_flight = self._metrics.gauge("http_requests_in_flight")
+        self._wire_bytes = self._metrics.counter("http_wire_bytes")
+        self._decoded_bytes = self._metrics.counter("http_decoded_bytes")
+        self._coalesced = self._metrics.counter("http_requests_coalesced")
+        self._memo_hits = self._metrics.counter("http_memo_hits")
+        self._spooled = self._metrics.counter("http_bodies_spooled")
+        self._accept_encoding = accept_encoding()
+        self._tracked_origins: set[str] = set()
 
     async def fetch(
         self,
@@ -55,26 +303,71 @@ class HttpFetcher:
         etag: str | None = None,
         last_modified: str | None = None,
     ) -> FetchResult:
-        headers: dict[str, str] = {}
+        key = (url, etag, last_modified)
+        memo = self._memo.get(key)
+        if memo is not None and memo.expires_at > time.monotonic():
+            self._memo_hits.inc()
+            return memo.result
+
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.create_task(self._fetch(url, etag=etag, last_modified=last_modified)))
+            flight.task.add_done_callback(lambda task: self._land(key, task))
+            self._flights[key] = flight
+        else:
+            self._coalesced.inc()
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller gave up, e.g. a probe that lost to an earlier candidate.
+                self._flights.pop(key, None)
+                flight.task.cancel()
+
+    def _land(self, key: tuple[str, str | None, str | None], task: asyncio.Task[FetchResult]) -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.task is task:
+            del self._flights[key]
+        if task.cancelled() or task.exception() is not None or self._memo_ttl == 0:
+            return
+        now = time.monotonic()
+        # Entries share one TTL, so insertion order is expiry order: drop expired ones from the front.
+        while self._memo:
+            oldest = next(iter(self._memo))
+            if self._memo[oldest].expires_at > now:
+                break
+            del self._memo[oldest]
+        self._memo.pop(key, None)
+        self._memo[key] = _Memo(expires_at=now + self._memo_ttl, result=task.result())
+
+    async def _fetch(self, url: str, *, etag: str | None, last_modified: str | None) -> FetchResult:
+        headers: dict[str, str] = {HTTPHeader.ACCEPT_ENCODING: self._accept_encoding}
         if etag is not None:
             headers[HTTPHeader.IF_NONE_MATCH] = etag
         if last_modified is not None:
             headers[HTTPHeader.IF_MODIFIED_SINCE] = last_modified
 
-        async for attempt in AsyncRetrying(
-            retry=retry_if_exception_type((httpx.TimeoutException, httpx.HTTPStatusError)),
-            wait=wait_exponential(multiplier=1, max=60),
-            stop=stop_after_attempt(3),
-            reraise=True,
-        ):
-            with attempt:
-                response = await self._client.get(url, headers=headers)
-                if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
-                    logger.warning("fetch_rate_limited", url=url)
-                    response.raise_for_status()
-                if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
-                    logger.warning("fetch_server_error", url=url, status_code=response.status_code)
-                    response.raise_for_status()
+        with self._guard(url):
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception_type((httpx.TimeoutException, httpx.HTTPStatusError)),
+                wait=wait_exponential(multiplier=1, max=60),
+                stop=stop_after_attempt(3),
+                reraise=True,
+            ):
+                with attempt:
+                    trace = _ConnectionTrace()
+                    with self._in_flight.track():
+                        async with self._client.stream("GET", url, headers=headers, extensions={"trace": trace}) as response:
+                            self._record_connection_use(response, trace)
+                            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                                logger.warning("fetch_rate_limited", url=url)
+                                response.raise_for_status()
+                            if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                                logger.warning("fetch_server_error", url=url, status_code=response.status_code)
+                                response.raise_for_status()
+                            body = await self._read_body(response)
 
         if response.status_code == HTTPStatus.NOT_MODIFIED:
             logger.info("fetch_not_modified", url=url)
@@ -84,13 +377,68 @@ class HttpFetcher:
                 etag=response.headers.get(HTTPHeader.ETAG),
                 last_modified=response.headers.get(HTTPHeader.LAST_MODIFIED),
                 is_modified=False,
+                freshness_lifetime=freshness_lifetime(response.headers),
+                no_store="no-store" in _cache_directives(response.headers),
             )
 
-        logger.info("fetch_succeeded", url=url, status_code=response.status_code)
+        wire_bytes = response.num_bytes_downloaded
+        decoded_bytes = body.size
+        content_encoding = response.headers.get(HTTPHeader.CONTENT_ENCODING)
+        self._wire_bytes.inc(wire_bytes)
+        self._decoded_bytes.inc(decoded_bytes)
+        logger.info(
+            "fetch_succeeded",
+            url=url,
+            status_code=response.status_code,
+            http_version=response.http_version,
+            content_encoding=content_encoding,
+            wire_bytes=wire_bytes,
+            decoded_bytes=decoded_bytes,
+            spooled=body.spool is not None,
+        )
         return FetchResult(
             status_code=response.status_code,
-            content=response.text,
+            content=body.content,
             etag=response.headers.get(HTTPHeader.ETAG),
             last_modified=response.headers.get(HTTPHeader.LAST_MODIFIED),
             is_modified=True,
+            wire_bytes=wire_bytes,
+            decoded_bytes=decoded_bytes,
+            content_encoding=content_encoding,
+            freshness_lifetime=freshness_lifetime(response.headers),
+            no_store="no-store" in _cache_directives(response.headers),
+            body_hash=body.digest,
+            encoding=response.charset_encoding,
+            spool=body.spool,
         )
+
+    async def _read_body(self, response: httpx.Response) -> _Body:
+        buffer = _BodyBuffer(self._spool_threshold)
+        try:
+            async for chunk in response.aiter_bytes():
+                buffer.write(chunk)
+        except BaseException:
+            buffer.discard()
+            raise
+        body = buffer.finish()
+        if body.spool is not None:
+            self._spooled.inc()
+        return body
+
+    def _guard(self, url: str) -> AbstractContextManager[None]:
+        if self._breaker is None:
+            return nullcontext()
+        parts = urlsplit(url)
+        return self._breaker.guard(f"{parts.scheme}://{parts.netloc}")
+
+    def _record_connection_use(self, response: httpx.Response, trace: _ConnectionTrace) -> None:
+        origin = f"{response.url.scheme}://{response.url.netloc.decode('ascii')}"
+        if origin not in self._tracked_origins:
+            if len(self._tracked_origins) >= _MAX_TRACKED_ORIGINS:
+                origin = "<other>"
+            else:
+                self._tracked_origins.add(origin)
+        self._metrics.counter(f"http_requests:{origin}").inc()
+        self._metrics.counter(f"http_connections_opened:{origin}").inc(trace.opened)
+        if response.http_version == "HTTP/2":
+            self._metrics.counter("http2_requests").inc()
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 from blog_watcher.detection.urls.normalizer import NormalizationConfig
 
+if TYPE_CHECKING:
+    from blog_watcher.detection.http_fetcher import FetchResult
+
 
 def is_cache_fresh(
     last_checked_at: datetime | None,
@@ -18,6 +22,13 @@ def is_cache_fresh(
     return (now - last_checked_at) < timedelta(days=ttl_days)
 
 
+def is_same_body(result: FetchResult, previous_hash: str | None) -> bool:
+    """Whether ``result`` repeats the body last seen: a 304, or a 200 whose body hashes the same."""
+    if not result.is_modified:
+        return True
+    return result.body_hash is not None and result.body_hash == previous_hash
+
+
 @dataclass(frozen=True, slots=True)
 class DetectionResult:
     blog_id: str
@@ -31,6 +42,8 @@ class DetectionResult:
 class DetectorConfig:
     cache_ttl_days: int = 7
     feed_max_entries: int = 20
+    # Discovery candidates probed at once per blog; they all hit the same host.
+    probe_concurrency: int = 3
     extract_selector: str = "a[href]"
     normalize_lowercase_host: bool = True
     normalize_strip_tracking_params: bool = True
@@ -0,0 +1,40 @@
+"""Concurrent probing of ordered discovery candidates."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+
+async def first_in_order[T, R](candidates: Sequence[T], probe: Callable[[T], Awaitable[R | None]], *, concurrency: int) -> tuple[T, R] | None:
+    """Probe up to ``concurrency`` candidates at once and return the first hit in ``candidates`` order.
+
+    A later candidate that answers first only wins once every earlier one has
+    missed (returned None). Probes still running when the winner is known are
+    cancelled. An exception from a probe that is awaited propagates, as it would
+    when probing one candidate after another.
+    """
+    if concurrency <= 0:
+        msg = "concurrency must be positive"
+        raise ValueError(msg)
+    # Semaphore waiters are served in FIFO order, so earlier candidates start first.
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(candidate: T) -> R | None:
+        async with semaphore:
+            return await probe(candidate)
+
+    tasks = [asyncio.create_task(bounded(candidate)) for candidate in candidates]
+    try:
+        for candidate, task in zip(candidates, tasks, strict=True):
+            result = await task
+            if result is not None:
+                return candidate, result
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,108 @@
+"""Host-wide robots.txt lookups, cached in memory and in the database."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Protocol
+from urllib.parse import urlparse
+
+from blog_watcher.observability import get_logger
+from blog_watcher.storage.models import RobotsRecord
+
+if TYPE_CHECKING:
+    from blog_watcher.detection.http_fetcher import Fetcher
+
+logger = get_logger(__name__)
+
+_DIRECTIVE_RE = re.compile(r"^\s*([A-Za-z-]+)\s*:\s*(.*?)\s*$")
+# RFC 9309 section 2.4: a cached robots.txt should not be used for more than 24 hours.
+_MAX_TTL = timedelta(hours=24)
+# Floor for robots.txt served with no-cache or a zero lifetime, so it is not refetched on every check.
+_MIN_TTL = timedelta(minutes=5)
+
+
+@dataclass(frozen=True, slots=True)
+class RobotsRules:
+    sitemaps: tuple[str, ...]
+
+
+def parse_robots(robots_txt: str) -> RobotsRules:
+    """Collect the ``Sitemap:`` lines, which apply regardless of user-agent group."""
+    sitemaps: list[str] = []
+    for line in robots_txt.splitlines():
+        match = _DIRECTIVE_RE.match(line.split("#", 1)[0])
+        if match is None:
+            continue
+        field, value = match.group(1).lower(), match.group(2)
+        if field == "sitemap" and value and value not in sitemaps:
+            sitemaps.append(value)
+    return RobotsRules(sitemaps=tuple(sitemaps))
+
+
+class RobotsStore(Protocol):
+    def get(self, host: str) -> RobotsRecord | None: ...
+    def upsert(self, record: RobotsRecord) -> None: ...
+
+
+class RobotsCache:
+    """robots.txt per host, fetched at most once per TTL and shared by every blog on it.
+
+    The TTL comes from the response's caching headers, falling back to and capped
+    at ``max_ttl`` and never shorter than ``min_ttl``. Records are kept in memory and, with a ``store``, persisted so a
+    restart does not refetch every host. Fetch errors are not cached.
+    """
+
+    def __init__(
+        self,
+        fetcher: Fetcher,
+        store: RobotsStore | None = None,
+        *,
+        min_ttl: timedelta = _MIN_TTL,
+        max_ttl: timedelta = _MAX_TTL,
+    ) -> None:
+        self._fetcher = fetcher
+        self._store = store
+        self._min_ttl = min_ttl
+        self._max_ttl = max_ttl
+        self._records: dict[str, RobotsRecord] = {}
+
+    async def get(self, base_url: str) -> RobotsRecord | None:
+        """Return the robots record for ``base_url``'s host, or None when robots.txt cannot be fetched."""
+        parsed = urlparse(base_url)
+        host = f"{parsed.scheme}://{parsed.netloc}"
+        now = datetime.now(UTC)
+        record = self._records.get(host)
+        if record is None and self._store is not None:
+            record = self._store.get(host)
+        if record is not None and record.expires_at > now:
+            self._records[host] = record
+            return record
+        record = await self._fetch(host, now)
+        if record is not None:
+            self._records[host] = record
+            if self._store is not None:
+                self._store.upsert(record)
+        return record
+
+    async def _fetch(self, host: str, now: datetime) -> RobotsRecord | None:
+        try:
+            result = await self._fetcher.fetch(f"{host}/robots.txt")
+        except Exception:  # noqa: BLE001
+            logger.debug("robots_fetch_failed", host=host)
+            return None
+        # Anything but a successful fetch means no sitemaps (RFC 9309 section 2.3.1).
+        ok = result.status_code < HTTPStatus.BAD_REQUEST and result.has_body
+        rules = parse_robots(result.text or "") if ok else RobotsRules(sitemaps=())
+        lifetime = result.freshness_lifetime
+        ttl = self._max_ttl if lifetime is None else max(min(lifetime, self._max_ttl), self._min_ttl)
+        logger.info("robots_fetched", host=host, status_code=result.status_code, sitemaps=len(rules.sitemaps), ttl_seconds=ttl.total_seconds())
+        return RobotsRecord(
+            host=host,
+            status=result.status_code,
+            sitemaps=rules.sitemaps,
+            fetched_at=now,
+            expires_at=now + ttl,
+        )
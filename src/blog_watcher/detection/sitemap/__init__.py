@@ -1,10 +1,12 @@
-from blog_watcher.detection.sitemap.change_detector import SitemapChangeDetector, SitemapDetectionResult
-from blog_watcher.detection.sitemap.detector import ParsedSitemap, detect_sitemap_urls, parse_sitemap
+from blog_watcher.detection.sitemap.change_detector import SitemapChangeDetector, SitemapChildCache, SitemapDetectionResult
+from blog_watcher.detection.sitemap.detector import ParsedSitemap, detect_sitemap_urls, parse_sitemap, sitemap_candidates
 
 __all__ = [
     "ParsedSitemap",
     "SitemapChangeDetector",
+    "SitemapChildCache",
     "SitemapDetectionResult",
     "detect_sitemap_urls",
     "parse_sitemap",
+    "sitemap_candidates",
 ]
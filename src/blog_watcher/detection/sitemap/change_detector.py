@@ -2,16 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
-from urllib.parse import urlparse
 
-from blog_watcher.detection.models import is_cache_fresh
+from blog_watcher.detection.discovery import DiscoveryBackoff, DiscoveryKind
+from blog_watcher.detection.models import is_cache_fresh, is_same_body
+from blog_watcher.detection.probing import first_in_order
+from blog_watcher.detection.robots import RobotsCache
 from blog_watcher.detection.sitemap.detector import (
     ParsedSitemap,
-    detect_sitemap_urls,
     parse_sitemap,
+    sitemap_candidates,
 )
 from blog_watcher.detection.urls.fingerprinter import fingerprint_urls
-from blog_watcher.detection.urls.normalizer import normalize_urls
+from blog_watcher.detection.urls.normalizer import normalize_url, normalize_urls
 from blog_watcher.observability import get_logger
 
 logger = get_logger(__name__)
@@ -30,12 +32,56 @@ class SitemapDetectionResult:
     ok: bool
     etag: str | None = None
     last_modified: str | None = None
+    body_hash: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _ChildSitemap:
+    body_hash: str
+    page_urls: tuple[str, ...]
+
+
+class SitemapChildCache:
+    """Body hash and page URLs of the child sitemaps behind an index, kept in memory across checks.
+
+    A child whose body hashes the same as last time reuses its page URLs instead
+    of being parsed again. Only the ``max_entries`` most recently seen children
+    are kept.
+    """
+
+    def __init__(self, *, max_entries: int = 256) -> None:
+        if max_entries <= 0:
+            msg = "max_entries must be positive"
+            raise ValueError(msg)
+        self._max_entries = max_entries
+        self._children: dict[str, _ChildSitemap] = {}
+
+    def get(self, url: str) -> _ChildSitemap | None:
+        return self._children.get(url)
+
+    def put(self, url: str, body_hash: str, page_urls: tuple[str, ...]) -> None:
+        # Insertion order is recency order, so the least recently seen child is pruned first.
+        self._children.pop(url, None)
+        self._children[url] = _ChildSitemap(body_hash=body_hash, page_urls=page_urls)
+        while len(self._children) > self._max_entries:
+            del self._children[next(iter(self._children))]
 
 
 class SitemapChangeDetector:
-    def __init__(self, *, fetcher: Fetcher, config: DetectorConfig) -> None:
+    def __init__(
+        self,
+        *,
+        fetcher: Fetcher,
+        config: DetectorConfig,
+        robots: RobotsCache | None = None,
+        discovery: DiscoveryBackoff | None = None,
+        children: SitemapChildCache | None = None,
+    ) -> None:
         self._fetcher = fetcher
         self._config = config
+        self._robots = robots or RobotsCache(fetcher)
+        self._discovery = discovery or DiscoveryBackoff()
+        self._children = children or SitemapChildCache()
 
     async def detect(self, base_url: str, previous_state: BlogState | None) -> SitemapDetectionResult:
         if previous_state is not None and previous_state.sitemap_url and is_cache_fresh(previous_state.last_checked_at, self._config.cache_ttl_days):
@@ -43,9 +89,13 @@ class SitemapChangeDetector:
             if cached is not None:
                 return cached
 
+        blog_id = normalize_url(base_url)
         try:
-            robots_txt = await self._fetch_robots_txt(base_url)
-            candidates = detect_sitemap_urls(robots_txt, base_url)
+            robots = await self._robots.get(base_url)
+            declared = robots.sitemaps if robots is not None else ()
+            if not declared and not self._discovery.should_probe(blog_id, DiscoveryKind.SITEMAP):
+                return SitemapDetectionResult(sitemap_url=None, fingerprint=None, changed=False, ok=False)
+            candidates = sitemap_candidates(declared, base_url)
             sitemap_url, all_page_urls = await self._probe_sitemap_candidates(candidates)
         except Exception:  # noqa: BLE001
             return SitemapDetectionResult(
@@ -56,6 +106,8 @@ class SitemapChangeDetector:
             )
 
         if not all_page_urls:
+            if not declared:
+                self._discovery.record_miss(blog_id, DiscoveryKind.SITEMAP)
             return SitemapDetectionResult(
                 sitemap_url=None,
                 fingerprint=None,
@@ -63,6 +115,7 @@ class SitemapChangeDetector:
                 ok=False,
             )
 
+        self._discovery.record_hit(blog_id, DiscoveryKind.SITEMAP)
         norm_config = self._config.to_normalization_config()
         normalized = normalize_urls(all_page_urls, config=norm_config)
         fingerprint = fingerprint_urls(normalized)
@@ -81,17 +134,19 @@ class SitemapChangeDetector:
     async def _try_cached_sitemap(self, sitemap_url: str, previous_state: BlogState | None) -> SitemapDetectionResult | None:
         etag = previous_state.sitemap_etag if previous_state else None
         last_modified = previous_state.sitemap_last_modified if previous_state else None
-        parsed, fetch_result = await self._fetch_and_parse_sitemap(sitemap_url, etag=etag, last_modified=last_modified)
+        previous_hash = previous_state.sitemap_body_hash if previous_state else None
+        parsed, fetch_result = await self._fetch_and_parse_sitemap(sitemap_url, etag=etag, last_modified=last_modified, previous_hash=previous_hash)
+        if fetch_result is not None and previous_state is not None and is_same_body(fetch_result, previous_hash):
+            return SitemapDetectionResult(
+                sitemap_url=sitemap_url,
+                fingerprint=previous_state.url_fingerprint,
+                changed=False,
+                ok=True,
+                etag=fetch_result.etag or etag,
+                last_modified=fetch_result.last_modified or last_modified,
+                body_hash=previous_hash,
+            )
         if parsed is None:
-            if fetch_result is not None and not fetch_result.is_modified and previous_state is not None:
-                return SitemapDetectionResult(
-                    sitemap_url=sitemap_url,
-                    fingerprint=previous_state.url_fingerprint,
-                    changed=False,
-                    ok=True,
-                    etag=fetch_result.etag or etag,
-                    last_modified=fetch_result.last_modified or last_modified,
-                )
             return None
 
         page_urls: list[str] = []
@@ -111,30 +166,34 @@ class SitemapChangeDetector:
         if previous_state is not None and previous_state.url_fingerprint:
             changed = previous_state.url_fingerprint != fingerprint
 
+        if parsed.is_index or fetch_result is None:
+            # An unchanged index says nothing about its children, so it is never short-circuited:
+            # every check re-reads it and fetches each child, which the HTTP cache revalidates
+            # and the child cache spares from parsing when its body is unchanged.
+            return SitemapDetectionResult(sitemap_url=sitemap_url, fingerprint=fingerprint, changed=changed, ok=True)
         return SitemapDetectionResult(
             sitemap_url=sitemap_url,
             fingerprint=fingerprint,
             changed=changed,
             ok=True,
-            etag=fetch_result.etag if fetch_result else None,
-            last_modified=fetch_result.last_modified if fetch_result else None,
+            etag=fetch_result.etag,
+            last_modified=fetch_result.last_modified,
+            body_hash=fetch_result.body_hash,
         )
 
     async def _probe_sitemap_candidates(self, candidates: list[str]) -> tuple[str | None, list[str]]:
-        """Fetch and parse sitemap candidates, returning the first valid one."""
-        for candidate in candidates:
-            parsed, _fetch_result = await self._fetch_and_parse_sitemap(candidate)
-            if parsed is None:
-                continue
-
-            page_urls: list[str] = []
-            if parsed.is_index:
-                page_urls = await self._resolve_sitemap_index(parsed)
-            else:
-                page_urls = list(parsed.page_urls)
+        """Fetch and parse sitemap candidates concurrently, returning the first valid one in order."""
+        found = await first_in_order(candidates, self._probe_sitemap, concurrency=self._config.probe_concurrency)
+        if found is None:
+            return None, []
+        candidate, parsed = found
+        if parsed.is_index:
+            return candidate, await self._resolve_sitemap_index(parsed)
+        return candidate, list(parsed.page_urls)
 
-            return candidate, page_urls
-        return None, []
+    async def _probe_sitemap(self, url: str) -> ParsedSitemap | None:
+        parsed, _fetch_result = await self._fetch_and_parse_sitemap(url)
+        return parsed
 
     async def _fetch_and_parse_sitemap(
         self,
@@ -142,31 +201,33 @@ class SitemapChangeDetector:
         *,
         etag: str | None = None,
         last_modified: str | None = None,
+        previous_hash: str | None = None,
     ) -> tuple[ParsedSitemap | None, FetchResult | None]:
-        """Fetch a single sitemap URL and parse it."""
+        """Fetch a single sitemap URL and parse it, unless its body hashes to ``previous_hash``."""
         try:
             result = await self._fetcher.fetch(url, etag=etag, last_modified=last_modified)
         except Exception:  # noqa: BLE001
             logger.debug("sitemap_fetch_failed", url=url)
             return None, None
-        if result.content is None:
+        body = None if is_same_body(result, previous_hash) else result.open_body()
+        if body is None:
             return None, result
-        return parse_sitemap(result.content, url), result
+        with body:
+            return parse_sitemap(body, url), result
 
     async def _resolve_sitemap_index(self, index: ParsedSitemap) -> list[str]:
-        """Fetch child sitemaps from an index and collect page URLs."""
+        """Fetch child sitemaps from an index and collect page URLs, parsing only children whose body changed."""
         page_urls: list[str] = []
         for child_url in index.page_urls:
-            child_parsed, _child_fetch = await self._fetch_and_parse_sitemap(child_url)
+            previous = self._children.get(child_url)
+            previous_hash = previous.body_hash if previous is not None else None
+            child_parsed, child_fetch = await self._fetch_and_parse_sitemap(child_url, previous_hash=previous_hash)
+            if previous is not None and child_fetch is not None and is_same_body(child_fetch, previous_hash):
+                logger.debug("sitemap_child_unchanged", url=child_url)
+                page_urls.extend(previous.page_urls)
+                continue
             if child_parsed is not None and not child_parsed.is_index:
                 page_urls.extend(child_parsed.page_urls)
+                if child_fetch is not None and child_fetch.body_hash is not None:
+                    self._children.put(child_url, child_fetch.body_hash, child_parsed.page_urls)
         return page_urls
-
-    async def _fetch_robots_txt(self, base_url: str) -> str | None:
-        parsed = urlparse(base_url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-        try:
-            result = await self._fetcher.fetch(robots_url)
-        except Exception:  # noqa: BLE001
-            return None
-        return result.content
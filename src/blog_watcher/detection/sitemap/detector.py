@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
@@ -10,8 +11,10 @@ from urllib.parse import urlparse
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from typing import IO
 
 _SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+_CHILD_TAGS = {"urlset": "url", "sitemapindex": "sitemap"}
 _SITEMAP_DIRECTIVE_RE = re.compile(r"^Sitemap:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
 
 
@@ -32,6 +35,12 @@ def detect_sitemap_urls(robots_txt: str | None, base_url: str) -> list[str]:
             if url:
                 urls.append(url)
 
+    return sitemap_candidates(urls, base_url)
+
+
+def sitemap_candidates(declared: Iterable[str], base_url: str) -> list[str]:
+    """Sitemaps declared in robots.txt, or the common paths when it declares none."""
+    urls = list(declared)
     if urls:
         return _dedupe(urls)
 
@@ -50,50 +59,55 @@ def detect_sitemap_urls(robots_txt: str | None, base_url: str) -> list[str]:
     return _dedupe(candidates)
 
 
-def parse_sitemap(content: str, sitemap_url: str) -> ParsedSitemap | None:
-    """Parse a sitemap XML document, returning page URLs or child sitemap URLs."""
+def parse_sitemap(content: bytes | str | IO[bytes], sitemap_url: str) -> ParsedSitemap | None:
+    """Parse a sitemap XML document, returning page URLs or child sitemap URLs.
+
+    The document is parsed incrementally and each ``<url>``/``<sitemap>`` is dropped
+    once its ``<loc>`` is read, so only the URLs stay in memory. Pass raw bytes or a
+    binary stream: the parser decodes them per the XML declaration.
+    """
+    source: IO[bytes] | IO[str]
+    if isinstance(content, bytes):
+        source = io.BytesIO(content)
+    elif isinstance(content, str):
+        source = io.StringIO(content)
+    else:
+        source = content
     try:
-        root = ET.fromstring(content)  # noqa: S314
+        return _parse_locs(source, sitemap_url)
     except ET.ParseError:
         return None
 
-    tag = _strip_ns(root.tag)
-
-    if tag == "urlset":
-        locs = _find_locs(root, "url")
-        if not locs:
-            return None
-        return ParsedSitemap(url=sitemap_url, page_urls=tuple(locs), is_index=False)
-
-    if tag == "sitemapindex":
-        locs = _find_locs(root, "sitemap")
-        if not locs:
-            return None
-        return ParsedSitemap(url=sitemap_url, page_urls=tuple(locs), is_index=True)
-
-    return None
-
 
-def _find_locs(root: ET.Element, child_tag: str) -> list[str]:
-    """Find <loc> elements inside child elements, trying with and without namespace."""
-    locs: list[str] = []
-
-    # Try with namespace first
-    for elem in root.findall(f"{{{_SITEMAP_NS}}}{child_tag}"):
-        loc = elem.findtext(f"{{{_SITEMAP_NS}}}loc")
-        if loc and loc.strip():
-            locs.append(loc.strip())
-
-    if locs:
-        return locs
+def _parse_locs(source: IO[bytes] | IO[str], sitemap_url: str) -> ParsedSitemap | None:
+    events = ET.iterparse(source, events=("start", "end"))  # noqa: S314
+    _, root = next(events)
+    child_tag = _CHILD_TAGS.get(_strip_ns(root.tag))
+    if child_tag is None:
+        return None
+    depth = 1
+    # Children in the sitemap namespace win; un-namespaced ones are only used when there are none.
+    namespaced: list[str] = []
+    plain: list[str] = []
+    for event, elem in events:
+        depth += 1 if event == "start" else -1
+        if event != "end" or depth != 1:
+            continue
+        if elem.tag == f"{{{_SITEMAP_NS}}}{child_tag}":
+            _append_loc(namespaced, elem.findtext(f"{{{_SITEMAP_NS}}}loc"))
+        elif elem.tag == child_tag:
+            _append_loc(plain, elem.findtext("loc"))
+        root.clear()
+
+    locs = namespaced or plain
+    if not locs:
+        return None
+    return ParsedSitemap(url=sitemap_url, page_urls=tuple(locs), is_index=child_tag == "sitemap")
 
-    # Retry without namespace
-    for elem in root.findall(child_tag):
-        loc = elem.findtext("loc")
-        if loc and loc.strip():
-            locs.append(loc.strip())
 
-    return locs
+def _append_loc(locs: list[str], loc: str | None) -> None:
+    if loc and loc.strip():
+        locs.append(loc.strip())
 
 
 def _strip_ns(tag: str) -> str:
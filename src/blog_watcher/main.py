@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from datetime import timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
 
@@ -10,16 +12,44 @@ import httpx
 import typer
 
 from blog_watcher.config import ConfigError, FileConfigProvider, load_config
-from blog_watcher.core import BlogWatcher, WatcherScheduler
+from blog_watcher.core import (
+    AdaptivePolling,
+    BackfillScheduler,
+    BlogWatcher,
+    ErrorBackoff,
+    PollingPolicy,
+    QueueScheduler,
+    RetentionScheduler,
+    WatcherScheduler,
+)
 from blog_watcher.detection.change_detector import ChangeDetector
-from blog_watcher.detection.http_fetcher import HttpFetcher
+from blog_watcher.detection.circuit_breaker import HostCircuitBreaker
+from blog_watcher.detection.discovery import DiscoveryBackoff
+from blog_watcher.detection.http_cache import CachingFetcher
+from blog_watcher.detection.http_fetcher import Fetcher, HttpFetcher
+from blog_watcher.detection.robots import RobotsCache
 from blog_watcher.notification import SlackNotifier
 from blog_watcher.observability import configure_logging, get_logger
-from blog_watcher.storage import BlogStateRepository, CheckHistoryRepository, Database
+from blog_watcher.storage import (
+    BlogStateRepository,
+    CheckHistoryRepository,
+    Database,
+    DiscoveryMissRepository,
+    ExportFormat,
+    HistoryRetention,
+    HostCircuitRepository,
+    HttpCacheRepository,
+    RetentionPolicy,
+    RobotsCacheRepository,
+    SchemaBackfill,
+    export_database,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+    from blog_watcher.config import HttpConfig, RetentionConfig, SchedulerConfig
+
 logger = get_logger(__name__)
 
 app = typer.Typer(add_completion=False)
@@ -31,7 +61,55 @@ class ApplicationComponents:
     db: Database
     client: httpx.AsyncClient
     watcher: BlogWatcher
-    scheduler: WatcherScheduler
+    scheduler: WatcherScheduler | QueueScheduler
+    retention_scheduler: RetentionScheduler
+    backfill_scheduler: BackfillScheduler
+
+
+def _build_retention_policy(config: RetentionConfig) -> RetentionPolicy:
+    return RetentionPolicy(
+        raw_retention=timedelta(days=config.raw_days),
+        hourly_retention=timedelta(days=config.hourly_days),
+        daily_retention=timedelta(days=config.daily_days) if config.daily_days is not None else None,
+        batch_size=config.batch_size,
+        vacuum_pages=config.vacuum_pages,
+    )
+
+
+def _build_error_backoff(config: SchedulerConfig) -> ErrorBackoff:
+    base = timedelta(seconds=config.interval_seconds)
+    return ErrorBackoff(base=base, max_interval=max(base, timedelta(seconds=config.max_interval_seconds)))
+
+
+def _build_polling_policy(config: SchedulerConfig) -> PollingPolicy:
+    return PollingPolicy(
+        min_interval=timedelta(seconds=config.min_interval_seconds),
+        max_interval=timedelta(seconds=config.max_interval_seconds),
+        backoff_factor=config.backoff_factor,
+        change_fraction=config.change_fraction,
+        jitter=config.jitter,
+    )
+
+
+def _build_http_client(config: HttpConfig) -> httpx.AsyncClient:
+    http2 = config.http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("http2_unavailable", hint="install blog-watcher[http2] to enable HTTP/2")
+        http2 = False
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            connect=config.connect_timeout_seconds,
+            read=config.read_timeout_seconds,
+            write=config.write_timeout_seconds,
+            pool=config.pool_timeout_seconds,
+        ),
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry_seconds,
+        ),
+        http2=http2,
+    )
 
 
 @asynccontextmanager
@@ -42,12 +120,33 @@ async def create_application(config_path: Path, db_path: Path) -> AsyncIterator[
     db = Database(db_path)
     db.initialize()
 
-    state_repo = BlogStateRepository(db)
-    history_repo = CheckHistoryRepository(db)
-
-    client = httpx.AsyncClient(timeout=httpx.Timeout(10.0))
-    fetcher = HttpFetcher(client)
-    detector = ChangeDetector(fetcher=fetcher, state_repo=state_repo)
+    compact = config.storage.compact_unchanged_checks
+    state_repo = BlogStateRepository(db, skip_unchanged_writes=compact)
+    history_repo = CheckHistoryRepository(db, compact_unchanged=compact)
+
+    # One pool for feeds and Slack, so keep-alive connections are reused across checks.
+    client = _build_http_client(config.http)
+    breaker = None
+    if config.http.breaker_failure_threshold > 0:
+        breaker = HostCircuitBreaker(
+            HostCircuitRepository(db),
+            failure_threshold=config.http.breaker_failure_threshold,
+            cooldown=timedelta(seconds=config.http.breaker_cooldown_seconds),
+        )
+    fetcher: Fetcher = HttpFetcher(
+        client,
+        memo_ttl=timedelta(seconds=config.http.memo_ttl_seconds),
+        breaker=breaker,
+        spool_threshold=config.http.spool_threshold_megabytes * 1024 * 1024 or None,
+    )
+    if config.http.cache_max_megabytes > 0:
+        fetcher = CachingFetcher(fetcher, HttpCacheRepository(db), max_bytes=config.http.cache_max_megabytes * 1024 * 1024)
+    detector = ChangeDetector(
+        fetcher=fetcher,
+        state_repo=state_repo,
+        robots=RobotsCache(fetcher, RobotsCacheRepository(db)),
+        discovery=DiscoveryBackoff(DiscoveryMissRepository(db)),
+    )
     notifier = SlackNotifier(client=client, config=config.slack)
     watcher = BlogWatcher(
         config_provider=config_provider,
@@ -55,8 +154,24 @@ async def create_application(config_path: Path, db_path: Path) -> AsyncIterator[
         notifier=notifier,
         state_repo=state_repo,
         history_repo=history_repo,
+        polling=AdaptivePolling(_build_polling_policy(config.scheduler), history_repo) if config.scheduler.adaptive else None,
+        check_timeout=timedelta(seconds=config.scheduler.check_timeout_seconds) if config.scheduler.check_timeout_seconds is not None else None,
+        cycle_deadline=timedelta(seconds=config.scheduler.cycle_deadline_seconds or config.scheduler.interval_seconds),
+        error_backoff=_build_error_backoff(config.scheduler),
     )
-    scheduler = WatcherScheduler(interval_seconds=60, watcher=watcher)
+    scheduler: WatcherScheduler | QueueScheduler
+    if config.scheduler.mode in {"queue", "spread"}:
+        scheduler = QueueScheduler(
+            interval_seconds=config.scheduler.interval_seconds,
+            watcher=watcher,
+            workers=config.scheduler.workers,
+            spread=config.scheduler.mode == "spread",
+        )
+    else:
+        scheduler = WatcherScheduler(interval_seconds=config.scheduler.interval_seconds, watcher=watcher)
+    retention = HistoryRetention(db, _build_retention_policy(config.retention))
+    retention_scheduler = RetentionScheduler(interval_seconds=config.retention.interval_minutes * 60, retention=retention)
+    backfill_scheduler = BackfillScheduler(SchemaBackfill(db, batch_size=config.storage.backfill_batch_size))
 
     try:
         yield ApplicationComponents(
@@ -65,18 +180,27 @@ async def create_application(config_path: Path, db_path: Path) -> AsyncIterator[
             client=client,
             watcher=watcher,
             scheduler=scheduler,
+            retention_scheduler=retention_scheduler,
+            backfill_scheduler=backfill_scheduler,
         )
     finally:
         await client.aclose()
         db.close()
 
 
-@app.command()
+@app.callback(invoke_without_command=True)
 def run(
-    config: Annotated[Path, typer.Option("-c", "--config")],
+    ctx: typer.Context,
+    config: Annotated[Path | None, typer.Option("-c", "--config")] = None,
     once: Annotated[bool | None, typer.Option("--once", is_flag=True)] = None,
     db_path: Annotated[Path, typer.Option("--db-path")] = Path("blog_states.sqlite"),
 ) -> None:
+    """Watch the configured blogs (the default when no command is given)."""
+    if ctx.invoked_subcommand is not None:
+        return
+    if config is None:
+        msg = "Missing option."
+        raise typer.BadParameter(msg, param_hint="'-c' / '--config'")
     configure_logging()
     try:
         if once:
@@ -88,18 +212,40 @@ def run(
         raise typer.Exit(code=1) from exc
 
 
+@app.command()
+def export(
+    destination: Annotated[Path, typer.Argument(help="Snapshot file for sqlite, otherwise a directory.")],
+    db_path: Annotated[Path, typer.Option("--db-path")] = Path("blog_states.sqlite"),
+    export_format: Annotated[ExportFormat, typer.Option("--format")] = ExportFormat.SQLITE,
+    chunk_size: Annotated[int, typer.Option("--chunk-size", min=1)] = 1000,
+) -> None:
+    """Write a consistent snapshot of the database without blocking a running watcher."""
+    configure_logging()
+    try:
+        written = export_database(db_path, destination, export_format, chunk_size=chunk_size)
+    except (FileExistsError, FileNotFoundError) as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=1) from exc
+    logger.info("export_completed", format=str(export_format), paths=[str(path) for path in written])
+
+
 async def _run_once(config_path: Path, db_path: Path) -> None:
     async with create_application(config_path, db_path) as app_state:
         await app_state.watcher.check_all()
+        await app_state.backfill_scheduler.run_once()
 
 
 async def _run_scheduler(config_path: Path, db_path: Path) -> None:
     async with create_application(config_path, db_path) as app_state:
         await app_state.scheduler.start()
-        logger.info("scheduler_started", interval_seconds=60)
+        await app_state.retention_scheduler.start()
+        await app_state.backfill_scheduler.start()
+        logger.info("scheduler_started", interval_seconds=app_state.scheduler.interval_seconds)
         try:
             await asyncio.Event().wait()
         finally:
+            await app_state.backfill_scheduler.shutdown()
+            await app_state.retention_scheduler.shutdown()
             await app_state.scheduler.shutdown()
 
 
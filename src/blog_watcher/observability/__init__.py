@@ -1,3 +1,4 @@
 from .logging import configure_logging, get_logger
+from .metrics import METRICS, Counter, Gauge, MetricsRegistry
 
-__all__ = ["configure_logging", "get_logger"]
+__all__ = ["METRICS", "Counter", "Gauge", "MetricsRegistry", "configure_logging", "get_logger"]
@@ -0,0 +1,76 @@
+"""In-process counters and gauges, reported through the structured log."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = get_logger(__name__)
+
+
+class Counter:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class Gauge:
+    """Current value plus the peak reached since the last report."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.value = 0
+        self.peak = 0
+
+    def inc(self) -> None:
+        self.value += 1
+        self.peak = max(self.peak, self.value)
+
+    def dec(self) -> None:
+        self.value -= 1
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._counters: dict[str, Counter] = {}
+        self._gauges: dict[str, Gauge] = {}
+
+    def counter(self, name: str) -> Counter:
+        return self._counters.setdefault(name, Counter(name))
+
+    def gauge(self, name: str) -> Gauge:
+        return self._gauges.setdefault(name, Gauge(name))
+
+    def snapshot(self) -> dict[str, int]:
+        values = {name: counter.value for name, counter in self._counters.items()}
+        for name, gauge in self._gauges.items():
+            values[name] = gauge.value
+            values[f"{name}_peak"] = gauge.peak
+        return dict(sorted(values.items()))
+
+    def report(self) -> dict[str, int]:
+        """Log a snapshot and start a new peak window for every gauge."""
+        values = self.snapshot()
+        logger.info("metrics_reported", **values)
+        for gauge in self._gauges.values():
+            gauge.peak = gauge.value
+        return values
+
+
+METRICS = MetricsRegistry()
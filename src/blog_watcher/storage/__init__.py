@@ -1,11 +1,39 @@
 from .database import Database
-from .models import BlogState, CheckHistory
-from .repository import BlogStateRepository, CheckHistoryRepository
+from .export import ExportFormat, export_database
+from .migrations import SchemaBackfill
+from .models import BlogState, CheckHistory, CheckRollup, DiscoveryMiss, HistoryCursor, HistoryPage, HostCircuit, HttpCacheEntry, RobotsRecord
+from .repository import (
+    BlogStateRepository,
+    CheckHistoryRepository,
+    CheckRollupRepository,
+    DiscoveryMissRepository,
+    HostCircuitRepository,
+    HttpCacheRepository,
+    RobotsCacheRepository,
+)
+from .retention import HistoryRetention, RetentionPolicy
 
 __all__ = [
     "BlogState",
     "BlogStateRepository",
     "CheckHistory",
     "CheckHistoryRepository",
+    "CheckRollup",
+    "CheckRollupRepository",
     "Database",
+    "DiscoveryMiss",
+    "DiscoveryMissRepository",
+    "ExportFormat",
+    "HistoryCursor",
+    "HistoryPage",
+    "HistoryRetention",
+    "HostCircuit",
+    "HostCircuitRepository",
+    "HttpCacheEntry",
+    "HttpCacheRepository",
+    "RetentionPolicy",
+    "RobotsCacheRepository",
+    "RobotsRecord",
+    "SchemaBackfill",
+    "export_database",
 ]
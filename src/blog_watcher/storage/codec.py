@@ -0,0 +1,33 @@
+"""Column encodings shared by the repositories and schema migrations."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MILLISECOND = timedelta(milliseconds=1)
+_SHA256_HEX_LENGTH = 64
+
+
+def encode_timestamp(value: datetime) -> int:
+    return (value - _EPOCH) // _MILLISECOND
+
+
+def decode_timestamp(value: int) -> datetime:
+    return _EPOCH + value * _MILLISECOND
+
+
+def encode_fingerprint(value: str) -> bytes | str:
+    # 256-bit hex digests (SHA-256 fingerprints, BLAKE2b body hashes) are stored as 32 raw bytes; anything else is kept verbatim.
+    if len(value) == _SHA256_HEX_LENGTH:
+        try:
+            return bytes.fromhex(value)
+        except ValueError:
+            return value
+    return value
+
+
+def decode_fingerprint(value: bytes | str) -> str:
+    if isinstance(value, bytes):
+        return value.hex()
+    return value
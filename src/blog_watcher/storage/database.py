@@ -1,30 +1,37 @@
 from __future__ import annotations
 
 import sqlite3
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
-from .sql import SCHEMA_SQL
+from .migrations import apply_migrations
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
     from pathlib import Path
 
+# Every query the repositories issue fits, so sqlite3 never re-prepares one (default is 128).
+_STATEMENT_CACHE_SIZE = 512
+
 
 class Database:
     def __init__(self, path: Path) -> None:
         self._path = path
         self._connection: sqlite3.Connection | None = None
+        self._in_transaction = False
 
     def connect(self) -> sqlite3.Connection:
         if self._connection is None:
-            self._connection = sqlite3.connect(self._path)
-            self._connection.row_factory = sqlite3.Row
+            # Rows stay plain tuples; repositories read columns by position.
+            self._connection = sqlite3.connect(self._path, cached_statements=_STATEMENT_CACHE_SIZE)
         return self._connection
 
     def initialize(self) -> None:
         connection = self.connect()
-        connection.executescript(SCHEMA_SQL)
-        connection.commit()
+        # Only takes effect on a fresh database; lets retention reclaim pages
+        # with PRAGMA incremental_vacuum instead of a full VACUUM.
+        connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        apply_migrations(connection)
 
     def execute(
         self,
@@ -33,9 +40,35 @@ class Database:
     ) -> sqlite3.Cursor:
         connection = self.connect()
         cursor = connection.execute(query, params or ())
-        connection.commit()
+        if not self._in_transaction and connection.in_transaction:
+            connection.commit()
+        return cursor
+
+    def executemany(self, query: str, params: Iterable[Sequence[object]]) -> sqlite3.Cursor:
+        connection = self.connect()
+        cursor = connection.executemany(query, params)
+        if not self._in_transaction and connection.in_transaction:
+            connection.commit()
         return cursor
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several ``execute`` calls into a single commit."""
+        if self._in_transaction:
+            yield
+            return
+        connection = self.connect()
+        self._in_transaction = True
+        try:
+            yield
+        except BaseException:
+            connection.rollback()
+            raise
+        else:
+            connection.commit()
+        finally:
+            self._in_transaction = False
+
     def close(self) -> None:
         if self._connection is not None:
             self._connection.close()
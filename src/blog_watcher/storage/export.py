@@ -0,0 +1,106 @@
+"""Consistent, read-only exports of the watcher database."""
+
+from __future__ import annotations
+
+import csv
+import json
+import sqlite3
+import tempfile
+from dataclasses import asdict, fields
+from datetime import datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .database import Database
+from .migrations import SchemaBackfill
+from .models import BlogState, CheckHistory
+from .repository import BlogStateRepository, CheckHistoryRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class ExportFormat(StrEnum):
+    SQLITE = "sqlite"
+    JSONL = "jsonl"
+    CSV = "csv"
+
+
+def snapshot_database(source: Path, destination: Path, *, pages_per_step: int = 256) -> None:
+    """Copy ``source`` into a new file with the SQLite online backup API.
+
+    The source is opened read-only and copied ``pages_per_step`` pages at a time, so
+    the watcher only waits for one step. SQLite restarts the copy if the source
+    changes mid-way, which keeps the result consistent.
+    """
+    if destination.exists():
+        msg = f"export destination already exists: {destination}"
+        raise FileExistsError(msg)
+    if not source.exists():
+        msg = f"database not found: {source}"
+        raise FileNotFoundError(msg)
+    reader = sqlite3.connect(f"{source.resolve().as_uri()}?mode=ro", uri=True)
+    writer = sqlite3.connect(destination)
+    try:
+        reader.backup(writer, pages=pages_per_step)
+    finally:
+        writer.close()
+        reader.close()
+
+
+def export_tables(snapshot: Path, directory: Path, export_format: ExportFormat, *, chunk_size: int = 1000) -> list[Path]:
+    """Stream ``blog_state`` and ``check_history`` from a snapshot into one file each.
+
+    A schema backfill still pending in the snapshot is finished there first, so
+    history rows not yet moved out of the legacy table are exported too.
+    """
+    if export_format is ExportFormat.SQLITE:
+        msg = "export_tables writes jsonl or csv; use snapshot_database for sqlite"
+        raise ValueError(msg)
+    directory.mkdir(parents=True, exist_ok=True)
+    db = Database(snapshot)
+    try:
+        backfill = SchemaBackfill(db, batch_size=chunk_size)
+        while backfill.pending():
+            backfill.run_batch()
+        states = BlogStateRepository(db).list_all()
+        history = CheckHistoryRepository(db).iter_all(page_size=chunk_size)
+        return [
+            _write(directory / f"blog_state.{export_format}", export_format, [field.name for field in fields(BlogState)], states),
+            _write(directory / f"check_history.{export_format}", export_format, [field.name for field in fields(CheckHistory)], history),
+        ]
+    finally:
+        db.close()
+
+
+def export_database(source: Path, destination: Path, export_format: ExportFormat, *, chunk_size: int = 1000) -> list[Path]:
+    """Snapshot ``source`` and write it to ``destination`` in ``export_format``.
+
+    ``sqlite`` writes the snapshot file itself; the other formats write one file per
+    table into the ``destination`` directory, reading from a temporary snapshot.
+    """
+    if export_format is ExportFormat.SQLITE:
+        snapshot_database(source, destination)
+        return [destination]
+    with tempfile.TemporaryDirectory() as scratch:
+        snapshot = Path(scratch) / "snapshot.sqlite"
+        snapshot_database(source, snapshot)
+        return export_tables(snapshot, destination, export_format, chunk_size=chunk_size)
+
+
+def _write(path: Path, export_format: ExportFormat, columns: list[str], records: Iterable[BlogState | CheckHistory]) -> Path:
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        if export_format is ExportFormat.JSONL:
+            for record in records:
+                handle.write(json.dumps(_to_row(record), ensure_ascii=False))
+                handle.write("\n")
+        else:
+            writer = csv.DictWriter(handle, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(_to_row(record) for record in records)
+    return path
+
+
+def _to_row(record: BlogState | CheckHistory) -> dict[str, Any]:
+    return {key: value.isoformat() if isinstance(value, datetime) else value for key, value in asdict(record).items()}
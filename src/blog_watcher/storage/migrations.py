@@ -0,0 +1,207 @@
+"""Versioned schema migrations.
+
+Migrations live in ``sql/migrations`` as ``NNNN_name.sql`` files and are applied
+in order, each in its own transaction, recording the version in ``schema_version``.
+
+A migration may also ship ``NNNN_name.backfill.sql``: statements run repeatedly,
+one chunk of ``:batch_size`` rows per transaction, until the last statement touches
+no rows. ``NNNN_name.finalize.sql`` then runs once. Backfills are driven by
+:class:`SchemaBackfill` while the watcher keeps running, so large tables can be
+rewritten without blocking startup.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .codec import encode_fingerprint, encode_timestamp
+
+if TYPE_CHECKING:
+    from .database import Database
+
+_MIGRATIONS_DIR = Path(__file__).resolve().parent / "sql" / "migrations"
+_MIGRATION_FILE_RE = re.compile(r"^(\d{4})_(\w+)\.sql$")
+_STEP_FILE_RE = re.compile(r"^(\d{4})_(\w+)\.(backfill|finalize)\.sql$")
+_SCHEMA_VERSION_SQL = (_MIGRATIONS_DIR / "schema_version.sql").read_text(encoding="utf-8")
+# Chunk size used when a backfill has to finish before the next migration can apply.
+_OFFLINE_BATCH_SIZE = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    version: int
+    name: str
+    sql: str
+    backfill: tuple[str, ...] = ()
+    finalize: str | None = None
+
+
+def load_migrations(directory: Path = _MIGRATIONS_DIR) -> list[Migration]:
+    migrations: list[Migration] = []
+    steps: dict[tuple[int, str], str] = {}
+    for path in sorted(directory.iterdir()):
+        if (step := _STEP_FILE_RE.match(path.name)) is not None:
+            steps[int(step.group(1)), step.group(3)] = path.read_text(encoding="utf-8")
+        elif (match := _MIGRATION_FILE_RE.match(path.name)) is not None:
+            migrations.append(Migration(version=int(match.group(1)), name=match.group(2), sql=path.read_text(encoding="utf-8")))
+    versions = [migration.version for migration in migrations]
+    if len(set(versions)) != len(versions):
+        msg = f"duplicate migration versions in {directory}"
+        raise ValueError(msg)
+    orphans = {version for version, _ in steps} - set(versions)
+    if orphans:
+        msg = f"backfill or finalize step without a migration in {directory}: {sorted(orphans)}"
+        raise ValueError(msg)
+    return [
+        Migration(
+            version=migration.version,
+            name=migration.name,
+            sql=migration.sql,
+            backfill=_split_statements(steps.get((migration.version, "backfill"), "")),
+            finalize=steps.get((migration.version, "finalize")),
+        )
+        for migration in migrations
+    ]
+
+
+def current_version(connection: sqlite3.Connection) -> int:
+    connection.executescript(_SCHEMA_VERSION_SQL)
+    row = connection.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return int(row[0]) if row[0] is not None else 0
+
+
+def pending_backfills(connection: sqlite3.Connection) -> list[int]:
+    connection.executescript(_SCHEMA_VERSION_SQL)
+    return [row[0] for row in connection.execute("SELECT version FROM schema_backfill WHERE completed_at IS NULL ORDER BY version")]
+
+
+def apply_migrations(connection: sqlite3.Connection, migrations: list[Migration] | None = None) -> list[Migration]:
+    """Apply every migration newer than the database's version and return the ones applied.
+
+    Backfills left unfinished by an earlier run are completed first, since a newer
+    migration may reshape the tables they write to.
+    """
+    _register_functions(connection)
+    version = current_version(connection)
+    available = migrations if migrations is not None else load_migrations()
+    newer = [migration for migration in available if migration.version > version]
+    if newer:
+        by_version = {migration.version: migration for migration in available}
+        for pending in pending_backfills(connection):
+            if pending not in by_version:
+                msg = f"backfill for unknown migration {pending} is still pending"
+                raise ValueError(msg)
+            while _run_backfill_chunk(connection, by_version[pending], _OFFLINE_BATCH_SIZE) > 0:
+                pass
+    for migration in newer:
+        _apply(connection, migration)
+    return newer
+
+
+class SchemaBackfill:
+    """Runs pending migration backfills in short chunks alongside regular writes."""
+
+    def __init__(self, db: Database, *, batch_size: int = 1000, migrations: list[Migration] | None = None) -> None:
+        if batch_size <= 0:
+            msg = "batch_size must be positive"
+            raise ValueError(msg)
+        self._db = db
+        self._batch_size = batch_size
+        self._migrations = {migration.version: migration for migration in (migrations if migrations is not None else load_migrations())}
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def pending(self) -> list[int]:
+        return pending_backfills(self._db.connect())
+
+    def run_batch(self) -> int:
+        """Move one chunk of the oldest pending backfill and return the rows it touched.
+
+        Returns 0 once nothing is pending.
+        """
+        pending = self.pending()
+        if not pending:
+            return 0
+        connection = self._db.connect()
+        _register_functions(connection)
+        return _run_backfill_chunk(connection, self._migrations[pending[0]], self._batch_size)
+
+
+def _apply(connection: sqlite3.Connection, migration: Migration) -> None:
+    try:
+        # executescript leaves the explicit BEGIN open, so the version row commits with the schema change.
+        connection.executescript(f"BEGIN;\n{migration.sql}\n;")
+        connection.execute(
+            "INSERT INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)",
+            (migration.version, migration.name, encode_timestamp(datetime.now(UTC))),
+        )
+        if migration.backfill:
+            connection.execute("INSERT INTO schema_backfill (version) VALUES (?)", (migration.version,))
+        connection.commit()
+    except BaseException:
+        if connection.in_transaction:
+            connection.rollback()
+        raise
+
+
+def _run_backfill_chunk(connection: sqlite3.Connection, migration: Migration, batch_size: int) -> int:
+    """Run one chunk in its own transaction; the empty chunk runs finalize and marks the backfill done."""
+    try:
+        touched = 0
+        for statement in migration.backfill:
+            touched = connection.execute(statement, {"batch_size": batch_size}).rowcount
+        if touched == 0:
+            for statement in _split_statements(migration.finalize or ""):
+                connection.execute(statement)
+            connection.execute(
+                "UPDATE schema_backfill SET completed_at = ? WHERE version = ?",
+                (encode_timestamp(datetime.now(UTC)), migration.version),
+            )
+    except BaseException:
+        if connection.in_transaction:
+            connection.rollback()
+        raise
+    connection.commit()
+    return touched
+
+
+def _split_statements(script: str) -> tuple[str, ...]:
+    statements: list[str] = []
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        if line.lstrip().startswith("--"):
+            continue
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ""
+    if buffer.strip():
+        msg = f"incomplete SQL statement: {buffer.strip()!r}"
+        raise ValueError(msg)
+    return tuple(statements)
+
+
+def _iso_to_epoch_ms(value: str | None) -> int | None:
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(value)
+    # Naive values predate timezone-aware writes and were always UTC.
+    return encode_timestamp(parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC))
+
+
+def _hex_to_blob(value: str | None) -> bytes | str | None:
+    if value is None:
+        return None
+    return encode_fingerprint(value)
+
+
+def _register_functions(connection: sqlite3.Connection) -> None:
+    connection.create_function("iso_to_epoch_ms", 1, _iso_to_epoch_ms, deterministic=True)
+    connection.create_function("hex_to_blob", 1, _hex_to_blob, deterministic=True)
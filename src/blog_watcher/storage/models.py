@@ -23,6 +23,8 @@ class BlogState:
     feed_last_modified: str | None = None
     sitemap_etag: str | None = None
     sitemap_last_modified: str | None = None
+    feed_body_hash: str | None = None
+    sitemap_body_hash: str | None = None
 
     def __post_init__(self) -> None:
         if not self.blog_id:
@@ -42,3 +44,79 @@ class CheckHistory:
     changed: bool
     url_fingerprint: str | None
     error_message: str | None
+    # Compact mode folds identical unchanged checks into one row: the check at
+    # ``checked_at`` was repeated until ``repeated_until``, ``repeat_count`` times in all.
+    repeat_count: int = 1
+    repeated_until: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryCursor:
+    """Position after the last entry of a page; pass it back to fetch the next one."""
+
+    checked_at: datetime
+    id: int
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryPage:
+    entries: list[CheckHistory]
+    next_cursor: HistoryCursor | None
+
+
+@dataclass(frozen=True, slots=True)
+class CheckRollup:
+    blog_id: str
+    bucket_start: datetime
+    http_status: int | None
+    checks: int
+    changes: int
+    errors: int
+
+
+@dataclass(frozen=True, slots=True)
+class RobotsRecord:
+    """The sitemaps a host's robots.txt declares, valid until ``expires_at``."""
+
+    host: str
+    status: int | None
+    sitemaps: tuple[str, ...]
+    fetched_at: datetime
+    expires_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveryMiss:
+    """Feed or sitemap discovery for ``blog_id`` found nothing ``misses`` times in a row; retry after ``retry_after``."""
+
+    blog_id: str
+    kind: str
+    misses: int
+    last_probed_at: datetime
+    retry_after: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class HostCircuit:
+    """Circuit breaker state for ``host`` after ``failures`` failed fetches in a row; no requests before ``retry_at``."""
+
+    host: str
+    state: str
+    failures: int
+    changed_at: datetime
+    retry_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class HttpCacheEntry:
+    """A cached response for ``url``, fresh until ``expires_at``; the body is stored once per ``body_hash``."""
+
+    url: str
+    status: int
+    etag: str | None
+    last_modified: str | None
+    body_hash: str
+    stored_at: datetime
+    expires_at: datetime
+    last_used_at: datetime
+    encoding: str | None = None
@@ -1,112 +1,578 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING
+import json
+import zlib
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
-from .models import BlogState, CheckHistory
+from .codec import decode_fingerprint, decode_timestamp, encode_fingerprint, encode_timestamp
+from .models import BlogState, CheckHistory, CheckRollup, DiscoveryMiss, HistoryCursor, HistoryPage, HostCircuit, HttpCacheEntry, RobotsRecord
 from .sql import (
     BLOG_STATE_DELETE_SQL,
+    BLOG_STATE_GET_MANY_SQL,
     BLOG_STATE_GET_SQL,
     BLOG_STATE_LIST_ALL_SQL,
+    BLOG_STATE_TOUCH_SQL,
     BLOG_STATE_UPSERT_SQL,
     CHECK_HISTORY_ADD_SQL,
-    CHECK_HISTORY_LIST_BY_BLOG_ID_SQL,
+    CHECK_HISTORY_EXTEND_RUN_SQL,
+    CHECK_HISTORY_LIST_AFTER_ID_SQL,
+    CHECK_HISTORY_LIST_ALL_CHANGED_PAGE_SQL,
+    CHECK_HISTORY_LIST_CHANGED_PAGE_SQL,
+    CHECK_HISTORY_LIST_PAGE_SQL,
+    CHECK_ROLLUP_LIST_DAILY_BY_BLOG_ID_SQL,
+    CHECK_ROLLUP_LIST_HOURLY_BY_BLOG_ID_SQL,
+    DISCOVERY_MISS_DELETE_SQL,
+    DISCOVERY_MISS_GET_SQL,
+    DISCOVERY_MISS_UPSERT_SQL,
+    HOST_CIRCUIT_DELETE_SQL,
+    HOST_CIRCUIT_GET_SQL,
+    HOST_CIRCUIT_UPSERT_SQL,
+    HTTP_CACHE_DELETE_SQL,
+    HTTP_CACHE_DELETE_UNUSED_BODY_SQL,
+    HTTP_CACHE_GET_BODY_SQL,
+    HTTP_CACHE_GET_SQL,
+    HTTP_CACHE_LIST_LEAST_RECENTLY_USED_SQL,
+    HTTP_CACHE_PUT_BODY_SQL,
+    HTTP_CACHE_TOTAL_SIZE_SQL,
+    HTTP_CACHE_UPSERT_SQL,
+    ROBOTS_CACHE_GET_SQL,
+    ROBOTS_CACHE_UPSERT_SQL,
 )
 
 if TYPE_CHECKING:
-    import sqlite3
+    from collections.abc import Iterable, Iterator
 
     from .database import Database
 
+# Stays well below SQLITE_MAX_VARIABLE_NUMBER on every SQLite build.
+_GET_MANY_CHUNK_SIZE = 500
+# Cache entries considered per eviction query.
+_EVICTION_BATCH_SIZE = 64
+
+_HISTORY_PAGE_SIZE = 500
+_MIN_CHECKED_AT = datetime.min.replace(tzinfo=UTC)
+_MAX_CHECKED_AT = datetime.max.replace(tzinfo=UTC)
+_MAX_ROW_ID = 2**63 - 1
+# Matches the hourly rollup bucket width in sql/retention/.
+_HOUR_MS = 3_600_000
+
+# Column positions in the SELECT lists under sql/; rows are plain tuples.
+_HISTORY_ID = 0
+
 
 class BlogStateRepository:
-    def __init__(self, db: Database) -> None:
+    def __init__(self, db: Database, *, skip_unchanged_writes: bool = False) -> None:
         self._db = db
+        self._skip_unchanged_writes = skip_unchanged_writes
+        self._prefetched: dict[str, BlogState | None] | None = None
 
     def get(self, blog_id: str) -> BlogState | None:
+        if self._prefetched is not None and blog_id in self._prefetched:
+            return self._prefetched[blog_id]
         row = self._db.execute(BLOG_STATE_GET_SQL, (blog_id,)).fetchone()
         return self._row_to_state(row) if row else None
 
+    def get_many(self, blog_ids: Iterable[str]) -> dict[str, BlogState]:
+        unique_ids = list(dict.fromkeys(blog_ids))
+        states: dict[str, BlogState] = {}
+        for start in range(0, len(unique_ids), _GET_MANY_CHUNK_SIZE):
+            chunk = unique_ids[start : start + _GET_MANY_CHUNK_SIZE]
+            query = BLOG_STATE_GET_MANY_SQL.format(placeholders=", ".join("?" * len(chunk)))
+            for row in self._db.execute(query, chunk).fetchall():
+                state = self._row_to_state(row)
+                states[state.blog_id] = state
+        return states
+
+    @contextmanager
+    def prefetch(self, blog_ids: Iterable[str]) -> Iterator[None]:
+        """Serve ``get`` for ``blog_ids`` from one bulk read until the block exits.
+
+        Writes made through this repository keep the snapshot current, so callers
+        see their own upserts and deletes.
+        """
+        ids = list(blog_ids)
+        found = self.get_many(ids)
+        self._prefetched = {blog_id: found.get(blog_id) for blog_id in ids}
+        try:
+            yield
+        finally:
+            self._prefetched = None
+
     def upsert(self, state: BlogState) -> None:
-        self._db.execute(
-            BLOG_STATE_UPSERT_SQL,
-            (
-                state.blog_id,
-                state.etag,
-                state.last_modified,
-                state.url_fingerprint,
-                state.feed_url,
-                state.sitemap_url,
-                state.recent_entry_keys,
-                state.last_checked_at.isoformat(),
-                state.last_changed_at.isoformat() if state.last_changed_at else None,
-                state.consecutive_errors,
-                state.feed_etag,
-                state.feed_last_modified,
-                state.sitemap_etag,
-                state.sitemap_last_modified,
-            ),
-        )
+        # Outside ``prefetch`` this costs one primary-key read, still far cheaper than rewriting the row.
+        previous = self.get(state.blog_id) if self._skip_unchanged_writes else None
+        if previous is not None and replace(previous, last_checked_at=state.last_checked_at) == state:
+            # Only the heartbeat moved; skip rewriting every column.
+            if previous.last_checked_at != state.last_checked_at:
+                self.touch(state.blog_id, state.last_checked_at)
+            return
+        self._db.execute(BLOG_STATE_UPSERT_SQL, self._state_params(state))
+        if self._prefetched is not None:
+            self._prefetched[state.blog_id] = state
+
+    def upsert_many(self, states: Iterable[BlogState]) -> None:
+        """Write every state with one prepared statement; unlike ``upsert`` it never skips writes."""
+        states = list(states)
+        self._db.executemany(BLOG_STATE_UPSERT_SQL, [self._state_params(state) for state in states])
+        if self._prefetched is not None:
+            self._prefetched.update((state.blog_id, state) for state in states)
+
+    def touch(self, blog_id: str, checked_at: datetime) -> None:
+        self._db.execute(BLOG_STATE_TOUCH_SQL, (encode_timestamp(checked_at), blog_id))
+        if self._prefetched is not None:
+            previous = self._prefetched.get(blog_id)
+            if previous is not None:
+                self._prefetched[blog_id] = replace(previous, last_checked_at=checked_at)
 
     def delete(self, blog_id: str) -> bool:
         cursor = self._db.execute(BLOG_STATE_DELETE_SQL, (blog_id,))
+        if self._prefetched is not None:
+            self._prefetched[blog_id] = None
         return cursor.rowcount > 0
 
     def list_all(self) -> list[BlogState]:
         rows = self._db.execute(BLOG_STATE_LIST_ALL_SQL).fetchall()
         return [self._row_to_state(row) for row in rows]
 
-    def _row_to_state(self, row: sqlite3.Row) -> BlogState:
+    @staticmethod
+    def _state_params(state: BlogState) -> tuple[object, ...]:
+        return (
+            state.blog_id,
+            state.etag,
+            state.last_modified,
+            encode_fingerprint(state.url_fingerprint) if state.url_fingerprint is not None else None,
+            state.feed_url,
+            state.sitemap_url,
+            state.recent_entry_keys,
+            encode_timestamp(state.last_checked_at),
+            encode_timestamp(state.last_changed_at) if state.last_changed_at else None,
+            state.consecutive_errors,
+            state.feed_etag,
+            state.feed_last_modified,
+            state.sitemap_etag,
+            state.sitemap_last_modified,
+            encode_fingerprint(state.feed_body_hash) if state.feed_body_hash is not None else None,
+            encode_fingerprint(state.sitemap_body_hash) if state.sitemap_body_hash is not None else None,
+        )
+
+    @staticmethod
+    def _row_to_state(row: tuple[Any, ...]) -> BlogState:
+        (
+            blog_id,
+            etag,
+            last_modified,
+            url_fingerprint,
+            feed_url,
+            sitemap_url,
+            recent_entry_keys,
+            last_checked_at,
+            last_changed_at,
+            consecutive_errors,
+            feed_etag,
+            feed_last_modified,
+            sitemap_etag,
+            sitemap_last_modified,
+            feed_body_hash,
+            sitemap_body_hash,
+        ) = row
         return BlogState(
-            blog_id=row["blog_id"],
-            etag=row["etag"],
-            last_modified=row["last_modified"],
-            url_fingerprint=row["url_fingerprint"],
-            feed_url=row["feed_url"],
-            sitemap_url=row["sitemap_url"],
-            recent_entry_keys=row["recent_entry_keys"],
-            last_checked_at=datetime.fromisoformat(row["last_checked_at"]),
-            last_changed_at=(datetime.fromisoformat(row["last_changed_at"]) if row["last_changed_at"] else None),
-            consecutive_errors=row["consecutive_errors"],
-            feed_etag=row["feed_etag"],
-            feed_last_modified=row["feed_last_modified"],
-            sitemap_etag=row["sitemap_etag"],
-            sitemap_last_modified=row["sitemap_last_modified"],
+            blog_id=blog_id,
+            etag=etag,
+            last_modified=last_modified,
+            url_fingerprint=decode_fingerprint(url_fingerprint) if url_fingerprint is not None else None,
+            feed_url=feed_url,
+            sitemap_url=sitemap_url,
+            recent_entry_keys=recent_entry_keys,
+            last_checked_at=decode_timestamp(last_checked_at),
+            last_changed_at=decode_timestamp(last_changed_at) if last_changed_at is not None else None,
+            consecutive_errors=consecutive_errors,
+            feed_etag=feed_etag,
+            feed_last_modified=feed_last_modified,
+            sitemap_etag=sitemap_etag,
+            sitemap_last_modified=sitemap_last_modified,
+            feed_body_hash=decode_fingerprint(feed_body_hash) if feed_body_hash is not None else None,
+            sitemap_body_hash=decode_fingerprint(sitemap_body_hash) if sitemap_body_hash is not None else None,
         )
 
 
 class CheckHistoryRepository:
-    def __init__(self, db: Database) -> None:
+    def __init__(self, db: Database, *, compact_unchanged: bool = False) -> None:
         self._db = db
+        self._compact_unchanged = compact_unchanged
 
     def add(self, entry: CheckHistory) -> None:
+        self._db.execute(CHECK_HISTORY_ADD_SQL, self._history_params(entry))
+
+    def add_many(self, entries: Iterable[CheckHistory]) -> None:
+        self._db.executemany(CHECK_HISTORY_ADD_SQL, (self._history_params(entry) for entry in entries))
+
+    def record(self, entry: CheckHistory) -> None:
+        """Store a check, folding it into the latest row when compaction is on and nothing changed."""
+        if self._compact_unchanged and not entry.changed and entry.error_message is None:
+            checked_at = encode_timestamp(entry.checked_at)
+            # Runs never cross an hour boundary, so the hourly rollup can count each one in a single bucket.
+            cursor = self._db.execute(
+                CHECK_HISTORY_EXTEND_RUN_SQL,
+                (
+                    checked_at,
+                    entry.blog_id,
+                    checked_at - checked_at % _HOUR_MS,
+                    1 if entry.skipped else 0,
+                    entry.http_status,
+                    encode_fingerprint(entry.url_fingerprint) if entry.url_fingerprint is not None else None,
+                ),
+            )
+            if cursor.rowcount > 0:
+                return
+        self.add(entry)
+
+    def list_by_blog_id(
+        self,
+        blog_id: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+        changed_only: bool = False,
+    ) -> list[CheckHistory]:
+        if limit is not None:
+            return self.list_page(blog_id, since=since, until=until, limit=limit, changed_only=changed_only).entries
+        return list(self.iter_by_blog_id(blog_id, since=since, until=until, changed_only=changed_only))
+
+    def list_page(  # noqa: PLR0913
+        self,
+        blog_id: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = _HISTORY_PAGE_SIZE,
+        changed_only: bool = False,
+        cursor: HistoryCursor | None = None,
+    ) -> HistoryPage:
+        """Return up to ``limit`` checks in ``[since, until)``, newest first, starting after ``cursor``."""
+        query = CHECK_HISTORY_LIST_CHANGED_PAGE_SQL if changed_only else CHECK_HISTORY_LIST_PAGE_SQL
+        return self._fetch_page(query, (blog_id,), since=since, limit=limit, cursor=cursor or self._start_cursor(until))
+
+    def iter_by_blog_id(
+        self,
+        blog_id: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        changed_only: bool = False,
+        page_size: int = _HISTORY_PAGE_SIZE,
+    ) -> Iterator[CheckHistory]:
+        """Walk a blog's history newest first, holding at most one page in memory."""
+        cursor: HistoryCursor | None = None
+        while True:
+            page = self.list_page(blog_id, since=since, until=until, limit=page_size, changed_only=changed_only, cursor=cursor)
+            yield from page.entries
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def iter_changes(
+        self,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        page_size: int = _HISTORY_PAGE_SIZE,
+    ) -> Iterator[CheckHistory]:
+        """Walk changed checks across all blogs, newest first."""
+        cursor = self._start_cursor(until)
+        while True:
+            page = self._fetch_page(CHECK_HISTORY_LIST_ALL_CHANGED_PAGE_SQL, (), since=since, limit=page_size, cursor=cursor)
+            yield from page.entries
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def iter_all(self, *, page_size: int = _HISTORY_PAGE_SIZE) -> Iterator[CheckHistory]:
+        """Walk every check in insertion order, one page at a time."""
+        if page_size <= 0:
+            msg = "page_size must be positive"
+            raise ValueError(msg)
+        last_id = 0
+        while True:
+            rows = self._db.execute(CHECK_HISTORY_LIST_AFTER_ID_SQL, (last_id, page_size)).fetchall()
+            yield from (self._row_to_history(row) for row in rows)
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][_HISTORY_ID]
+
+    @staticmethod
+    def _start_cursor(until: datetime | None) -> HistoryCursor:
+        # Sorts before every row at ``until`` (exclusive), or after the newest row.
+        return HistoryCursor(checked_at=until or _MAX_CHECKED_AT, id=_MAX_ROW_ID)
+
+    def _fetch_page(
+        self,
+        query: str,
+        leading_params: tuple[object, ...],
+        *,
+        since: datetime | None,
+        limit: int,
+        cursor: HistoryCursor,
+    ) -> HistoryPage:
+        if limit <= 0:
+            msg = "limit must be positive"
+            raise ValueError(msg)
+        upper = encode_timestamp(cursor.checked_at)
+        params = (*leading_params, encode_timestamp(since or _MIN_CHECKED_AT), upper, upper, cursor.id, limit)
+        rows = self._db.execute(query, params).fetchall()
+        entries = [self._row_to_history(row) for row in rows]
+        next_cursor = HistoryCursor(checked_at=entries[-1].checked_at, id=rows[-1][_HISTORY_ID]) if len(rows) == limit else None
+        return HistoryPage(entries=entries, next_cursor=next_cursor)
+
+    @staticmethod
+    def _history_params(entry: CheckHistory) -> tuple[object, ...]:
+        return (
+            entry.blog_id,
+            encode_timestamp(entry.checked_at),
+            entry.http_status,
+            1 if entry.skipped else 0,
+            1 if entry.changed else 0,
+            encode_fingerprint(entry.url_fingerprint) if entry.url_fingerprint is not None else None,
+            entry.error_message,
+            entry.repeat_count,
+            encode_timestamp(entry.repeated_until) if entry.repeated_until else None,
+        )
+
+    @staticmethod
+    def _row_to_history(row: tuple[Any, ...]) -> CheckHistory:
+        _, blog_id, checked_at, http_status, skipped, changed, url_fingerprint, error_message, repeat_count, repeated_until = row
+        return CheckHistory(
+            blog_id=blog_id,
+            checked_at=decode_timestamp(checked_at),
+            http_status=http_status,
+            skipped=bool(skipped),
+            changed=bool(changed),
+            url_fingerprint=decode_fingerprint(url_fingerprint) if url_fingerprint is not None else None,
+            error_message=error_message,
+            repeat_count=repeat_count,
+            repeated_until=decode_timestamp(repeated_until) if repeated_until is not None else None,
+        )
+
+
+class CheckRollupRepository:
+    def __init__(self, db: Database) -> None:
+        self._db = db
+
+    def list_hourly_by_blog_id(self, blog_id: str) -> list[CheckRollup]:
+        rows = self._db.execute(CHECK_ROLLUP_LIST_HOURLY_BY_BLOG_ID_SQL, (blog_id,)).fetchall()
+        return [self._row_to_rollup(row) for row in rows]
+
+    def list_daily_by_blog_id(self, blog_id: str) -> list[CheckRollup]:
+        rows = self._db.execute(CHECK_ROLLUP_LIST_DAILY_BY_BLOG_ID_SQL, (blog_id,)).fetchall()
+        return [self._row_to_rollup(row) for row in rows]
+
+    @staticmethod
+    def _row_to_rollup(row: tuple[Any, ...]) -> CheckRollup:
+        blog_id, bucket_start, http_status, checks, changes, errors = row
+        return CheckRollup(
+            blog_id=blog_id,
+            bucket_start=decode_timestamp(bucket_start),
+            # Rollups bucket "no response" under status 0 so it can be part of the key.
+            http_status=http_status or None,
+            checks=checks,
+            changes=changes,
+            errors=errors,
+        )
+
+
+class RobotsCacheRepository:
+    def __init__(self, db: Database) -> None:
+        self._db = db
+
+    def get(self, host: str) -> RobotsRecord | None:
+        row = self._db.execute(ROBOTS_CACHE_GET_SQL, (host,)).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def upsert(self, record: RobotsRecord) -> None:
         self._db.execute(
-            CHECK_HISTORY_ADD_SQL,
+            ROBOTS_CACHE_UPSERT_SQL,
             (
-                entry.blog_id,
-                entry.checked_at.isoformat(),
-                entry.http_status,
-                1 if entry.skipped else 0,
-                1 if entry.changed else 0,
-                entry.url_fingerprint,
-                entry.error_message,
+                record.host,
+                record.status,
+                json.dumps(list(record.sitemaps)),
+                encode_timestamp(record.fetched_at),
+                encode_timestamp(record.expires_at),
             ),
         )
 
-    def list_by_blog_id(self, blog_id: str) -> list[CheckHistory]:
-        rows = self._db.execute(
-            CHECK_HISTORY_LIST_BY_BLOG_ID_SQL,
-            (blog_id,),
-        ).fetchall()
-        return [self._row_to_history(row) for row in rows]
+    @staticmethod
+    def _row_to_record(row: tuple[Any, ...]) -> RobotsRecord:
+        host, status, sitemaps, fetched_at, expires_at = row
+        return RobotsRecord(
+            host=host,
+            status=status,
+            sitemaps=tuple(json.loads(sitemaps)),
+            fetched_at=decode_timestamp(fetched_at),
+            expires_at=decode_timestamp(expires_at),
+        )
 
-    def _row_to_history(self, row: sqlite3.Row) -> CheckHistory:
-        return CheckHistory(
-            blog_id=row["blog_id"],
-            checked_at=datetime.fromisoformat(row["checked_at"]),
-            http_status=row["http_status"],
-            skipped=bool(row["skipped"]),
-            changed=bool(row["changed"]),
-            url_fingerprint=row["url_fingerprint"],
-            error_message=row["error_message"],
+
+class DiscoveryMissRepository:
+    def __init__(self, db: Database) -> None:
+        self._db = db
+
+    def get(self, blog_id: str, kind: str) -> DiscoveryMiss | None:
+        row = self._db.execute(DISCOVERY_MISS_GET_SQL, (blog_id, kind)).fetchone()
+        if row is None:
+            return None
+        blog_id, kind, misses, last_probed_at, retry_after = row
+        return DiscoveryMiss(
+            blog_id=blog_id,
+            kind=kind,
+            misses=misses,
+            last_probed_at=decode_timestamp(last_probed_at),
+            retry_after=decode_timestamp(retry_after),
+        )
+
+    def upsert(self, miss: DiscoveryMiss) -> None:
+        self._db.execute(
+            DISCOVERY_MISS_UPSERT_SQL,
+            (miss.blog_id, miss.kind, miss.misses, encode_timestamp(miss.last_probed_at), encode_timestamp(miss.retry_after)),
+        )
+
+    def delete(self, blog_id: str, kind: str) -> bool:
+        return self._db.execute(DISCOVERY_MISS_DELETE_SQL, (blog_id, kind)).rowcount > 0
+
+
+class HostCircuitRepository:
+    def __init__(self, db: Database) -> None:
+        self._db = db
+
+    def get(self, host: str) -> HostCircuit | None:
+        row = self._db.execute(HOST_CIRCUIT_GET_SQL, (host,)).fetchone()
+        if row is None:
+            return None
+        host, state, failures, changed_at, retry_at = row
+        return HostCircuit(
+            host=host,
+            state=state,
+            failures=failures,
+            changed_at=decode_timestamp(changed_at),
+            retry_at=decode_timestamp(retry_at) if retry_at is not None else None,
+        )
+
+    def upsert(self, circuit: HostCircuit) -> None:
+        self._db.execute(
+            HOST_CIRCUIT_UPSERT_SQL,
+            (
+                circuit.host,
+                circuit.state,
+                circuit.failures,
+                encode_timestamp(circuit.changed_at),
+                encode_timestamp(circuit.retry_at) if circuit.retry_at is not None else None,
+            ),
         )
+
+    def delete(self, host: str) -> bool:
+        return self._db.execute(HOST_CIRCUIT_DELETE_SQL, (host,)).rowcount > 0
+
+
+class HttpCacheRepository:
+    """Cached HTTP responses: metadata per URL, zlib-compressed bodies shared by content hash."""
+
+    def __init__(self, db: Database) -> None:
+        self._db = db
+        # Compressed body bytes; summed once, then kept current by the writes below.
+        self._size: int | None = None
+
+    def get(self, url: str) -> HttpCacheEntry | None:
+        row = self._db.execute(HTTP_CACHE_GET_SQL, (url,)).fetchone()
+        if row is None:
+            return None
+        url, status, etag, last_modified, body_hash, stored_at, expires_at, last_used_at, encoding = row
+        return HttpCacheEntry(
+            url=url,
+            status=status,
+            etag=etag,
+            last_modified=last_modified,
+            body_hash=decode_fingerprint(body_hash),
+            stored_at=decode_timestamp(stored_at),
+            expires_at=decode_timestamp(expires_at),
+            last_used_at=decode_timestamp(last_used_at),
+            encoding=encoding,
+        )
+
+    def get_body(self, body_hash: str) -> bytes | None:
+        row = self._db.execute(HTTP_CACHE_GET_BODY_SQL, (encode_fingerprint(body_hash),)).fetchone()
+        return zlib.decompress(row[0]) if row else None
+
+    def put(self, entry: HttpCacheEntry, body: bytes) -> None:
+        """Store ``entry`` with its body, replacing what was cached for the URL."""
+        compressed = zlib.compress(body)
+        freed = 0
+        with self._db.transaction():
+            previous = self.get(entry.url)
+            inserted = self._db.execute(HTTP_CACHE_PUT_BODY_SQL, (encode_fingerprint(entry.body_hash), compressed, len(compressed))).rowcount
+            self.update(entry)
+            if previous is not None and previous.body_hash != entry.body_hash:
+                freed = self._delete_unused_body(previous.body_hash)
+        self._adjust_size((len(compressed) if inserted > 0 else 0) - freed)
+
+    def update(self, entry: HttpCacheEntry) -> None:
+        """Replace the metadata of an entry whose body is already stored, e.g. after a revalidation."""
+        self._db.execute(
+            HTTP_CACHE_UPSERT_SQL,
+            (
+                entry.url,
+                entry.status,
+                entry.etag,
+                entry.last_modified,
+                encode_fingerprint(entry.body_hash),
+                encode_timestamp(entry.stored_at),
+                encode_timestamp(entry.expires_at),
+                encode_timestamp(entry.last_used_at),
+                entry.encoding,
+            ),
+        )
+
+    def delete(self, url: str) -> bool:
+        with self._db.transaction():
+            previous = self.get(url)
+            if previous is None:
+                return False
+            self._db.execute(HTTP_CACHE_DELETE_SQL, (url,))
+            freed = self._delete_unused_body(previous.body_hash)
+        self._adjust_size(-freed)
+        return True
+
+    def total_size(self) -> int:
+        """Compressed bytes held by stored bodies."""
+        if self._size is None:
+            self._size = int(self._db.execute(HTTP_CACHE_TOTAL_SIZE_SQL).fetchone()[0])
+        return self._size
+
+    def evict(self, max_bytes: int) -> int:
+        """Drop least recently used entries until bodies fit in ``max_bytes``; return how many were dropped."""
+        evicted = 0
+        with self._db.transaction():
+            size = self.total_size()
+            while size > max_bytes:
+                rows = self._db.execute(HTTP_CACHE_LIST_LEAST_RECENTLY_USED_SQL, (_EVICTION_BATCH_SIZE,)).fetchall()
+                if not rows:
+                    break
+                for url, body_hash in rows:
+                    if size <= max_bytes:
+                        break
+                    self._db.execute(HTTP_CACHE_DELETE_SQL, (url,))
+                    # A body shared with a more recent entry stays and frees nothing.
+                    size -= self._delete_unused_body(decode_fingerprint(body_hash))
+                    evicted += 1
+        self._size = size
+        return evicted
+
+    def _adjust_size(self, delta: int) -> None:
+        # Applied only after the transaction commits, so a rollback leaves the total untouched.
+        if self._size is not None:
+            self._size += delta
+
+    def _delete_unused_body(self, body_hash: str) -> int:
+        row = self._db.execute(HTTP_CACHE_DELETE_UNUSED_BODY_SQL, (encode_fingerprint(body_hash),)).fetchone()
+        return int(row[0]) if row else 0
@@ -0,0 +1,92 @@
+"""Downsampling and pruning of check history."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from .codec import encode_timestamp
+from .sql import (
+    RETENTION_DELETE_DAILY_BATCH_SQL,
+    RETENTION_DELETE_HOURLY_BATCH_SQL,
+    RETENTION_DELETE_RAW_BATCH_SQL,
+    RETENTION_HOURLY_BATCH_UPPER_ID_SQL,
+    RETENTION_INCREMENTAL_VACUUM_SQL,
+    RETENTION_RAW_BATCH_UPPER_BOUND_SQL,
+    RETENTION_ROLLUP_HOURLY_TO_DAILY_SQL,
+    RETENTION_ROLLUP_RAW_TO_HOURLY_SQL,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .database import Database
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionPolicy:
+    raw_retention: timedelta = timedelta(days=7)
+    hourly_retention: timedelta = timedelta(days=90)
+    daily_retention: timedelta | None = None
+    batch_size: int = 1000
+    vacuum_pages: int = 1000
+
+    def __post_init__(self) -> None:
+        if self.batch_size <= 0:
+            msg = "batch_size must be positive"
+            raise ValueError(msg)
+        if self.vacuum_pages < 0:
+            msg = "vacuum_pages cannot be negative"
+            raise ValueError(msg)
+        if self.hourly_retention < self.raw_retention:
+            msg = "hourly_retention cannot be shorter than raw_retention"
+            raise ValueError(msg)
+
+
+class HistoryRetention:
+    """Rolls raw checks up into hourly and daily buckets and prunes what has been rolled up.
+
+    Every method processes at most ``policy.batch_size`` source rows in one short
+    transaction and returns how many rows it removed, so callers can interleave
+    batches with regular writes instead of holding a long lock.
+    """
+
+    def __init__(self, db: Database, policy: RetentionPolicy | None = None) -> None:
+        self._db = db
+        self._policy = policy or RetentionPolicy()
+
+    @property
+    def policy(self) -> RetentionPolicy:
+        return self._policy
+
+    def rollup_raw_batch(self, *, now: datetime) -> int:
+        cutoff = encode_timestamp(now - self._policy.raw_retention)
+        with self._db.transaction():
+            # The batch ends at its last (checked_at, id), not at an id, since ids need not follow time.
+            bound = self._db.execute(RETENTION_RAW_BATCH_UPPER_BOUND_SQL, (cutoff, self._policy.batch_size)).fetchone()
+            if bound is None:
+                return 0
+            # Compacted runs still being extended stay raw until their last check expires too.
+            self._db.execute(RETENTION_ROLLUP_RAW_TO_HOURLY_SQL, (cutoff, *bound))
+            return self._db.execute(RETENTION_DELETE_RAW_BATCH_SQL, (cutoff, *bound)).rowcount
+
+    def rollup_hourly_batch(self, *, now: datetime) -> int:
+        cutoff = encode_timestamp(now - self._policy.hourly_retention)
+        with self._db.transaction():
+            upper_id = self._db.execute(RETENTION_HOURLY_BATCH_UPPER_ID_SQL, (cutoff, self._policy.batch_size)).fetchone()[0]
+            if upper_id is None:
+                return 0
+            self._db.execute(RETENTION_ROLLUP_HOURLY_TO_DAILY_SQL, (upper_id, cutoff))
+            return self._db.execute(RETENTION_DELETE_HOURLY_BATCH_SQL, (upper_id, cutoff)).rowcount
+
+    def prune_daily_batch(self, *, now: datetime) -> int:
+        if self._policy.daily_retention is None:
+            return 0
+        cutoff = encode_timestamp(now - self._policy.daily_retention)
+        return self._db.execute(RETENTION_DELETE_DAILY_BATCH_SQL, (cutoff, self._policy.batch_size)).rowcount
+
+    def incremental_vacuum(self) -> None:
+        # No-op unless the database was created with auto_vacuum = INCREMENTAL.
+        if self._policy.vacuum_pages > 0:
+            self._db.execute(RETENTION_INCREMENTAL_VACUUM_SQL.format(pages=self._policy.vacuum_pages)).fetchall()
@@ -7,22 +7,89 @@ def _read_sql(relative_path: str) -> str:
     return (Path(__file__).resolve().parent / "sql" / relative_path).read_text(encoding="utf-8")
 
 
-SCHEMA_SQL = _read_sql("schema.sql")
-
 BLOG_STATE_GET_SQL = _read_sql("blog_state/get.sql")
+BLOG_STATE_GET_MANY_SQL = _read_sql("blog_state/get_many.sql")
 BLOG_STATE_LIST_ALL_SQL = _read_sql("blog_state/list_all.sql")
 BLOG_STATE_UPSERT_SQL = _read_sql("blog_state/upsert.sql")
 BLOG_STATE_DELETE_SQL = _read_sql("blog_state/delete.sql")
+BLOG_STATE_TOUCH_SQL = _read_sql("blog_state/touch.sql")
 
 CHECK_HISTORY_ADD_SQL = _read_sql("check_history/add.sql")
-CHECK_HISTORY_LIST_BY_BLOG_ID_SQL = _read_sql("check_history/list_by_blog_id.sql")
+CHECK_HISTORY_EXTEND_RUN_SQL = _read_sql("check_history/extend_run.sql")
+CHECK_HISTORY_LIST_PAGE_SQL = _read_sql("check_history/list_page.sql")
+CHECK_HISTORY_LIST_CHANGED_PAGE_SQL = _read_sql("check_history/list_changed_page.sql")
+CHECK_HISTORY_LIST_ALL_CHANGED_PAGE_SQL = _read_sql("check_history/list_all_changed_page.sql")
+CHECK_HISTORY_LIST_AFTER_ID_SQL = _read_sql("check_history/list_after_id.sql")
+
+CHECK_ROLLUP_LIST_HOURLY_BY_BLOG_ID_SQL = _read_sql("check_rollup/list_hourly_by_blog_id.sql")
+CHECK_ROLLUP_LIST_DAILY_BY_BLOG_ID_SQL = _read_sql("check_rollup/list_daily_by_blog_id.sql")
+
+DISCOVERY_MISS_GET_SQL = _read_sql("discovery_miss/get.sql")
+DISCOVERY_MISS_UPSERT_SQL = _read_sql("discovery_miss/upsert.sql")
+DISCOVERY_MISS_DELETE_SQL = _read_sql("discovery_miss/delete.sql")
+
+HOST_CIRCUIT_GET_SQL = _read_sql("host_circuit/get.sql")
+HOST_CIRCUIT_UPSERT_SQL = _read_sql("host_circuit/upsert.sql")
+HOST_CIRCUIT_DELETE_SQL = _read_sql("host_circuit/delete.sql")
+
+HTTP_CACHE_GET_SQL = _read_sql("http_cache/get.sql")
+HTTP_CACHE_UPSERT_SQL = _read_sql("http_cache/upsert.sql")
+HTTP_CACHE_DELETE_SQL = _read_sql("http_cache/delete.sql")
+HTTP_CACHE_LIST_LEAST_RECENTLY_USED_SQL = _read_sql("http_cache/list_least_recently_used.sql")
+HTTP_CACHE_GET_BODY_SQL = _read_sql("http_cache/get_body.sql")
+HTTP_CACHE_PUT_BODY_SQL = _read_sql("http_cache/put_body.sql")
+HTTP_CACHE_DELETE_UNUSED_BODY_SQL = _read_sql("http_cache/delete_unused_body.sql")
+HTTP_CACHE_TOTAL_SIZE_SQL = _read_sql("http_cache/total_size.sql")
+
+ROBOTS_CACHE_GET_SQL = _read_sql("robots_cache/get.sql")
+ROBOTS_CACHE_UPSERT_SQL = _read_sql("robots_cache/upsert.sql")
+
+RETENTION_RAW_BATCH_UPPER_BOUND_SQL = _read_sql("retention/raw_batch_upper_bound.sql")
+RETENTION_ROLLUP_RAW_TO_HOURLY_SQL = _read_sql("retention/rollup_raw_to_hourly.sql")
+RETENTION_DELETE_RAW_BATCH_SQL = _read_sql("retention/delete_raw_batch.sql")
+RETENTION_HOURLY_BATCH_UPPER_ID_SQL = _read_sql("retention/hourly_batch_upper_id.sql")
+RETENTION_ROLLUP_HOURLY_TO_DAILY_SQL = _read_sql("retention/rollup_hourly_to_daily.sql")
+RETENTION_DELETE_HOURLY_BATCH_SQL = _read_sql("retention/delete_hourly_batch.sql")
+RETENTION_DELETE_DAILY_BATCH_SQL = _read_sql("retention/delete_daily_batch.sql")
+RETENTION_INCREMENTAL_VACUUM_SQL = _read_sql("retention/incremental_vacuum.sql")
 
 __all__ = [
     "BLOG_STATE_DELETE_SQL",
+    "BLOG_STATE_GET_MANY_SQL",
     "BLOG_STATE_GET_SQL",
     "BLOG_STATE_LIST_ALL_SQL",
+    "BLOG_STATE_TOUCH_SQL",
     "BLOG_STATE_UPSERT_SQL",
     "CHECK_HISTORY_ADD_SQL",
-    "CHECK_HISTORY_LIST_BY_BLOG_ID_SQL",
-    "SCHEMA_SQL",
+    "CHECK_HISTORY_EXTEND_RUN_SQL",
+    "CHECK_HISTORY_LIST_AFTER_ID_SQL",
+    "CHECK_HISTORY_LIST_ALL_CHANGED_PAGE_SQL",
+    "CHECK_HISTORY_LIST_CHANGED_PAGE_SQL",
+    "CHECK_HISTORY_LIST_PAGE_SQL",
+    "CHECK_ROLLUP_LIST_DAILY_BY_BLOG_ID_SQL",
+    "CHECK_ROLLUP_LIST_HOURLY_BY_BLOG_ID_SQL",
+    "DISCOVERY_MISS_DELETE_SQL",
+    "DISCOVERY_MISS_GET_SQL",
+    "DISCOVERY_MISS_UPSERT_SQL",
+    "HOST_CIRCUIT_DELETE_SQL",
+    "HOST_CIRCUIT_GET_SQL",
+    "HOST_CIRCUIT_UPSERT_SQL",
+    "HTTP_CACHE_DELETE_SQL",
+    "HTTP_CACHE_DELETE_UNUSED_BODY_SQL",
+    "HTTP_CACHE_GET_BODY_SQL",
+    "HTTP_CACHE_GET_SQL",
+    "HTTP_CACHE_LIST_LEAST_RECENTLY_USED_SQL",
+    "HTTP_CACHE_PUT_BODY_SQL",
+    "HTTP_CACHE_TOTAL_SIZE_SQL",
+    "HTTP_CACHE_UPSERT_SQL",
+    "RETENTION_DELETE_DAILY_BATCH_SQL",
+    "RETENTION_DELETE_HOURLY_BATCH_SQL",
+    "RETENTION_DELETE_RAW_BATCH_SQL",
+    "RETENTION_HOURLY_BATCH_UPPER_ID_SQL",
+    "RETENTION_INCREMENTAL_VACUUM_SQL",
+    "RETENTION_RAW_BATCH_UPPER_BOUND_SQL",
+    "RETENTION_ROLLUP_HOURLY_TO_DAILY_SQL",
+    "RETENTION_ROLLUP_RAW_TO_HOURLY_SQL",
+    "ROBOTS_CACHE_GET_SQL",
+    "ROBOTS_CACHE_UPSERT_SQL",
 ]
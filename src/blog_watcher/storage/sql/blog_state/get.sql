@@ -1 +1,6 @@
-SELECT * FROM blog_state WHERE blog_id = ?;
+SELECT blog_id, etag, last_modified, url_fingerprint, feed_url, sitemap_url, recent_entry_keys,
+       last_checked_at, last_changed_at, consecutive_errors,
+       feed_etag, feed_last_modified, sitemap_etag, sitemap_last_modified,
+       feed_body_hash, sitemap_body_hash
+FROM blog_state
+WHERE blog_id = ?;
@@ -0,0 +1 @@
+UPDATE blog_state SET last_checked_at = ? WHERE blog_id = ?;
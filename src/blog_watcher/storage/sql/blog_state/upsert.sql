@@ -12,8 +12,10 @@ INSERT INTO blog_state (
     feed_etag,
     feed_last_modified,
     sitemap_etag,
-    sitemap_last_modified
-) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    sitemap_last_modified,
+    feed_body_hash,
+    sitemap_body_hash
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 ON CONFLICT(blog_id) DO UPDATE SET
     etag=excluded.etag,
     last_modified=excluded.last_modified,
@@ -27,4 +29,6 @@ ON CONFLICT(blog_id) DO UPDATE SET
     feed_etag=excluded.feed_etag,
     feed_last_modified=excluded.feed_last_modified,
     sitemap_etag=excluded.sitemap_etag,
-    sitemap_last_modified=excluded.sitemap_last_modified;
+    sitemap_last_modified=excluded.sitemap_last_modified,
+    feed_body_hash=excluded.feed_body_hash,
+    sitemap_body_hash=excluded.sitemap_body_hash;
@@ -5,5 +5,7 @@ INSERT INTO check_history (
     skipped,
     changed,
     url_fingerprint,
-    error_message
-) VALUES (?, ?, ?, ?, ?, ?, ?);
+    error_message,
+    repeat_count,
+    repeated_until
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
@@ -0,0 +1,15 @@
+UPDATE check_history
+SET repeat_count = repeat_count + 1,
+    repeated_until = ?
+WHERE id = (
+    SELECT id FROM check_history
+    WHERE blog_id = ?
+    ORDER BY checked_at DESC, id DESC
+    LIMIT 1
+)
+AND checked_at >= ?
+AND changed = 0
+AND error_message IS NULL
+AND skipped IS ?
+AND http_status IS ?
+AND url_fingerprint IS ?;
@@ -0,0 +1,6 @@
+SELECT id, blog_id, checked_at, http_status, skipped, changed,
+       url_fingerprint, error_message, repeat_count, repeated_until
+FROM check_history
+WHERE id > ?
+ORDER BY id
+LIMIT ?;
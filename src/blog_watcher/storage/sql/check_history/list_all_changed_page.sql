@@ -0,0 +1,9 @@
+SELECT id, blog_id, checked_at, http_status, skipped, changed,
+       url_fingerprint, error_message, repeat_count, repeated_until
+FROM check_history
+WHERE changed = 1
+  AND checked_at >= ?
+  AND checked_at <= ?
+  AND (checked_at < ? OR id > ?)
+ORDER BY checked_at DESC, id
+LIMIT ?;
@@ -0,0 +1,4 @@
+SELECT blog_id, bucket_start, http_status, checks, changes, errors
+FROM check_rollup_hourly
+WHERE blog_id = ?
+ORDER BY bucket_start DESC, http_status;
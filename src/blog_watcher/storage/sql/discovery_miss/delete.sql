@@ -0,0 +1,2 @@
+DELETE FROM discovery_miss
+WHERE blog_id = ? AND kind = ?;
@@ -0,0 +1,3 @@
+SELECT blog_id, kind, misses, last_probed_at, retry_after
+FROM discovery_miss
+WHERE blog_id = ? AND kind = ?;
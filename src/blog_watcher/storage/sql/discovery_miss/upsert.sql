@@ -0,0 +1,6 @@
+INSERT INTO discovery_miss (blog_id, kind, misses, last_probed_at, retry_after)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(blog_id, kind) DO UPDATE SET
+    misses=excluded.misses,
+    last_probed_at=excluded.last_probed_at,
+    retry_after=excluded.retry_after;
@@ -0,0 +1,2 @@
+DELETE FROM host_circuit
+WHERE host = ?;
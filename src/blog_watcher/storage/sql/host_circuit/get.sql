@@ -0,0 +1,3 @@
+SELECT host, state, failures, changed_at, retry_at
+FROM host_circuit
+WHERE host = ?;
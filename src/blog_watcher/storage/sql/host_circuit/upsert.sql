@@ -0,0 +1,7 @@
+INSERT INTO host_circuit (host, state, failures, changed_at, retry_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(host) DO UPDATE SET
+    state=excluded.state,
+    failures=excluded.failures,
+    changed_at=excluded.changed_at,
+    retry_at=excluded.retry_at;
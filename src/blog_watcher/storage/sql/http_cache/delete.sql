@@ -0,0 +1,2 @@
+DELETE FROM http_cache
+WHERE url = ?;
@@ -0,0 +1,4 @@
+DELETE FROM http_cache_body
+WHERE hash = ?1
+  AND NOT EXISTS (SELECT 1 FROM http_cache WHERE body_hash = ?1)
+RETURNING size;
@@ -0,0 +1,3 @@
+SELECT url, status, etag, last_modified, body_hash, stored_at, expires_at, last_used_at, encoding
+FROM http_cache
+WHERE url = ?;
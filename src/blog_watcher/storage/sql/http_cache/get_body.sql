@@ -0,0 +1,3 @@
+SELECT body
+FROM http_cache_body
+WHERE hash = ?;
@@ -0,0 +1,4 @@
+SELECT url, body_hash
+FROM http_cache
+ORDER BY last_used_at
+LIMIT ?;
@@ -0,0 +1,3 @@
+INSERT INTO http_cache_body (hash, body, size)
+VALUES (?, ?, ?)
+ON CONFLICT(hash) DO NOTHING;
@@ -0,0 +1,2 @@
+SELECT COALESCE(SUM(size), 0)
+FROM http_cache_body;
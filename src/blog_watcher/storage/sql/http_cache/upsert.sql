@@ -0,0 +1,11 @@
+INSERT INTO http_cache (url, status, etag, last_modified, body_hash, stored_at, expires_at, last_used_at, encoding)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    status=excluded.status,
+    etag=excluded.etag,
+    last_modified=excluded.last_modified,
+    body_hash=excluded.body_hash,
+    stored_at=excluded.stored_at,
+    expires_at=excluded.expires_at,
+    last_used_at=excluded.last_used_at,
+    encoding=excluded.encoding;
@@ -0,0 +1,19 @@
+CREATE TABLE IF NOT EXISTS check_rollup_hourly (
+    blog_id TEXT NOT NULL,
+    bucket_start TEXT NOT NULL,
+    http_status INTEGER NOT NULL,
+    checks INTEGER NOT NULL DEFAULT 0,
+    changes INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (blog_id, bucket_start, http_status)
+);
+
+CREATE TABLE IF NOT EXISTS check_rollup_daily (
+    blog_id TEXT NOT NULL,
+    bucket_start TEXT NOT NULL,
+    http_status INTEGER NOT NULL,
+    checks INTEGER NOT NULL DEFAULT 0,
+    changes INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (blog_id, bucket_start, http_status)
+);
@@ -0,0 +1,2 @@
+ALTER TABLE check_history ADD COLUMN repeat_count INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE check_history ADD COLUMN repeated_until TEXT;
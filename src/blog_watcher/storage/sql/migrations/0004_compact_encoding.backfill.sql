@@ -0,0 +1,19 @@
+INSERT INTO check_history (
+    id, blog_id, checked_at, http_status, skipped, changed, url_fingerprint, error_message, repeat_count, repeated_until
+)
+SELECT id,
+       blog_id,
+       iso_to_epoch_ms(checked_at),
+       http_status,
+       skipped,
+       changed,
+       hex_to_blob(url_fingerprint),
+       error_message,
+       repeat_count,
+       iso_to_epoch_ms(repeated_until)
+FROM check_history_legacy
+ORDER BY id
+LIMIT :batch_size;
+
+DELETE FROM check_history_legacy
+WHERE id IN (SELECT id FROM check_history_legacy ORDER BY id LIMIT :batch_size);
@@ -0,0 +1 @@
+DROP TABLE check_history_legacy;
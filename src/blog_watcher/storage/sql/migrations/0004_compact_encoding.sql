@@ -0,0 +1,104 @@
+-- Timestamps become INTEGER epoch milliseconds (UTC) and SHA-256 fingerprints
+-- 32-byte BLOBs. Fingerprints that are not 64-char hex are kept as TEXT.
+-- iso_to_epoch_ms() and hex_to_blob() are registered by the migration runner.
+
+CREATE TABLE blog_state_new (
+    blog_id TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    url_fingerprint BLOB,
+    feed_url TEXT,
+    sitemap_url TEXT,
+    recent_entry_keys TEXT,
+    last_checked_at INTEGER NOT NULL,
+    last_changed_at INTEGER,
+    consecutive_errors INTEGER NOT NULL DEFAULT 0,
+    feed_etag TEXT,
+    feed_last_modified TEXT,
+    sitemap_etag TEXT,
+    sitemap_last_modified TEXT
+);
+
+INSERT INTO blog_state_new
+SELECT blog_id,
+       etag,
+       last_modified,
+       hex_to_blob(url_fingerprint),
+       feed_url,
+       sitemap_url,
+       recent_entry_keys,
+       iso_to_epoch_ms(last_checked_at),
+       iso_to_epoch_ms(last_changed_at),
+       consecutive_errors,
+       feed_etag,
+       feed_last_modified,
+       sitemap_etag,
+       sitemap_last_modified
+FROM blog_state;
+
+DROP TABLE blog_state;
+ALTER TABLE blog_state_new RENAME TO blog_state;
+
+-- check_history can hold millions of rows, so it is not copied here. The old
+-- table is set aside and 0004_compact_encoding.backfill.sql moves its rows in
+-- chunks while new checks are written straight into the new table.
+DROP INDEX IF EXISTS idx_check_history_blog_time;
+DROP INDEX IF EXISTS idx_check_history_changed;
+ALTER TABLE check_history RENAME TO check_history_legacy;
+
+CREATE TABLE check_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    blog_id TEXT NOT NULL,
+    checked_at INTEGER NOT NULL,
+    http_status INTEGER,
+    skipped INTEGER NOT NULL DEFAULT 0,
+    changed INTEGER NOT NULL DEFAULT 0,
+    url_fingerprint BLOB,
+    error_message TEXT,
+    repeat_count INTEGER NOT NULL DEFAULT 1,
+    repeated_until INTEGER
+);
+
+-- Keep new ids above every legacy id so backfilled rows never collide.
+INSERT INTO sqlite_sequence (name, seq)
+SELECT 'check_history', seq FROM sqlite_sequence WHERE name = 'check_history_legacy';
+
+CREATE INDEX idx_check_history_blog_time
+ON check_history(blog_id, checked_at DESC);
+
+CREATE INDEX idx_check_history_changed
+ON check_history(changed) WHERE changed = 1;
+
+CREATE TABLE check_rollup_hourly_new (
+    blog_id TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    http_status INTEGER NOT NULL,
+    checks INTEGER NOT NULL DEFAULT 0,
+    changes INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (blog_id, bucket_start, http_status)
+);
+
+INSERT INTO check_rollup_hourly_new
+SELECT blog_id, iso_to_epoch_ms(bucket_start), http_status, checks, changes, errors
+FROM check_rollup_hourly;
+
+DROP TABLE check_rollup_hourly;
+ALTER TABLE check_rollup_hourly_new RENAME TO check_rollup_hourly;
+
+CREATE TABLE check_rollup_daily_new (
+    blog_id TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    http_status INTEGER NOT NULL,
+    checks INTEGER NOT NULL DEFAULT 0,
+    changes INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (blog_id, bucket_start, http_status)
+);
+
+INSERT INTO check_rollup_daily_new
+SELECT blog_id, iso_to_epoch_ms(bucket_start), http_status, checks, changes, errors
+FROM check_rollup_daily;
+
+DROP TABLE check_rollup_daily;
+ALTER TABLE check_rollup_daily_new RENAME TO check_rollup_daily;
@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS robots_cache (
+    host TEXT PRIMARY KEY,
+    status INTEGER,
+    sitemaps TEXT NOT NULL,
+    crawl_delay REAL,
+    fetched_at INTEGER NOT NULL,
+    expires_at INTEGER NOT NULL
+) WITHOUT ROWID;
@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS discovery_miss (
+    blog_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    misses INTEGER NOT NULL,
+    last_probed_at INTEGER NOT NULL,
+    retry_after INTEGER NOT NULL,
+    PRIMARY KEY (blog_id, kind)
+) WITHOUT ROWID;
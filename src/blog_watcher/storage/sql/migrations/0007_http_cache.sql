@@ -0,0 +1,20 @@
+CREATE TABLE IF NOT EXISTS http_cache (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    body_hash BLOB NOT NULL,
+    stored_at INTEGER NOT NULL,
+    expires_at INTEGER NOT NULL,
+    last_used_at INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_http_cache_last_used_at ON http_cache (last_used_at);
+CREATE INDEX IF NOT EXISTS idx_http_cache_body_hash ON http_cache (body_hash);
+
+-- Bodies are zlib-compressed and stored once per BLAKE2b hash of the bytes received, so URLs serving the same document share a row.
+CREATE TABLE IF NOT EXISTS http_cache_body (
+    hash BLOB PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL
+);
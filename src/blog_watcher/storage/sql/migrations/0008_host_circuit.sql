@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS host_circuit (
+    host TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    failures INTEGER NOT NULL,
+    changed_at INTEGER NOT NULL,
+    retry_at INTEGER
+) WITHOUT ROWID;
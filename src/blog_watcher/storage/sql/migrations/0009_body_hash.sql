@@ -0,0 +1,3 @@
+-- Digest of the last feed and sitemap bodies, so an identical 200 is not parsed again.
+ALTER TABLE blog_state ADD COLUMN feed_body_hash BLOB;
+ALTER TABLE blog_state ADD COLUMN sitemap_body_hash BLOB;
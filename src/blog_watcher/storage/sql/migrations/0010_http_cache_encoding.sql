@@ -0,0 +1,3 @@
+-- Bodies are now stored as the bytes received; the declared charset is kept per URL.
+-- Rows written before this were UTF-8 text, which a NULL encoding decodes correctly.
+ALTER TABLE http_cache ADD COLUMN encoding TEXT;
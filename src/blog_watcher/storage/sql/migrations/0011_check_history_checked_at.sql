@@ -0,0 +1,3 @@
+-- Retention finds expired raw checks by time across all blogs; without this
+-- index every batch scanned the whole table.
+CREATE INDEX IF NOT EXISTS idx_check_history_checked_at ON check_history (checked_at);
@@ -0,0 +1,4 @@
+-- Cross-blog change listings page by (checked_at DESC, id); an index in that
+-- order lets them stop at LIMIT instead of sorting every change first.
+DROP INDEX IF EXISTS idx_check_history_changed;
+CREATE INDEX idx_check_history_changed ON check_history (checked_at DESC, id) WHERE changed = 1;
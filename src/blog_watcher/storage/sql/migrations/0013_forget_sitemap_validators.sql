@@ -0,0 +1,7 @@
+-- Validators and body hashes stored for sitemap indexes let later checks skip
+-- the child sitemaps. They are no longer stored for indexes; clear the old
+-- ones so every blog re-reads its sitemap once.
+UPDATE blog_state
+SET sitemap_etag = NULL,
+    sitemap_last_modified = NULL,
+    sitemap_body_hash = NULL;
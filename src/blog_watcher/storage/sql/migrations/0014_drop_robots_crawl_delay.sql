@@ -0,0 +1,12 @@
+-- Crawl-delay was stored but never used to pace requests. robots_cache only
+-- holds a cache, so recreate it without the column instead of copying rows;
+-- each host's robots.txt is fetched again on its next check.
+DROP TABLE robots_cache;
+
+CREATE TABLE robots_cache (
+    host TEXT PRIMARY KEY,
+    status INTEGER,
+    sitemaps TEXT NOT NULL,
+    fetched_at INTEGER NOT NULL,
+    expires_at INTEGER NOT NULL
+) WITHOUT ROWID;
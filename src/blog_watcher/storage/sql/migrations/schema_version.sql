@@ -0,0 +1,10 @@
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    applied_at INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS schema_backfill (
+    version INTEGER PRIMARY KEY REFERENCES schema_version(version),
+    completed_at INTEGER
+);
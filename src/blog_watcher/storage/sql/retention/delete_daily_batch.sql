@@ -0,0 +1,7 @@
+DELETE FROM check_rollup_daily
+WHERE rowid IN (
+    SELECT rowid FROM check_rollup_daily
+    WHERE bucket_start < ?
+    ORDER BY rowid
+    LIMIT ?
+);
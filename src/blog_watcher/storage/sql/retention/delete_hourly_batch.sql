@@ -0,0 +1 @@
+DELETE FROM check_rollup_hourly WHERE rowid <= ? AND bucket_start < ?;
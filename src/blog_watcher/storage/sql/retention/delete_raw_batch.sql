@@ -0,0 +1,4 @@
+DELETE FROM check_history
+WHERE checked_at <= ?2
+  AND (checked_at < ?2 OR id <= ?3)
+  AND COALESCE(repeated_until, checked_at) < ?1;
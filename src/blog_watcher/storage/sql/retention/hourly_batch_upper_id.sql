@@ -0,0 +1,6 @@
+SELECT MAX(rowid) FROM (
+    SELECT rowid FROM check_rollup_hourly
+    WHERE bucket_start < ?
+    ORDER BY rowid
+    LIMIT ?
+);
@@ -0,0 +1 @@
+PRAGMA incremental_vacuum({pages});
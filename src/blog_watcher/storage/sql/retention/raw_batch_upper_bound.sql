@@ -0,0 +1,8 @@
+SELECT checked_at, id FROM (
+    SELECT checked_at, id FROM check_history
+    WHERE checked_at < ?1 AND COALESCE(repeated_until, checked_at) < ?1
+    ORDER BY checked_at, id
+    LIMIT ?2
+)
+ORDER BY checked_at DESC, id DESC
+LIMIT 1;
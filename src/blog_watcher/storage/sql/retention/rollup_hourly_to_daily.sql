@@ -0,0 +1,14 @@
+INSERT INTO check_rollup_daily (blog_id, bucket_start, http_status, checks, changes, errors)
+SELECT blog_id,
+       bucket_start - bucket_start % 86400000,
+       http_status,
+       SUM(checks),
+       SUM(changes),
+       SUM(errors)
+FROM check_rollup_hourly
+WHERE rowid <= ? AND bucket_start < ?
+GROUP BY 1, 2, 3
+ON CONFLICT(blog_id, bucket_start, http_status) DO UPDATE SET
+    checks = checks + excluded.checks,
+    changes = changes + excluded.changes,
+    errors = errors + excluded.errors;
@@ -0,0 +1,16 @@
+INSERT INTO check_rollup_hourly (blog_id, bucket_start, http_status, checks, changes, errors)
+SELECT blog_id,
+       checked_at - checked_at % 3600000,
+       COALESCE(http_status, 0),
+       SUM(repeat_count),
+       SUM(changed),
+       SUM(error_message IS NOT NULL)
+FROM check_history
+WHERE checked_at <= ?2
+  AND (checked_at < ?2 OR id <= ?3)
+  AND COALESCE(repeated_until, checked_at) < ?1
+GROUP BY 1, 2, 3
+ON CONFLICT(blog_id, bucket_start, http_status) DO UPDATE SET
+    checks = checks + excluded.checks,
+    changes = changes + excluded.changes,
+    errors = errors + excluded.errors;
@@ -0,0 +1,3 @@
+SELECT host, status, sitemaps, fetched_at, expires_at
+FROM robots_cache
+WHERE host = ?;
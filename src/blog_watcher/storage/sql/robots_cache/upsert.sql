@@ -0,0 +1,7 @@
+INSERT INTO robots_cache (host, status, sitemaps, fetched_at, expires_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(host) DO UPDATE SET
+    status=excluded.status,
+    sitemaps=excluded.sitemaps,
+    fetched_at=excluded.fetched_at,
+    expires_at=excluded.expires_at;
@@ -0,0 +1,98 @@
+"""Microbenchmark for the storage repositories.
+
+Run with ``python -m tests.benchmarks.bench_repository [--rows N]``. Each case runs
+inside one transaction so the numbers measure statement and row handling rather
+than fsync; ``add (autocommit)`` shows the per-call commit cost for comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from blog_watcher.storage import BlogState, BlogStateRepository, CheckHistory, CheckHistoryRepository, Database
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _state(index: int) -> BlogState:
+    return BlogState(
+        blog_id=f"https://blog-{index}.example.com",
+        etag=f'"etag-{index}"',
+        last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+        url_fingerprint=f"{index:064x}",
+        feed_url=f"https://blog-{index}.example.com/feed.xml",
+        sitemap_url=None,
+        recent_entry_keys='["a", "b", "c"]',
+        last_checked_at=_START + timedelta(seconds=index),
+        last_changed_at=_START,
+    )
+
+
+def _history(index: int) -> CheckHistory:
+    return CheckHistory(
+        blog_id=f"https://blog-{index % 100}.example.com",
+        checked_at=_START + timedelta(seconds=index),
+        http_status=200,
+        skipped=False,
+        changed=index % 10 == 0,
+        url_fingerprint=f"{index:064x}",
+        error_message=None,
+    )
+
+
+def _each[T](call: Callable[[T], object], items: list[T]) -> None:
+    for item in items:
+        call(item)
+
+
+def _measure(db: Database, rows: int, body: Callable[[], object], *, transaction: bool = True) -> float:
+    started = time.perf_counter()
+    if transaction:
+        with db.transaction():
+            body()
+    else:
+        body()
+    return rows / (time.perf_counter() - started)
+
+
+def run(rows: int) -> dict[str, float]:
+    states = [_state(index) for index in range(rows)]
+    entries = [_history(index) for index in range(rows)]
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        db = Database(Path(directory) / "bench.db")
+        db.initialize()
+        state_repo = BlogStateRepository(db)
+        history_repo = CheckHistoryRepository(db)
+        try:
+            results["upsert"] = _measure(db, rows, lambda: _each(state_repo.upsert, states))
+            results["upsert_many"] = _measure(db, rows, lambda: state_repo.upsert_many(states))
+            results["get"] = _measure(db, rows, lambda: _each(state_repo.get, [state.blog_id for state in states]))
+            results["get_many"] = _measure(db, rows, lambda: state_repo.get_many(state.blog_id for state in states))
+            results["add"] = _measure(db, rows, lambda: _each(history_repo.add, entries))
+            results["add_many"] = _measure(db, rows, lambda: history_repo.add_many(entries))
+            sample = entries[: max(rows // 20, 1)]
+            results["add (autocommit)"] = _measure(db, len(sample), lambda: _each(history_repo.add, sample), transaction=False)
+        finally:
+            db.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+    for name, per_second in run(args.rows).items():
+        print(f"{name:<18} {per_second:>12,.0f} rows/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -11,12 +11,12 @@ if TYPE_CHECKING:
 @dataclass(frozen=True)
 class BlogStateRow:
     blog_id: str
-    last_checked_at: str | None
-    url_fingerprint: str | None
+    last_checked_at: int | None
+    url_fingerprint: bytes | str | None
     feed_url: str | None
     sitemap_url: str | None
     recent_entry_keys: str | None
-    last_changed_at: str | None
+    last_changed_at: int | None
     consecutive_errors: int
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 import httpx
@@ -33,7 +34,8 @@ def state_repo(database: Database) -> BlogStateRepository:
 @pytest.fixture
 async def fetcher(httpserver: HTTPServer) -> AsyncIterator[HttpFetcher]:
     async with httpx.AsyncClient(base_url=httpserver.url_for("/")) as client:
-        yield HttpFetcher(client)
+        # Tests change server responses between back-to-back checks, which the per-cycle memo would hide.
+        yield HttpFetcher(client, memo_ttl=timedelta(0))
 
 
 @pytest.fixture
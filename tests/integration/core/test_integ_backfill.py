@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from blog_watcher.core import BackfillScheduler
+from blog_watcher.storage import CheckHistoryRepository, Database, SchemaBackfill
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = [pytest.mark.integration]
+
+
+async def test_run_once_drains_pending_backfills(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    connection = sqlite3.connect(db_path)
+    connection.executescript(
+        "CREATE TABLE check_history (id INTEGER PRIMARY KEY AUTOINCREMENT, blog_id TEXT NOT NULL, checked_at TEXT NOT NULL,"
+        " http_status INTEGER, skipped INTEGER NOT NULL DEFAULT 0, changed INTEGER NOT NULL DEFAULT 0, url_fingerprint TEXT, error_message TEXT);"
+        "INSERT INTO check_history (blog_id, checked_at) VALUES"
+        " ('blog-1', '2024-01-01T00:00:00+00:00'), ('blog-1', '2024-01-01T00:01:00+00:00'), ('blog-1', '2024-01-01T00:02:00+00:00');",
+    )
+    connection.close()
+    db = Database(db_path)
+    db.initialize()
+    backfill = SchemaBackfill(db, batch_size=2)
+    scheduler = BackfillScheduler(backfill)
+
+    try:
+        await scheduler.run_once()
+
+        assert backfill.pending() == []
+        assert len(CheckHistoryRepository(db).list_by_blog_id("blog-1")) == 3
+    finally:
+        db.close()
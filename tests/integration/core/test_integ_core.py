@@ -1,14 +1,21 @@
-from datetime import UTC, datetime
+import asyncio
+import sqlite3
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+import httpx
 import pytest
 from freezegun import freeze_time
 
 from blog_watcher.config import AppConfig, BlogConfig, SlackConfig, StaticConfigProvider
-from blog_watcher.core import BlogWatcher
+from blog_watcher.core import AdaptivePolling, BlogWatcher, ErrorBackoff, PollingPolicy, QueueScheduler
 from blog_watcher.detection import DetectionResult
+from blog_watcher.detection.http_fetcher import FetchStatusError
+from blog_watcher.observability import MetricsRegistry
 from blog_watcher.storage import BlogState, BlogStateRepository, CheckHistory, CheckHistoryRepository, Database
-from tests.test_utils.mocks.core import CapturingNotifier, SequenceDetector
+from blog_watcher.storage.sql import BLOG_STATE_TOUCH_SQL, BLOG_STATE_UPSERT_SQL
+from tests.test_utils.mocks.core import CapturingNotifier, DelayedDetector, FailingDetector, FailingNotifier, SequenceDetector
 
 pytestmark = [pytest.mark.integration]
 
@@ -60,3 +67,305 @@ async def test_check_cycle_persists_state_and_history(tmp_path: Path) -> None:
         assert len(notifier.notifications) == 1
     finally:
         db.close()
+
+
+async def test_compact_mode_folds_unchanged_checks(tmp_path: Path) -> None:
+    db = Database(tmp_path / "test.db")
+    db.initialize()
+    state_repo = BlogStateRepository(db, skip_unchanged_writes=True)
+    history_repo = CheckHistoryRepository(db, compact_unchanged=True)
+
+    blog_id = "https://example.com/blog"
+    results = [
+        DetectionResult(blog_id=blog_id, changed=True, http_status=200, url_fingerprint="fp-1", is_initial=True),
+        DetectionResult(blog_id=blog_id, changed=False, http_status=304, url_fingerprint="fp-1"),
+        DetectionResult(blog_id=blog_id, changed=False, http_status=304, url_fingerprint="fp-1"),
+    ]
+    config = AppConfig(
+        slack=SlackConfig(webhook_url="https://example.invalid/webhook"),
+        blogs=[BlogConfig(name="Example Blog", url=blog_id)],
+    )
+    watcher = BlogWatcher(
+        config_provider=StaticConfigProvider(config),
+        detector=SequenceDetector(results),
+        notifier=CapturingNotifier(),
+        state_repo=state_repo,
+        history_repo=history_repo,
+    )
+
+    try:
+        for _ in results:
+            await watcher.check_all()
+
+        history = history_repo.list_by_blog_id(blog_id)
+        assert [entry.repeat_count for entry in history] == [2, 1]
+        state = state_repo.get(blog_id)
+        assert state is not None
+        assert state.last_checked_at == history[0].repeated_until
+    finally:
+        db.close()
+
+
+async def test_compact_mode_skips_unchanged_state_writes_under_queue_scheduler(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db = Database(tmp_path / "test.db")
+    db.initialize()
+    state_repo = BlogStateRepository(db, skip_unchanged_writes=True)
+    history_repo = CheckHistoryRepository(db, compact_unchanged=True)
+    blog = BlogConfig(name="Example Blog", url="https://example.com/blog")
+    detector = SequenceDetector(
+        [
+            DetectionResult(blog_id=blog.blog_id, changed=True, http_status=200, url_fingerprint="fp-1", is_initial=True),
+            DetectionResult(blog_id=blog.blog_id, changed=False, http_status=200, url_fingerprint="fp-1"),
+        ],
+    )
+    watcher = BlogWatcher(
+        config_provider=StaticConfigProvider(AppConfig(slack=SlackConfig(webhook_url="https://example.invalid/webhook"), blogs=[blog])),
+        detector=detector,
+        notifier=CapturingNotifier(),
+        state_repo=state_repo,
+        history_repo=history_repo,
+    )
+    await watcher.check_blog(blog)
+    queries: list[str] = []
+    state_written = asyncio.Event()
+    original_execute = db.execute
+
+    def recording_execute(query: str, params: Sequence[object] | None = None) -> sqlite3.Cursor:
+        queries.append(query)
+        if query in (BLOG_STATE_TOUCH_SQL, BLOG_STATE_UPSERT_SQL):
+            state_written.set()
+        return original_execute(query, params)
+
+    monkeypatch.setattr(db, "execute", recording_execute)
+    scheduler = QueueScheduler(interval_seconds=60, watcher=watcher, workers=1)
+
+    try:
+        await scheduler.start()
+        async with asyncio.timeout(5):
+            await state_written.wait()
+        await scheduler.shutdown()
+
+        assert BLOG_STATE_TOUCH_SQL in queries
+        assert BLOG_STATE_UPSERT_SQL not in queries
+    finally:
+        db.close()
+
+
+async def test_adaptive_polling_skips_blogs_that_are_not_due(tmp_path: Path) -> None:
+    db = Database(tmp_path / "test.db")
+    db.initialize()
+    history_repo = CheckHistoryRepository(db)
+    blog_id = "https://example.com/blog"
+    detector = SequenceDetector(
+        [
+            DetectionResult(blog_id=blog_id, changed=True, http_status=200, url_fingerprint="fp-1", is_initial=True),
+            DetectionResult(blog_id=blog_id, changed=False, http_status=304, url_fingerprint="fp-1"),
+        ],
+    )
+    config = AppConfig(
+        slack=SlackConfig(webhook_url="https://example.invalid/webhook"),
+        blogs=[BlogConfig(name="Example Blog", url=blog_id)],
+    )
+    watcher = BlogWatcher(
+        config_provider=StaticConfigProvider(config),
+        detector=detector,
+        notifier=CapturingNotifier(),
+        state_repo=BlogStateRepository(db),
+        history_repo=history_repo,
+        polling=AdaptivePolling(PollingPolicy(min_interval=timedelta(minutes=5), jitter=0.0), history_repo),
+    )
+
+    try:
+        with freeze_time("2025-01-27T12:00:00Z") as frozen:
+            await watcher.check_all()
+            frozen.tick(timedelta(minutes=4))
+            await watcher.check_all()
+            assert len(detector.calls) == 1
+
+            frozen.tick(timedelta(minutes=1))
+            await watcher.check_all()
+            assert len(detector.calls) == 2
+    finally:
+        db.close()
+
+
+def _deadline_watcher(  # noqa: PLR0913
+    db: Database,
+    detector: DelayedDetector,
+    urls: list[str],
+    metrics: MetricsRegistry,
+    *,
+    check_timeout: timedelta | None = None,
+    cycle_deadline: timedelta | None = None,
+) -> BlogWatcher:
+    config = AppConfig(
+        slack=SlackConfig(webhook_url="https://example.invalid/webhook"),
+        blogs=[BlogConfig(name=f"Blog {index}", url=url) for index, url in enumerate(urls)],
+    )
+    return BlogWatcher(
+        config_provider=StaticConfigProvider(config),
+        detector=detector,
+        notifier=CapturingNotifier(),
+        state_repo=BlogStateRepository(db),
+        history_repo=CheckHistoryRepository(db),
+        check_timeout=check_timeout,
+        cycle_deadline=cycle_deadline,
+        metrics=metrics,
+    )
+
+
+async def test_timed_out_check_does_not_block_the_cycle(tmp_path: Path) -> None:
+    db = Database(tmp_path / "test.db")
+    db.initialize()
+    urls = ["https://hung.example.com", "https://ok.example.com"]
+    detector = DelayedDetector({urls[0]: 5.0})
+    metrics = MetricsRegistry()
+    watcher = _deadline_watcher(db, detector, urls, metrics, check_timeout=timedelta(milliseconds=50))
+
+    try:
+        await watcher.check_all()
+        assert detector.calls == urls
+        assert BlogStateRepository(db).get(urls[0]) is None
+        assert BlogStateRepository(db).get(urls[1]) is not None
+        assert metrics.snapshot()["checks_timed_out"] == 1
+        assert CheckHistoryRepository(db).list_by_blog_id(urls[0])[0].error_message == "check timed out"
+    finally:
+        db.close()
+
+
+async def test_cycle_deadline_defers_remaining_blogs_to_the_next_cycle(tmp_path: Path) -> None:
+    db = Database(tmp_path / "test.db")
+    db.initialize()
+    urls = [f"https://blog-{index}.example.com" for index in range(4)]
+    detector = DelayedDetector({urls[0]: 0.3})
+    metrics = MetricsRegistry()
+    watcher = _deadline_watcher(db, detector, urls, metrics, cycle_deadline=timedelta(milliseconds=100))
+
+    try:
+        await watcher.check_all()
+        assert detector.calls == urls[:1]
+        assert metrics.snapshot()["checks_deferred"] == 3
+
+        detector.calls.clear()
+        await watcher.check_all()
+        assert detector.calls[:3] == urls[1:]
+    finally:
+        db.close()
+
+
+async def test_failing_blog_is_recorded_and_backed_off_without_stopping_the_cycle(tmp_path: Path) -> None:
+    db = Database(tmp_path / "test.db")
+    db.initialize()
+    urls = ["https://broken.example.com", "https://ok.example.com"]
+    state_repo = BlogStateRepository(db)
+    history_repo = CheckHistoryRepository(db)
+    state_repo.upsert(
+        BlogState(
+            blog_id=urls[0],
+            etag=None,
+            last_modified=None,
+            url_fingerprint=None,
+            feed_url=None,
+            sitemap_url=None,
+            recent_entry_keys=None,
+            last_checked_at=datetime(2025, 1, 27, 11, 0, tzinfo=UTC),
+            last_changed_at=None,
+            consecutive_errors=2,
+        )
+    )
+    detector = FailingDetector({urls[0]: FetchStatusError(urls[0], 404)})
+    metrics = MetricsRegistry()
+    watcher = BlogWatcher(
+        config_provider=StaticConfigProvider(
+            AppConfig(
+                slack=SlackConfig(webhook_url="https://example.invalid/webhook"),
+                blogs=[BlogConfig(name=f"Blog {index}", url=url) for index, url in enumerate(urls)],
+            )
+        ),
+        detector=detector,
+        notifier=CapturingNotifier(),
+        state_repo=state_repo,
+        history_repo=history_repo,
+        error_backoff=ErrorBackoff(base=timedelta(minutes=1)),
+        metrics=metrics,
+    )
+
+    try:
+        with freeze_time("2025-01-27T12:00:00Z") as frozen:
+            await watcher.check_all()
+            assert detector.calls == urls
+            failed = history_repo.list_by_blog_id(urls[0])[0]
+            assert (failed.http_status, failed.error_message) == (404, f"FetchStatusError: HTTP 404 for {urls[0]}")
+            broken = state_repo.get(urls[0])
+            assert broken is not None
+            assert broken.consecutive_errors == 3
+            assert metrics.snapshot()["checks_failed"] == 1
+
+            # Three errors in a row back off for 4 minutes.
+            frozen.tick(timedelta(minutes=3))
+            await watcher.check_all()
+            assert detector.calls == [*urls, urls[1]]
+
+            frozen.tick(timedelta(minutes=1))
+            del detector.errors[urls[0]]
+            await watcher.check_all()
+            assert detector.calls[-2:] == urls
+            recovered = state_repo.get(urls[0])
+            assert recovered is not None
+            assert recovered.consecutive_errors == 0
+    finally:
+        db.close()
+
+
+async def test_failing_notification_is_resent_on_the_next_cycle(tmp_path: Path) -> None:
+    db = Database(tmp_path / "test.db")
+    db.initialize()
+    urls = ["https://first.example.com", "https://second.example.com"]
+    state_repo = BlogStateRepository(db)
+    history_repo = CheckHistoryRepository(db)
+    detector = SequenceDetector(
+        [
+            *(DetectionResult(blog_id=url, changed=True, http_status=200, url_fingerprint="fp-2") for url in urls),
+            *(DetectionResult(blog_id=url, changed=False, http_status=304, url_fingerprint="fp-2") for url in urls),
+        ],
+    )
+    request = httpx.Request("POST", "https://example.invalid/webhook")
+    notifier = FailingNotifier(
+        {urls[0]: httpx.HTTPStatusError("Server error", request=request, response=httpx.Response(503, request=request))},
+    )
+    metrics = MetricsRegistry()
+    watcher = BlogWatcher(
+        config_provider=StaticConfigProvider(
+            AppConfig(
+                slack=SlackConfig(webhook_url="https://example.invalid/webhook"),
+                blogs=[BlogConfig(name=f"Blog {index}", url=url) for index, url in enumerate(urls)],
+            )
+        ),
+        detector=detector,
+        notifier=notifier,
+        state_repo=state_repo,
+        history_repo=history_repo,
+        metrics=metrics,
+    )
+
+    try:
+        await watcher.check_all()
+
+        assert [notification.url for notification in notifier.notifications] == urls[1:]
+        assert history_repo.list_by_blog_id(urls[0])[0].error_message is None
+        state = state_repo.get(urls[0])
+        assert state is not None
+        assert state.consecutive_errors == 0
+        assert metrics.snapshot()["notifications_failed"] == 1
+        assert metrics.snapshot()["checks_failed"] == 0
+
+        notifier.errors.clear()
+        await watcher.check_all()
+
+        assert detector.calls == urls * 2
+        assert [(notification.title, notification.url) for notification in notifier.notifications] == [
+            ("Blog updated: Blog 1", urls[1]),
+            ("Blog updated: Blog 0", urls[0]),
+        ]
+    finally:
+        db.close()
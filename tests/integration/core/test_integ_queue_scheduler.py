@@ -0,0 +1,108 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from blog_watcher.config import BlogConfig
+from blog_watcher.core import QueueScheduler, spread_offset
+from blog_watcher.observability import MetricsRegistry
+from tests.test_utils.mocks import RecordingRunner
+
+pytestmark = [pytest.mark.integration]
+
+
+def _blogs(count: int) -> list[BlogConfig]:
+    return [BlogConfig(name=f"Blog {index}", url=f"https://blog-{index}.example.com") for index in range(count)]
+
+
+async def test_due_blogs_are_checked_by_a_bounded_worker_pool() -> None:
+    runner = RecordingRunner(_blogs(6), delay=0.02, next_in=timedelta(milliseconds=50))
+    scheduler = QueueScheduler(interval_seconds=60, watcher=runner, workers=2)
+
+    await scheduler.start()
+    async with asyncio.timeout(5):
+        await runner.wait_until(lambda: len(runner.calls) == 6 and all(calls >= 2 for calls in runner.calls.values()))
+    await scheduler.shutdown()
+
+    assert runner.max_in_flight == 2
+
+
+async def test_failing_blog_does_not_stop_the_workers() -> None:
+    blogs = _blogs(2)
+    runner = RecordingRunner(blogs, next_in=timedelta(milliseconds=20), failing={blogs[0].blog_id})
+    scheduler = QueueScheduler(interval_seconds=60, watcher=runner, workers=1)
+
+    await scheduler.start()
+    async with asyncio.timeout(5):
+        await runner.wait_until(lambda: runner.calls[blogs[1].blog_id] >= 3)
+    await scheduler.shutdown()
+
+    # The failed blog falls back to the regular interval; the worker keeps serving the other one.
+    assert runner.calls[blogs[0].blog_id] == 1
+
+
+async def test_shutdown_waits_for_inflight_checks() -> None:
+    runner = RecordingRunner(_blogs(1), delay=0.2)
+    scheduler = QueueScheduler(interval_seconds=60, watcher=runner, workers=1)
+
+    await scheduler.start()
+    await asyncio.sleep(0.05)
+    await scheduler.shutdown()
+
+    assert runner.in_flight == 0
+    assert sum(runner.calls.values()) == 1
+
+
+@pytest.mark.slow
+async def test_reloaded_blog_list_adds_and_drops_blogs() -> None:
+    first, second = _blogs(2)
+    runner = RecordingRunner([first], next_in=timedelta(milliseconds=50))
+    scheduler = QueueScheduler(interval_seconds=1, watcher=runner, workers=1)
+
+    await scheduler.start()
+    await asyncio.sleep(0.2)
+    runner.blogs = [second]
+    await asyncio.sleep(1.0)
+    checked_first = runner.calls[first.blog_id]
+    await asyncio.sleep(0.3)
+    await scheduler.shutdown()
+
+    assert runner.calls[first.blog_id] == checked_first
+    assert runner.calls[second.blog_id] >= 2
+
+
+@pytest.mark.slow
+async def test_spread_mode_checks_each_blog_at_its_offset() -> None:
+    runner = RecordingRunner(_blogs(4))
+    scheduler = QueueScheduler(interval_seconds=2, watcher=runner, workers=4, spread=True)
+
+    await scheduler.start()
+    async with asyncio.timeout(5):
+        await runner.wait_until(lambda: len(runner.first_checked_at) == 4)
+    await scheduler.shutdown()
+
+    for blog_id, checked_at in runner.first_checked_at.items():
+        drift = (checked_at - spread_offset(blog_id, 2)) % 2
+        assert min(drift, 2 - drift) < 0.25
+
+
+class _CountingRegistry(MetricsRegistry):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reports = 0
+
+    def report(self) -> dict[str, int]:
+        self.reports += 1
+        return super().report()
+
+
+@pytest.mark.slow
+async def test_metrics_are_reported_to_the_injected_registry() -> None:
+    metrics = _CountingRegistry()
+    scheduler = QueueScheduler(interval_seconds=1, watcher=RecordingRunner(_blogs(1)), workers=1, metrics=metrics)
+
+    await scheduler.start()
+    await asyncio.sleep(1.3)
+    await scheduler.shutdown()
+
+    assert metrics.reports >= 1
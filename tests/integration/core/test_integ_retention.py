@@ -0,0 +1,29 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from blog_watcher.core import RetentionScheduler
+from blog_watcher.storage import CheckHistoryRepository, CheckRollupRepository, Database, HistoryRetention, RetentionPolicy
+from tests.test_utils.factories import CheckHistoryFactory
+
+pytestmark = [pytest.mark.integration]
+
+
+async def test_run_once_drains_every_batch(tmp_path: Path) -> None:
+    db = Database(tmp_path / "test.db")
+    db.initialize()
+    history_repo = CheckHistoryRepository(db)
+    old = datetime.now(UTC) - timedelta(days=30)
+    for minute in range(7):
+        history_repo.add(CheckHistoryFactory.build(checked_at=old + timedelta(minutes=minute)))
+    scheduler = RetentionScheduler(interval_seconds=3600, retention=HistoryRetention(db, RetentionPolicy(batch_size=3)))
+
+    try:
+        await scheduler.run_once()
+
+        assert history_repo.list_by_blog_id("https://example.com") == []
+        hourly = CheckRollupRepository(db).list_hourly_by_blog_id("https://example.com")
+        assert sum(rollup.checks for rollup in hourly) == 7
+    finally:
+        db.close()
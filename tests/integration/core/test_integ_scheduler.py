@@ -3,7 +3,8 @@ import asyncio
 import pytest
 
 from blog_watcher.core import WatcherScheduler
-from tests.test_utils.mocks.core import CountingWatcher
+from blog_watcher.observability import MetricsRegistry
+from tests.test_utils.mocks.core import CountingWatcher, SlowWatcher
 
 pytestmark = [pytest.mark.integration]
 
@@ -31,3 +32,18 @@ async def test_double_start_does_not_duplicate_loop() -> None:
     await scheduler.shutdown()
 
     assert watcher.calls == 2
+
+
+@pytest.mark.slow
+async def test_overrunning_cycle_skips_ticks_instead_of_overlapping() -> None:
+    watcher = SlowWatcher(duration=1.5)
+    metrics = MetricsRegistry()
+    scheduler = WatcherScheduler(interval_seconds=1, watcher=watcher, metrics=metrics)
+
+    await scheduler.start()
+    await asyncio.sleep(3.2)
+    await scheduler.shutdown()
+
+    # Cycles start at 1s and 3s; the tick at 2s falls inside the first cycle and is skipped.
+    assert watcher.calls == 2
+    assert metrics.snapshot()["cycles_overrun"] >= 1
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 from blog_watcher.config.models import BlogConfig
+from blog_watcher.detection.http_fetcher import FetchStatusError
 from tests.test_utils.helpers import read_fixture
 
 if TYPE_CHECKING:
@@ -148,3 +149,16 @@ async def test_sitemap_url_persisted_in_state(
     persisted = state_repo.get(blog.blog_id)
     assert persisted is not None
     assert persisted.sitemap_url == httpserver.url_for("/sitemap.xml")
+
+
+async def test_error_status_on_the_blog_page_fails_the_check(
+    detector: ChangeDetector, httpserver: HTTPServer, state_repo: BlogStateRepository
+) -> None:
+    httpserver.expect_request("/").respond_with_data("gone", status=404)
+    blog = BlogConfig(name="example", url=httpserver.url_for("/"))
+
+    with pytest.raises(FetchStatusError) as excinfo:
+        await detector.check(blog)
+
+    assert excinfo.value.status_code == 404
+    assert state_repo.get(blog.blog_id) is None
@@ -1,4 +1,6 @@
-from collections.abc import AsyncIterator
+import threading
+from collections.abc import AsyncIterator, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import httpx
 import pytest
@@ -6,6 +8,7 @@ from pytest_httpserver import HTTPServer
 from werkzeug import Request, Response
 
 from blog_watcher.detection.http_fetcher import HttpFetcher
+from blog_watcher.observability import MetricsRegistry
 from tests.test_utils.helpers import read_fixture
 
 
@@ -38,7 +41,7 @@ class TestHttpFetcherIntegrationSuite:
         result = await fetcher.fetch("/feed.xml")
 
         assert result.status_code == 200
-        assert result.content == content
+        assert result.text == content
         assert result.etag == '"feed-version-1"'
         assert result.last_modified == "Mon, 27 Jan 2025 12:00:00 GMT"
         assert result.is_modified is True
@@ -51,7 +54,7 @@ class TestHttpFetcherIntegrationSuite:
 
         result = await fetcher_with_redirects.fetch("/old-feed")
 
-        assert result.content == content
+        assert result.text == content
 
     async def test_conditional_get_with_etag(self, fetcher: HttpFetcher, httpserver: HTTPServer) -> None:
         content = read_fixture("feeds/rss_valid.xml")
@@ -104,4 +107,43 @@ class TestHttpFetcherIntegrationSuite:
         result = await fetcher.fetch("/feed")
 
         assert result.status_code == 200
-        assert result.content == content
+        assert result.text == content
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b"<rss/>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - BaseHTTPRequestHandler signature
+        pass
+
+
+@pytest.fixture
+def keepalive_origin() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+async def test_fetches_to_one_origin_reuse_the_connection(keepalive_origin: str) -> None:
+    registry = MetricsRegistry()
+
+    async with httpx.AsyncClient() as client:
+        fetcher = HttpFetcher(client, metrics=registry)
+        await fetcher.fetch(f"{keepalive_origin}/feed.xml")
+        await fetcher.fetch(f"{keepalive_origin}/sitemap.xml")
+
+    snapshot = registry.snapshot()
+    assert snapshot[f"http_requests:{keepalive_origin}"] == 2
+    assert snapshot[f"http_connections_opened:{keepalive_origin}"] == 1
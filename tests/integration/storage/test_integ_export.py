@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import csv
+import json
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from blog_watcher.storage import BlogStateRepository, CheckHistoryRepository, Database, ExportFormat, SchemaBackfill, export_database
+from tests.test_utils.factories import BlogStateFactory, CheckHistoryFactory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = [pytest.mark.integration]
+
+
+@pytest.fixture
+def populated(tmp_path: Path) -> Path:
+    db_path = tmp_path / "live.sqlite"
+    db = Database(db_path)
+    db.initialize()
+    BlogStateRepository(db).upsert(BlogStateFactory.build(blog_id="blog-1", url_fingerprint="ab" * 32))
+    CheckHistoryRepository(db).add_many(
+        CheckHistoryFactory.build(blog_id="blog-1", checked_at=datetime(2024, 1, 1, tzinfo=UTC) + timedelta(minutes=minute)) for minute in range(5)
+    )
+    db.close()
+    return db_path
+
+
+def test_sqlite_export_is_a_readable_copy(populated: Path, tmp_path: Path) -> None:
+    live = Database(populated)
+    live.connect()
+    snapshot_path = tmp_path / "snapshot.sqlite"
+
+    try:
+        export_database(populated, snapshot_path, ExportFormat.SQLITE)
+    finally:
+        live.close()
+
+    snapshot = Database(snapshot_path)
+    try:
+        assert [state.blog_id for state in BlogStateRepository(snapshot).list_all()] == ["blog-1"]
+        assert len(CheckHistoryRepository(snapshot).list_by_blog_id("blog-1")) == 5
+    finally:
+        snapshot.close()
+
+
+def test_jsonl_export_streams_every_row(populated: Path, tmp_path: Path) -> None:
+    written = export_database(populated, tmp_path / "out", ExportFormat.JSONL, chunk_size=2)
+
+    assert [path.name for path in written] == ["blog_state.jsonl", "check_history.jsonl"]
+    states = [json.loads(line) for line in written[0].read_text(encoding="utf-8").splitlines()]
+    assert states[0]["blog_id"] == "blog-1"
+    assert states[0]["url_fingerprint"] == "ab" * 32
+    history = [json.loads(line) for line in written[1].read_text(encoding="utf-8").splitlines()]
+    assert [entry["checked_at"] for entry in history] == [f"2024-01-01T00:0{minute}:00+00:00" for minute in range(5)]
+
+
+def test_csv_export_writes_header_and_rows(populated: Path, tmp_path: Path) -> None:
+    written = export_database(populated, tmp_path / "out", ExportFormat.CSV)
+
+    with written[1].open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == 5
+    assert rows[0]["blog_id"] == "blog-1"
+
+
+def test_export_includes_history_still_awaiting_backfill(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.sqlite"
+    connection = sqlite3.connect(db_path)
+    connection.executescript(
+        """
+        CREATE TABLE check_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, blog_id TEXT NOT NULL, checked_at TEXT NOT NULL, http_status INTEGER,
+            skipped INTEGER NOT NULL DEFAULT 0, changed INTEGER NOT NULL DEFAULT 0, url_fingerprint TEXT, error_message TEXT
+        );
+        INSERT INTO check_history (blog_id, checked_at, http_status)
+        VALUES ('blog-1', '2024-01-01T00:00:00+00:00', 200), ('blog-1', '2024-01-01T00:01:00+00:00', 304);
+        """
+    )
+    connection.close()
+    db = Database(db_path)
+    db.initialize()
+    pending = SchemaBackfill(db).pending()
+    db.close()
+
+    written = export_database(db_path, tmp_path / "out", ExportFormat.JSONL)
+
+    assert pending == [4]
+    history = [json.loads(line) for line in written[1].read_text(encoding="utf-8").splitlines()]
+    assert [entry["http_status"] for entry in history] == [200, 304]
+
+
+def test_export_refuses_to_overwrite(populated: Path) -> None:
+    with pytest.raises(FileExistsError):
+        export_database(populated, populated, ExportFormat.SQLITE)
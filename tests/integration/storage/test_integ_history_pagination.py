@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from blog_watcher.storage import CheckHistoryRepository, Database
+from blog_watcher.storage.sql import CHECK_HISTORY_LIST_ALL_CHANGED_PAGE_SQL, CHECK_HISTORY_LIST_PAGE_SQL
+from tests.test_utils.factories import CheckHistoryFactory
+
+if TYPE_CHECKING:
+    from blog_watcher.storage import CheckHistory
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def history_repo(database: Database) -> CheckHistoryRepository:
+    repo = CheckHistoryRepository(database)
+    for minute in range(10):
+        repo.add(CheckHistoryFactory.build(blog_id="blog-1", checked_at=START + timedelta(minutes=minute), changed=minute % 3 == 0))
+    repo.add(CheckHistoryFactory.build(blog_id="blog-2", checked_at=START, changed=True))
+    return repo
+
+
+def _minutes(entries: list[CheckHistory]) -> list[int]:
+    return [int((entry.checked_at - START).total_seconds() // 60) for entry in entries]
+
+
+def test_list_page_walks_history_with_cursor(history_repo: CheckHistoryRepository) -> None:
+    first = history_repo.list_page("blog-1", limit=4)
+    second = history_repo.list_page("blog-1", limit=4, cursor=first.next_cursor)
+    third = history_repo.list_page("blog-1", limit=4, cursor=second.next_cursor)
+
+    assert _minutes(first.entries) == [9, 8, 7, 6]
+    assert _minutes(second.entries) == [5, 4, 3, 2]
+    assert _minutes(third.entries) == [1, 0]
+    assert third.next_cursor is None
+
+
+def test_list_page_applies_time_bounds(history_repo: CheckHistoryRepository) -> None:
+    page = history_repo.list_page("blog-1", since=START + timedelta(minutes=2), until=START + timedelta(minutes=5))
+
+    assert _minutes(page.entries) == [4, 3, 2]
+
+
+def test_list_page_changed_only(history_repo: CheckHistoryRepository) -> None:
+    page = history_repo.list_page("blog-1", changed_only=True)
+
+    assert _minutes(page.entries) == [9, 6, 3, 0]
+
+
+def test_list_page_keeps_rows_sharing_a_timestamp(database: Database) -> None:
+    repo = CheckHistoryRepository(database)
+    for status in (200, 304, 500):
+        repo.add(CheckHistoryFactory.build(blog_id="blog-1", checked_at=START, http_status=status))
+
+    first = repo.list_page("blog-1", limit=2)
+    second = repo.list_page("blog-1", limit=2, cursor=first.next_cursor)
+
+    assert [entry.http_status for entry in first.entries + second.entries] == [200, 304, 500]
+
+
+def test_list_page_rejects_non_positive_limit(history_repo: CheckHistoryRepository) -> None:
+    with pytest.raises(ValueError, match="limit must be positive"):
+        history_repo.list_page("blog-1", limit=0)
+
+
+def test_iter_by_blog_id_yields_every_entry_in_pages(history_repo: CheckHistoryRepository) -> None:
+    entries = list(history_repo.iter_by_blog_id("blog-1", page_size=3))
+
+    assert _minutes(entries) == list(range(9, -1, -1))
+
+
+def test_list_by_blog_id_honours_limit(history_repo: CheckHistoryRepository) -> None:
+    assert _minutes(history_repo.list_by_blog_id("blog-1", limit=2)) == [9, 8]
+
+
+def test_iter_changes_spans_all_blogs(history_repo: CheckHistoryRepository) -> None:
+    entries = list(history_repo.iter_changes(page_size=2))
+
+    assert [(entry.blog_id, _minutes([entry])[0]) for entry in entries] == [
+        ("blog-1", 9),
+        ("blog-1", 6),
+        ("blog-1", 3),
+        ("blog-1", 0),
+        ("blog-2", 0),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("query", "index"),
+    [
+        pytest.param(CHECK_HISTORY_LIST_PAGE_SQL, "idx_check_history_blog_time", id="blog_page"),
+        pytest.param(CHECK_HISTORY_LIST_ALL_CHANGED_PAGE_SQL, "idx_check_history_changed", id="all_changed_page"),
+    ],
+)
+def test_page_queries_use_history_indexes(database: Database, query: str, index: str) -> None:
+    plan = database.execute(f"EXPLAIN QUERY PLAN {query}", ["x"] * query.count("?")).fetchall()
+
+    assert any(index in detail for *_, detail in plan)
+    assert not any("TEMP B-TREE" in detail for *_, detail in plan)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from blog_watcher.storage import BlogStateRepository, CheckHistoryRepository, Database, SchemaBackfill
+from blog_watcher.storage.migrations import Migration, apply_migrations, current_version, load_migrations, pending_backfills
+from tests.test_utils.factories import CheckHistoryFactory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_FINGERPRINT = "ab" * 32
+
+_BASELINE_SCHEMA = """
+CREATE TABLE blog_state (
+    blog_id TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, url_fingerprint TEXT, feed_url TEXT, sitemap_url TEXT,
+    recent_entry_keys TEXT, last_checked_at TEXT NOT NULL, last_changed_at TEXT, consecutive_errors INTEGER NOT NULL DEFAULT 0,
+    feed_etag TEXT, feed_last_modified TEXT, sitemap_etag TEXT, sitemap_last_modified TEXT
+);
+CREATE TABLE check_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, blog_id TEXT NOT NULL, checked_at TEXT NOT NULL, http_status INTEGER,
+    skipped INTEGER NOT NULL DEFAULT 0, changed INTEGER NOT NULL DEFAULT 0, url_fingerprint TEXT, error_message TEXT
+);
+INSERT INTO blog_state (blog_id, url_fingerprint, last_checked_at, last_changed_at)
+VALUES (
+    'blog-1', 'abababababababababababababababababababababababababababababababab', '2024-01-01T00:00:00+00:00', '2023-12-31T12:30:00.250000+00:00');
+INSERT INTO check_history (id, blog_id, checked_at, http_status, url_fingerprint)
+VALUES (40, 'blog-1', '2023-12-31T00:00:00+00:00', 304, NULL),
+       (41, 'blog-1', '2023-12-31T12:00:00+00:00', 304, NULL),
+       (42, 'blog-1', '2024-01-01T00:00:00+00:00', 200, 'not-a-digest');
+"""
+
+
+def test_initialize_records_every_migration(database: Database) -> None:
+    versions = [row[0] for row in database.execute("SELECT version FROM schema_version ORDER BY version")]
+
+    assert versions == [migration.version for migration in load_migrations()]
+
+
+def test_apply_migrations_is_idempotent(database: Database) -> None:
+    connection = database.connect()
+
+    assert apply_migrations(connection) == []
+    assert current_version(connection) == load_migrations()[-1].version
+
+
+def test_failed_migration_rolls_back_and_is_not_recorded(database: Database) -> None:
+    connection = database.connect()
+    version = current_version(connection)
+    broken = Migration(version=version + 1, name="broken", sql="CREATE TABLE partial (id INTEGER); SELECT missing_function();")
+
+    with pytest.raises(sqlite3.OperationalError):
+        apply_migrations(connection, [*load_migrations(), broken])
+
+    assert current_version(connection) == version
+    assert connection.execute("SELECT name FROM sqlite_master WHERE name = 'partial'").fetchone() is None
+
+
+def _legacy_database(tmp_path: Path) -> Database:
+    db_path = tmp_path / "legacy.db"
+    connection = sqlite3.connect(db_path)
+    connection.executescript(_BASELINE_SCHEMA)
+    connection.close()
+    database = Database(db_path)
+    database.initialize()
+    return database
+
+
+def _drain(backfill: SchemaBackfill) -> list[int]:
+    batches = []
+    while backfill.pending():
+        batches.append(backfill.run_batch())
+    return batches
+
+
+def test_initialize_upgrades_baseline_database(tmp_path: Path) -> None:
+    database = _legacy_database(tmp_path)
+
+    try:
+        state = BlogStateRepository(database).get("blog-1")
+        assert state is not None
+        assert state.url_fingerprint == _FINGERPRINT
+        assert state.last_checked_at == datetime(2024, 1, 1, tzinfo=UTC)
+        assert state.last_changed_at == datetime(2023, 12, 31, 12, 30, 0, 250000, tzinfo=UTC)
+        assert database.execute("SELECT typeof(url_fingerprint) FROM blog_state").fetchone()[0] == "blob"
+        assert pending_backfills(database.connect()) == [4]
+    finally:
+        database.close()
+
+
+def test_backfill_moves_history_in_chunks_and_drops_legacy_table(tmp_path: Path) -> None:
+    database = _legacy_database(tmp_path)
+    history_repo = CheckHistoryRepository(database)
+
+    try:
+        assert history_repo.list_by_blog_id("blog-1") == []
+
+        assert _drain(SchemaBackfill(database, batch_size=2)) == [2, 1, 0]
+
+        history = history_repo.list_by_blog_id("blog-1")
+        assert [(entry.url_fingerprint, entry.repeat_count, entry.repeated_until) for entry in history] == [
+            ("not-a-digest", 1, None),
+            (None, 1, None),
+            (None, 1, None),
+        ]
+        rows = database.execute("SELECT id, typeof(checked_at) FROM check_history ORDER BY id").fetchall()
+        assert [tuple(row) for row in rows] == [(40, "integer"), (41, "integer"), (42, "integer")]
+        assert database.execute("SELECT name FROM sqlite_master WHERE name = 'check_history_legacy'").fetchone() is None
+        assert pending_backfills(database.connect()) == []
+    finally:
+        database.close()
+
+
+def test_checks_written_during_backfill_keep_ids_above_legacy_rows(tmp_path: Path) -> None:
+    database = _legacy_database(tmp_path)
+    history_repo = CheckHistoryRepository(database)
+    backfill = SchemaBackfill(database, batch_size=1)
+
+    try:
+        backfill.run_batch()
+        history_repo.add(CheckHistoryFactory.build(blog_id="blog-1", checked_at=datetime(2024, 1, 2, tzinfo=UTC)))
+        _drain(backfill)
+
+        ids = [row[0] for row in database.execute("SELECT id FROM check_history ORDER BY id")]
+        assert ids == [40, 41, 42, 43]
+    finally:
+        database.close()
+
+
+def test_newer_migration_finishes_pending_backfill_first(tmp_path: Path) -> None:
+    database = _legacy_database(tmp_path)
+    connection = database.connect()
+    follow_up = Migration(
+        version=current_version(connection) + 1,
+        name="follow_up",
+        sql="ALTER TABLE check_history ADD COLUMN note TEXT;",
+    )
+
+    try:
+        apply_migrations(connection, [*load_migrations(), follow_up])
+
+        assert pending_backfills(connection) == []
+        assert connection.execute("SELECT COUNT(*) FROM check_history").fetchone()[0] == 3
+    finally:
+        database.close()
+
+
+def test_load_migrations_rejects_step_without_migration(tmp_path: Path) -> None:
+    (tmp_path / "0001_initial.sql").write_text("CREATE TABLE a (id INTEGER);", encoding="utf-8")
+    (tmp_path / "0002_missing.backfill.sql").write_text("DELETE FROM a;", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="without a migration"):
+        load_migrations(tmp_path)
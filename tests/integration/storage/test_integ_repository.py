@@ -1,10 +1,32 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import hashlib
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
-from blog_watcher.storage import BlogStateRepository, CheckHistoryRepository, Database
+from blog_watcher.storage import (
+    BlogStateRepository,
+    CheckHistoryRepository,
+    Database,
+    DiscoveryMiss,
+    DiscoveryMissRepository,
+    HostCircuit,
+    HostCircuitRepository,
+    HttpCacheEntry,
+    HttpCacheRepository,
+    RobotsCacheRepository,
+    RobotsRecord,
+)
+from blog_watcher.storage.sql import BLOG_STATE_TOUCH_SQL, HTTP_CACHE_TOTAL_SIZE_SQL
 from tests.test_utils.factories import BlogStateFactory, CheckHistoryFactory
 
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Sequence
+
+    import pytest
+
 
 def test_upsert_and_get_round_trip(database: Database) -> None:
     repo = BlogStateRepository(database)
@@ -16,6 +38,18 @@ def test_upsert_and_get_round_trip(database: Database) -> None:
     assert fetched == state
 
 
+def test_body_hashes_round_trip_as_blobs(database: Database) -> None:
+    repo = BlogStateRepository(database)
+    feed_hash, sitemap_hash = "ab" * 32, "cd" * 32
+    state = BlogStateFactory.build(blog_id="blog-1", feed_body_hash=feed_hash, sitemap_body_hash=sitemap_hash)
+
+    repo.upsert(state)
+    stored = database.execute("SELECT feed_body_hash, sitemap_body_hash FROM blog_state WHERE blog_id = ?", ("blog-1",)).fetchone()
+
+    assert tuple(stored) == (bytes.fromhex(feed_hash), bytes.fromhex(sitemap_hash))
+    assert repo.get("blog-1") == state
+
+
 def test_get_nonexistent_returns_none(database: Database) -> None:
     repo = BlogStateRepository(database)
 
@@ -81,3 +115,280 @@ def test_list_all_returns_all_states(database: Database) -> None:
     results = repo.list_all()
 
     assert {state.blog_id for state in results} == {"blog-a", "blog-b"}
+
+
+def test_get_many_returns_existing_states_across_chunks(database: Database) -> None:
+    repo = BlogStateRepository(database)
+    stored_ids = [f"blog-{index}" for index in range(0, 1200, 2)]
+    for blog_id in stored_ids:
+        repo.upsert(BlogStateFactory.build(blog_id=blog_id))
+
+    results = repo.get_many(f"blog-{index}" for index in range(1200))
+
+    assert set(results) == set(stored_ids)
+    assert results["blog-0"].blog_id == "blog-0"
+
+
+def test_get_many_with_no_ids_returns_empty(database: Database) -> None:
+    repo = BlogStateRepository(database)
+
+    assert repo.get_many([]) == {}
+
+
+def test_upsert_many_writes_every_state_and_updates_prefetch(database: Database) -> None:
+    repo = BlogStateRepository(database)
+    repo.upsert(BlogStateFactory.build(blog_id="blog-0", etag="old"))
+    states = [BlogStateFactory.build(blog_id=f"blog-{index}", etag="new") for index in range(3)]
+
+    with repo.prefetch(["blog-0"]):
+        repo.upsert_many(states)
+        assert repo.get("blog-0") == states[0]
+
+    assert sorted(repo.list_all(), key=lambda state: state.blog_id) == states
+
+
+def test_add_many_round_trips_entries(database: Database) -> None:
+    repo = CheckHistoryRepository(database)
+    entries = [CheckHistoryFactory.build(checked_at=datetime(2024, 1, 1, tzinfo=UTC) + timedelta(minutes=minute)) for minute in range(3)]
+
+    repo.add_many(entries)
+
+    assert repo.list_by_blog_id("https://example.com") == entries[::-1]
+
+
+def test_prefetch_serves_get_without_querying(database: Database, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = BlogStateRepository(database)
+    state = BlogStateFactory.build(blog_id="blog-1")
+    repo.upsert(state)
+    queries: list[str] = []
+    original_execute = database.execute
+
+    def recording_execute(query: str, params: Sequence[object] | None = None) -> sqlite3.Cursor:
+        queries.append(query)
+        return original_execute(query, params)
+
+    monkeypatch.setattr(database, "execute", recording_execute)
+
+    with repo.prefetch(["blog-1", "missing"]):
+        assert repo.get("blog-1") == state
+        assert repo.get("missing") is None
+
+    assert len(queries) == 1
+
+
+def test_prefetch_reflects_writes_made_inside_block(database: Database) -> None:
+    repo = BlogStateRepository(database)
+    repo.upsert(BlogStateFactory.build(blog_id="blog-1", etag="etag-1"))
+    updated = BlogStateFactory.build(blog_id="blog-1", etag="etag-2")
+
+    with repo.prefetch(["blog-1"]):
+        repo.upsert(updated)
+        assert repo.get("blog-1") == updated
+        repo.delete("blog-1")
+        assert repo.get("blog-1") is None
+
+
+def test_skip_unchanged_writes_only_touches_heartbeat(database: Database, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = BlogStateRepository(database, skip_unchanged_writes=True)
+    state = BlogStateFactory.build(blog_id="blog-1", etag="etag-1")
+    repo.upsert(state)
+    later = replace(state, last_checked_at=datetime(2024, 1, 2, tzinfo=UTC))
+    queries: list[str] = []
+    original_execute = database.execute
+
+    def recording_execute(query: str, params: Sequence[object] | None = None) -> sqlite3.Cursor:
+        queries.append(query)
+        return original_execute(query, params)
+
+    with repo.prefetch(["blog-1"]):
+        monkeypatch.setattr(database, "execute", recording_execute)
+        repo.upsert(later)
+        repo.upsert(later)
+
+    assert queries == [BLOG_STATE_TOUCH_SQL]
+    assert repo.get("blog-1") == later
+
+
+def test_skip_unchanged_writes_still_upserts_changed_state(database: Database) -> None:
+    repo = BlogStateRepository(database, skip_unchanged_writes=True)
+    repo.upsert(BlogStateFactory.build(blog_id="blog-1", etag="etag-1"))
+    changed = BlogStateFactory.build(blog_id="blog-1", etag="etag-2", last_checked_at=datetime(2024, 1, 2, tzinfo=UTC))
+
+    with repo.prefetch(["blog-1"]):
+        repo.upsert(changed)
+
+    assert repo.get("blog-1") == changed
+
+
+def test_record_folds_identical_unchanged_checks_into_one_row(database: Database) -> None:
+    history_repo = CheckHistoryRepository(database, compact_unchanged=True)
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    for minute in range(3):
+        history_repo.record(CheckHistoryFactory.build(blog_id="blog-1", http_status=304, checked_at=start + timedelta(minutes=minute)))
+
+    results = history_repo.list_by_blog_id("blog-1")
+
+    assert len(results) == 1
+    assert results[0].checked_at == start
+    assert results[0].repeat_count == 3
+    assert results[0].repeated_until == start + timedelta(minutes=2)
+
+
+def test_record_starts_new_row_when_check_differs(database: Database) -> None:
+    history_repo = CheckHistoryRepository(database, compact_unchanged=True)
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    history_repo.record(CheckHistoryFactory.build(blog_id="blog-1", http_status=304, checked_at=start))
+    history_repo.record(CheckHistoryFactory.build(blog_id="blog-1", http_status=200, checked_at=start + timedelta(minutes=1)))
+    history_repo.record(CheckHistoryFactory.build(blog_id="blog-1", changed=True, checked_at=start + timedelta(minutes=2)))
+    history_repo.record(CheckHistoryFactory.build(blog_id="blog-1", checked_at=start + timedelta(minutes=3)))
+
+    results = history_repo.list_by_blog_id("blog-1")
+
+    assert [entry.repeat_count for entry in results] == [1, 1, 1, 1]
+
+
+def test_record_without_compaction_adds_every_check(database: Database) -> None:
+    history_repo = CheckHistoryRepository(database)
+    for minute in range(3):
+        history_repo.record(CheckHistoryFactory.build(blog_id="blog-1", checked_at=datetime(2024, 1, 1, 0, minute, tzinfo=UTC)))
+
+    assert len(history_repo.list_by_blog_id("blog-1")) == 3
+
+
+def test_robots_cache_upsert_replaces_host_record(database: Database) -> None:
+    repo = RobotsCacheRepository(database)
+    fetched_at = datetime(2025, 1, 27, 12, 0, tzinfo=UTC)
+    record = RobotsRecord(
+        host="https://example.com",
+        status=200,
+        sitemaps=("https://example.com/sitemap.xml", "https://example.com/news.xml"),
+        fetched_at=fetched_at,
+        expires_at=fetched_at + timedelta(hours=1),
+    )
+
+    refreshed = replace(record, status=404, sitemaps=(), expires_at=fetched_at + timedelta(hours=2))
+
+    repo.upsert(record)
+    assert repo.get("https://example.com") == record
+
+    repo.upsert(refreshed)
+    assert repo.get("https://example.com") == refreshed
+    assert repo.get("https://example.org") is None
+
+
+def test_discovery_miss_round_trip_and_delete(database: Database) -> None:
+    repo = DiscoveryMissRepository(database)
+    probed_at = datetime(2025, 1, 27, 12, 0, tzinfo=UTC)
+    miss = DiscoveryMiss(blog_id="blog-1", kind="feed", misses=3, last_probed_at=probed_at, retry_after=probed_at + timedelta(hours=4))
+
+    repo.upsert(miss)
+
+    assert repo.get("blog-1", "feed") == miss
+    assert repo.get("blog-1", "sitemap") is None
+    assert repo.delete("blog-1", "feed") is True
+    assert repo.get("blog-1", "feed") is None
+
+
+def _cache_entry(url: str, body: bytes, used_at: datetime) -> HttpCacheEntry:
+    return HttpCacheEntry(
+        url=url,
+        status=200,
+        etag='"v1"',
+        last_modified=None,
+        body_hash=hashlib.sha256(body).hexdigest(),
+        stored_at=used_at,
+        expires_at=used_at + timedelta(minutes=10),
+        last_used_at=used_at,
+    )
+
+
+def test_http_cache_round_trip_shares_identical_bodies(database: Database) -> None:
+    repo = HttpCacheRepository(database)
+    now = datetime(2025, 1, 27, 12, 0, tzinfo=UTC)
+    entry = replace(_cache_entry("https://a.example.com/sitemap.xml", b"<urlset/>", now), encoding="utf-8")
+
+    repo.put(entry, b"<urlset/>")
+    repo.put(_cache_entry("https://b.example.com/sitemap.xml", b"<urlset/>", now), b"<urlset/>")
+
+    assert repo.get(entry.url) == entry
+    assert repo.get_body(entry.body_hash) == b"<urlset/>"
+    assert database.execute("SELECT COUNT(*) FROM http_cache_body").fetchone()[0] == 1
+
+
+def test_http_cache_replacing_a_body_drops_the_unused_one(database: Database) -> None:
+    repo = HttpCacheRepository(database)
+    now = datetime(2025, 1, 27, 12, 0, tzinfo=UTC)
+    old = _cache_entry("https://example.com/feed", b"old", now)
+    repo.put(old, b"old")
+
+    repo.put(_cache_entry("https://example.com/feed", b"new", now), b"new")
+
+    assert repo.get_body(old.body_hash) is None
+    assert repo.delete("https://example.com/feed") is True
+    assert repo.total_size() == 0
+
+
+def test_http_cache_evicts_least_recently_used_first(database: Database) -> None:
+    repo = HttpCacheRepository(database)
+    now = datetime(2025, 1, 27, 12, 0, tzinfo=UTC)
+    bodies = {f"https://example.com/{index}": f"body {index} ".encode() * 50 for index in range(3)}
+    for offset, (url, body) in enumerate(bodies.items()):
+        repo.put(_cache_entry(url, body, now + timedelta(seconds=offset)), body)
+    recent = repo.get("https://example.com/0")
+    assert recent is not None
+    repo.update(replace(recent, last_used_at=now + timedelta(minutes=1)))
+
+    evicted = repo.evict(repo.total_size() - 1)
+
+    assert evicted == 1
+    assert repo.get("https://example.com/1") is None
+    assert repo.get("https://example.com/0") is not None
+    assert repo.get("https://example.com/2") is not None
+
+
+def test_http_cache_tracks_total_size_without_rescanning_bodies(database: Database, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = HttpCacheRepository(database)
+    now = datetime(2025, 1, 27, 12, 0, tzinfo=UTC)
+    assert repo.total_size() == 0
+    queries: list[str] = []
+    original_execute = database.execute
+
+    def recording_execute(query: str, params: Sequence[object] | None = None) -> sqlite3.Cursor:
+        queries.append(query)
+        return original_execute(query, params)
+
+    monkeypatch.setattr(database, "execute", recording_execute)
+    for index in range(3):
+        body = f"body {index} ".encode() * 50
+        repo.put(_cache_entry(f"https://example.com/{index}", body, now + timedelta(seconds=index)), body)
+    repo.put(_cache_entry("https://example.com/copy", b"body 0 " * 50, now), b"body 0 " * 50)
+    repo.put(_cache_entry("https://example.com/2", b"replaced", now), b"replaced")
+    repo.delete("https://example.com/1")
+    repo.evict(repo.total_size() - 1)
+
+    assert HTTP_CACHE_TOTAL_SIZE_SQL not in queries
+    assert repo.total_size() == original_execute(HTTP_CACHE_TOTAL_SIZE_SQL).fetchone()[0]
+
+
+def test_host_circuit_round_trip_and_delete(database: Database) -> None:
+    repo = HostCircuitRepository(database)
+    changed_at = datetime(2025, 1, 27, 12, 0, tzinfo=UTC)
+    opened = HostCircuit(host="https://example.com", state="open", failures=5, changed_at=changed_at, retry_at=changed_at + timedelta(minutes=5))
+
+    repo.upsert(HostCircuit(host="https://example.com", state="closed", failures=4, changed_at=changed_at, retry_at=None))
+    repo.upsert(opened)
+
+    assert repo.get("https://example.com") == opened
+    assert repo.delete("https://example.com") is True
+    assert repo.get("https://example.com") is None
+
+
+def test_record_starts_new_row_at_hour_boundary(database: Database) -> None:
+    history_repo = CheckHistoryRepository(database, compact_unchanged=True)
+    start = datetime(2024, 1, 1, 0, 50, tzinfo=UTC)
+    for minutes in (0, 5, 10, 15):
+        history_repo.record(CheckHistoryFactory.build(blog_id="blog-1", http_status=304, checked_at=start + timedelta(minutes=minutes)))
+
+    results = history_repo.list_by_blog_id("blog-1")
+
+    assert [(entry.checked_at, entry.repeat_count) for entry in results] == [(start + timedelta(minutes=10), 2), (start, 2)]
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from blog_watcher.storage import CheckHistoryRepository, CheckRollupRepository, Database, HistoryRetention, RetentionPolicy
+from blog_watcher.storage.sql import RETENTION_DELETE_RAW_BATCH_SQL, RETENTION_RAW_BATCH_UPPER_BOUND_SQL, RETENTION_ROLLUP_RAW_TO_HOURLY_SQL
+from tests.test_utils.factories import CheckHistoryFactory
+
+NOW = datetime(2025, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _add_checks(database: Database, *, start: datetime, count: int, step: timedelta, **overrides: object) -> None:
+    repo = CheckHistoryRepository(database)
+    for index in range(count):
+        repo.add(CheckHistoryFactory.build(checked_at=start + step * index, **overrides))
+
+
+def test_rollup_raw_moves_expired_checks_into_hourly_buckets(database: Database) -> None:
+    old = NOW - timedelta(days=10)
+    _add_checks(database, start=old, count=3, step=timedelta(minutes=1), http_status=304)
+    _add_checks(database, start=old, count=1, step=timedelta(minutes=1), http_status=200, changed=True)
+    _add_checks(database, start=old, count=1, step=timedelta(minutes=1), http_status=None, error_message="timeout")
+    _add_checks(database, start=NOW - timedelta(hours=1), count=2, step=timedelta(minutes=1))
+    retention = HistoryRetention(database, RetentionPolicy(raw_retention=timedelta(days=7)))
+
+    removed = retention.rollup_raw_batch(now=NOW)
+
+    assert removed == 5
+    assert len(CheckHistoryRepository(database).list_by_blog_id("https://example.com")) == 2
+    hourly = CheckRollupRepository(database).list_hourly_by_blog_id("https://example.com")
+    histogram = {rollup.http_status: (rollup.checks, rollup.changes, rollup.errors) for rollup in hourly}
+    assert histogram == {None: (1, 0, 1), 200: (1, 1, 0), 304: (3, 0, 0)}
+    assert {rollup.bucket_start for rollup in hourly} == {old.replace(minute=0)}
+
+
+def test_rollup_raw_processes_at_most_one_batch(database: Database) -> None:
+    _add_checks(database, start=NOW - timedelta(days=10), count=5, step=timedelta(minutes=1))
+    retention = HistoryRetention(database, RetentionPolicy(batch_size=2))
+
+    assert retention.rollup_raw_batch(now=NOW) == 2
+    assert retention.rollup_raw_batch(now=NOW) == 2
+    assert retention.rollup_raw_batch(now=NOW) == 1
+    assert retention.rollup_raw_batch(now=NOW) == 0
+
+    hourly = CheckRollupRepository(database).list_hourly_by_blog_id("https://example.com")
+    assert [rollup.checks for rollup in hourly] == [5]
+
+
+def test_rollup_hourly_merges_buckets_into_daily(database: Database) -> None:
+    day = datetime(2024, 6, 1, tzinfo=UTC)
+    _add_checks(database, start=day, count=3, step=timedelta(hours=5))
+    retention = HistoryRetention(database, RetentionPolicy(raw_retention=timedelta(days=7), hourly_retention=timedelta(days=90)))
+
+    retention.rollup_raw_batch(now=NOW)
+    removed = retention.rollup_hourly_batch(now=NOW)
+
+    rollups = CheckRollupRepository(database)
+    assert removed == 3
+    assert rollups.list_hourly_by_blog_id("https://example.com") == []
+    daily = rollups.list_daily_by_blog_id("https://example.com")
+    assert [(rollup.bucket_start, rollup.checks) for rollup in daily] == [(day, 3)]
+
+
+def test_prune_daily_only_runs_when_retention_is_configured(database: Database) -> None:
+    _add_checks(database, start=datetime(2020, 1, 1, tzinfo=UTC), count=1, step=timedelta(minutes=1))
+    keep_forever = HistoryRetention(database)
+    keep_forever.rollup_raw_batch(now=NOW)
+    keep_forever.rollup_hourly_batch(now=NOW)
+
+    assert keep_forever.prune_daily_batch(now=NOW) == 0
+
+    bounded = HistoryRetention(database, RetentionPolicy(daily_retention=timedelta(days=365)))
+    assert bounded.prune_daily_batch(now=NOW) == 1
+    assert CheckRollupRepository(database).list_daily_by_blog_id("https://example.com") == []
+
+
+def test_incremental_vacuum_runs_on_fresh_database(database: Database) -> None:
+    retention = HistoryRetention(database)
+
+    retention.incremental_vacuum()
+
+    assert database.execute("PRAGMA auto_vacuum").fetchone()[0] == 2  # INCREMENTAL
+
+
+def test_rollup_raw_counts_folded_checks(database: Database) -> None:
+    history_repo = CheckHistoryRepository(database, compact_unchanged=True)
+    old = NOW - timedelta(days=10)
+    for minute in range(4):
+        history_repo.record(CheckHistoryFactory.build(checked_at=old + timedelta(minutes=minute), http_status=304))
+
+    HistoryRetention(database).rollup_raw_batch(now=NOW)
+
+    hourly = CheckRollupRepository(database).list_hourly_by_blog_id("https://example.com")
+    assert [(rollup.http_status, rollup.checks) for rollup in hourly] == [(304, 4)]
+
+
+def test_rollup_raw_counts_folded_checks_in_their_own_hours(database: Database) -> None:
+    history_repo = CheckHistoryRepository(database, compact_unchanged=True)
+    old = (NOW - timedelta(days=10)).replace(minute=40)
+    for minutes in range(0, 90, 10):
+        history_repo.record(CheckHistoryFactory.build(checked_at=old + timedelta(minutes=minutes), http_status=304))
+
+    HistoryRetention(database).rollup_raw_batch(now=NOW)
+
+    hourly = CheckRollupRepository(database).list_hourly_by_blog_id("https://example.com")
+    bucket = old.replace(minute=0)
+    assert sorted((rollup.bucket_start, rollup.checks) for rollup in hourly) == [
+        (bucket, 2),
+        (bucket + timedelta(hours=1), 6),
+        (bucket + timedelta(hours=2), 1),
+    ]
+
+
+def test_rollup_raw_keeps_run_still_extending_past_cutoff(database: Database) -> None:
+    history_repo = CheckHistoryRepository(database, compact_unchanged=True)
+    now = NOW + timedelta(minutes=30)
+    cutoff = now - timedelta(days=7)
+    for minutes in (-20, -10, 10):
+        history_repo.record(CheckHistoryFactory.build(checked_at=cutoff + timedelta(minutes=minutes), http_status=304))
+
+    removed = HistoryRetention(database).rollup_raw_batch(now=now)
+
+    assert removed == 0
+    assert [entry.repeat_count for entry in history_repo.list_by_blog_id("https://example.com")] == [3]
+    assert CheckRollupRepository(database).list_hourly_by_blog_id("https://example.com") == []
+
+
+def test_rollup_raw_batches_stay_bounded_when_ids_do_not_follow_time(database: Database) -> None:
+    old = NOW - timedelta(days=10)
+    # Newer checks first, so the oldest rows carry the highest ids, as backfilled legacy rows can.
+    _add_checks(database, start=old + timedelta(hours=1), count=3, step=timedelta(minutes=1))
+    _add_checks(database, start=old, count=3, step=timedelta(minutes=1))
+    retention = HistoryRetention(database, RetentionPolicy(batch_size=2))
+
+    assert [retention.rollup_raw_batch(now=NOW) for _ in range(4)] == [2, 2, 2, 0]
+    hourly = CheckRollupRepository(database).list_hourly_by_blog_id("https://example.com")
+    assert sum(rollup.checks for rollup in hourly) == 6
+
+
+@pytest.mark.parametrize(
+    ("query", "params"),
+    [
+        pytest.param(RETENTION_RAW_BATCH_UPPER_BOUND_SQL, (0, 1), id="upper_bound"),
+        pytest.param(RETENTION_ROLLUP_RAW_TO_HOURLY_SQL, (0, 0, 0), id="rollup"),
+        pytest.param(RETENTION_DELETE_RAW_BATCH_SQL, (0, 0, 0), id="delete"),
+    ],
+)
+def test_raw_batch_queries_use_checked_at_index(database: Database, query: str, params: tuple[int, ...]) -> None:
+    plan = database.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+
+    assert any("idx_check_history_checked_at" in detail for *_, detail in plan)
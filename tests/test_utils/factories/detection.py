@@ -60,3 +60,10 @@ class FetchResultFactory(Factory[FetchResult]):
     etag = None
     last_modified = None
     is_modified = True
+
+    @classmethod
+    def _adjust_kwargs(cls, **kwargs: object) -> dict[str, object]:
+        # Tests write bodies as text; FetchResult carries the bytes a server sent.
+        if isinstance(kwargs.get("content"), str):
+            kwargs["content"] = str(kwargs["content"]).encode("utf-8")
+        return kwargs
@@ -25,6 +25,8 @@ class BlogStateFactory(Factory[BlogState]):
     feed_last_modified = None
     sitemap_etag = None
     sitemap_last_modified = None
+    feed_body_hash = None
+    sitemap_body_hash = None
 
 
 class CheckHistoryFactory(Factory[CheckHistory]):
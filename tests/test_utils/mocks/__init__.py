@@ -1,8 +1,23 @@
-from tests.test_utils.mocks.core import BlockingWatcher, CapturingNotifier, CountingWatcher, SequenceDetector
+from tests.test_utils.mocks.core import (
+    BlockingWatcher,
+    CapturingNotifier,
+    CountingWatcher,
+    DelayedDetector,
+    FailingDetector,
+    FailingNotifier,
+    RecordingRunner,
+    SequenceDetector,
+    SlowWatcher,
+)
 
 __all__ = [
     "BlockingWatcher",
     "CapturingNotifier",
     "CountingWatcher",
+    "DelayedDetector",
+    "FailingDetector",
+    "FailingNotifier",
+    "RecordingRunner",
     "SequenceDetector",
+    "SlowWatcher",
 ]
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections import Counter
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
+from blog_watcher.detection import DetectionResult
 from blog_watcher.notification import Notification, Notifier
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
     from blog_watcher.config import BlogConfig
-    from blog_watcher.detection import DetectionResult
 
 
 class CountingWatcher:
@@ -31,6 +34,44 @@ class BlockingWatcher:
         self.finished.set()
 
 
+class RecordingRunner:
+    """Per-blog check runner that records calls and asks to be re-checked after ``next_in``."""
+
+    def __init__(self, blogs: list[BlogConfig], *, delay: float = 0.0, next_in: timedelta | None = None, failing: set[str] | None = None) -> None:
+        self.blogs: list[BlogConfig] | None = blogs
+        self.calls: Counter[str] = Counter()
+        self.first_checked_at: dict[str, float] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._delay = delay
+        self._next_in = next_in
+        self._failing = failing or set()
+        self._checked = asyncio.Event()
+
+    async def wait_until(self, predicate: Callable[[], bool]) -> None:
+        while not predicate():
+            self._checked.clear()
+            await self._checked.wait()
+
+    def load_blogs(self) -> list[BlogConfig] | None:
+        return self.blogs
+
+    async def check_blog(self, blog: BlogConfig) -> datetime | None:
+        self.calls[blog.blog_id] += 1
+        self.first_checked_at.setdefault(blog.blog_id, time.time())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delay)
+        finally:
+            self.in_flight -= 1
+            self._checked.set()
+        if blog.blog_id in self._failing:
+            msg = f"check failed for {blog.blog_id}"
+            raise RuntimeError(msg)
+        return datetime.now(UTC) + self._next_in if self._next_in is not None else None
+
+
 class SequenceDetector:
     def __init__(self, results: Iterable[DetectionResult]) -> None:
         self._results = iter(results)
@@ -45,9 +86,59 @@ class SequenceDetector:
             raise RuntimeError(msg) from exc
 
 
+class DelayedDetector:
+    """Reports every blog unchanged after the per-URL delay in ``delays``."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self._delays = delays
+        self.calls: list[str] = []
+
+    async def check(self, blog: BlogConfig) -> DetectionResult:
+        self.calls.append(blog.url)
+        await asyncio.sleep(self._delays.get(blog.url, 0.0))
+        return DetectionResult(blog_id=blog.blog_id, changed=False, http_status=304, url_fingerprint=None)
+
+
+class FailingDetector:
+    """Raises ``errors[url]`` for the listed blogs and reports the others unchanged."""
+
+    def __init__(self, errors: dict[str, Exception]) -> None:
+        self.errors = errors
+        self.calls: list[str] = []
+
+    async def check(self, blog: BlogConfig) -> DetectionResult:
+        self.calls.append(blog.url)
+        if blog.url in self.errors:
+            raise self.errors[blog.url]
+        return DetectionResult(blog_id=blog.blog_id, changed=False, http_status=200, url_fingerprint=None)
+
+
+class SlowWatcher:
+    def __init__(self, duration: float) -> None:
+        self.calls = 0
+        self._duration = duration
+
+    async def check_all(self) -> None:
+        self.calls += 1
+        await asyncio.sleep(self._duration)
+
+
 class CapturingNotifier(Notifier):
     def __init__(self) -> None:
         self.notifications: list[Notification] = []
 
     async def send(self, notification: Notification) -> None:
         self.notifications.append(notification)
+
+
+class FailingNotifier(Notifier):
+    """Raises ``errors[url]`` for notifications about the listed blogs and captures the others."""
+
+    def __init__(self, errors: dict[str, Exception]) -> None:
+        self.errors = errors
+        self.notifications: list[Notification] = []
+
+    async def send(self, notification: Notification) -> None:
+        if notification.url in self.errors:
+            raise self.errors[notification.url]
+        self.notifications.append(notification)
@@ -181,3 +181,110 @@ def test_env_var_overrides_slack_webhook_url(monkeypatch: pytest.MonkeyPatch) ->
     config = load_config(fixture_path("config/minimal_valid.toml"))
 
     assert config.slack.webhook_url == override_url
+
+
+def test_retention_defaults_when_section_omitted() -> None:
+    config = load_config(fixture_path("config/minimal_valid.toml"))
+
+    assert config.retention.raw_days == 7
+    assert config.retention.hourly_days == 90
+    assert config.retention.daily_days is None
+
+
+def test_load_retention_section() -> None:
+    config = load_config(fixture_path("config/retention_valid.toml"))
+
+    assert config.retention.raw_days == 3
+    assert config.retention.hourly_days == 30
+    assert config.retention.daily_days == 365
+    assert config.retention.batch_size == 500
+
+
+@pytest.mark.parametrize(
+    ("content", "expected_loc"),
+    [
+        pytest.param(
+            fixture_path("config/invalid_retention_tiers.toml"),
+            ("retention",),
+            id="hourly_shorter_than_raw",
+        ),
+        pytest.param(
+            fixture_path("config/invalid_retention_batch_size.toml"),
+            ("retention", "batch_size"),
+            id="non_positive_batch_size",
+        ),
+    ],
+)
+def test_invalid_retention_raises_validation_error(content: Path, expected_loc: tuple[object, ...]) -> None:
+    with pytest.raises(ConfigError) as excinfo:
+        load_config(content)
+
+    error = _extract_validation_error(excinfo.value)
+    assert _has_loc(error, expected_loc)
+
+
+def test_load_storage_section() -> None:
+    assert load_config(fixture_path("config/minimal_valid.toml")).storage.compact_unchanged_checks is False
+    assert load_config(fixture_path("config/storage_compact.toml")).storage.compact_unchanged_checks is True
+    assert load_config(fixture_path("config/storage_compact.toml")).storage.backfill_batch_size == 250
+
+
+def test_invalid_storage_backfill_batch_size_raises_validation_error() -> None:
+    with pytest.raises(ConfigError) as excinfo:
+        load_config(fixture_path("config/invalid_storage_backfill_batch_size.toml"))
+
+    error = _extract_validation_error(excinfo.value)
+    assert _has_loc(error, ("storage", "backfill_batch_size"))
+
+
+def test_load_scheduler_section() -> None:
+    assert load_config(fixture_path("config/minimal_valid.toml")).scheduler.adaptive is False
+    scheduler = load_config(fixture_path("config/scheduler_adaptive.toml")).scheduler
+
+    assert scheduler.interval_seconds == 30
+    assert (scheduler.mode, scheduler.workers) == ("queue", 8)
+    assert scheduler.adaptive is True
+    assert (scheduler.min_interval_seconds, scheduler.max_interval_seconds) == (120, 43200)
+    assert scheduler.jitter == 0.2
+
+
+def test_scheduler_spread_mode_is_accepted() -> None:
+    scheduler = load_config(fixture_path("config/scheduler_spread.toml")).scheduler
+
+    assert (scheduler.mode, scheduler.interval_seconds) == ("spread", 300)
+    assert (scheduler.check_timeout_seconds, scheduler.cycle_deadline_seconds) == (20, 240)
+
+
+def test_invalid_scheduler_check_timeout_raises_validation_error() -> None:
+    with pytest.raises(ConfigError) as excinfo:
+        load_config(fixture_path("config/invalid_scheduler_check_timeout.toml"))
+
+    error = _extract_validation_error(excinfo.value)
+    assert _has_loc(error, ("scheduler", "check_timeout_seconds"))
+
+
+def test_invalid_scheduler_bounds_raise_validation_error() -> None:
+    with pytest.raises(ConfigError) as excinfo:
+        load_config(fixture_path("config/invalid_scheduler_bounds.toml"))
+
+    error = _extract_validation_error(excinfo.value)
+    assert _has_loc(error, ("scheduler",))
+
+
+def test_http_section_overrides_client_settings() -> None:
+    http = load_config(fixture_path("config/http_pool.toml")).http
+
+    assert (http.connect_timeout_seconds, http.read_timeout_seconds, http.write_timeout_seconds, http.pool_timeout_seconds) == (3.0, 15.0, 10.0, 2.0)
+    assert (http.max_connections, http.max_keepalive_connections, http.keepalive_expiry_seconds) == (8, 8, 60.0)
+    assert http.http2 is True
+    assert (http.memo_ttl_seconds, http.cache_max_megabytes) == (0.0, 0)
+    assert (http.breaker_failure_threshold, http.breaker_cooldown_seconds) == (3, 60.0)
+    assert http.spool_threshold_megabytes == 0
+
+
+def test_keepalive_above_max_connections_raises_validation_error() -> None:
+    with pytest.raises(ConfigError) as excinfo:
+        load_config(fixture_path("config/invalid_http_pool.toml"))
+
+    error = _extract_validation_error(excinfo.value)
+    assert _has_loc(error, ("http",))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from blog_watcher.core import AdaptivePolling, ErrorBackoff, PollingPolicy
+from blog_watcher.storage import CheckHistory
+
+NOW = datetime(2025, 3, 1, 12, 0, tzinfo=UTC)
+BLOG_ID = "https://example.com"
+
+
+class StubHistory:
+    def __init__(self, changes: list[datetime] | None = None) -> None:
+        self._changes = sorted(changes or [], reverse=True)
+
+    def list_by_blog_id(self, blog_id: str, *, changed_only: bool = False, limit: int | None = None) -> list[CheckHistory]:
+        assert changed_only
+        return [
+            CheckHistory(blog_id=blog_id, checked_at=at, http_status=200, skipped=False, changed=True, url_fingerprint=None, error_message=None)
+            for at in self._changes[:limit]
+        ]
+
+
+def _polling(history: StubHistory | None = None, **overrides: object) -> AdaptivePolling:
+    policy = PollingPolicy(**{"jitter": 0.0, **overrides})  # type: ignore[arg-type]
+    return AdaptivePolling(policy, history or StubHistory(), rng=random.Random(0))  # type: ignore[arg-type]  # noqa: S311
+
+
+def test_unknown_blog_is_due() -> None:
+    assert _polling().is_due(BLOG_ID, NOW)
+
+
+def test_quiet_checks_back_off_up_to_max_interval() -> None:
+    polling = _polling(backoff_factor=2.0, max_interval=timedelta(minutes=5))
+    intervals = []
+    now = NOW
+    for _ in range(5):
+        due = polling.record(BLOG_ID, changed=False, last_changed_at=None, now=now)
+        intervals.append(due - now)
+        now = due
+
+    assert intervals == [timedelta(minutes=minutes) for minutes in (1, 2, 4, 5, 5)]
+    assert not polling.is_due(BLOG_ID, now - timedelta(seconds=1))
+    assert polling.is_due(BLOG_ID, now)
+
+
+def test_change_resets_to_min_interval() -> None:
+    polling = _polling(backoff_factor=2.0)
+    polling.record(BLOG_ID, changed=False, last_changed_at=None, now=NOW)
+    polling.record(BLOG_ID, changed=False, last_changed_at=None, now=NOW)
+
+    due = polling.record(BLOG_ID, changed=True, last_changed_at=NOW, now=NOW)
+
+    assert due - NOW == timedelta(minutes=1)
+
+
+def test_posting_rate_caps_backoff_for_active_blogs() -> None:
+    hourly_posts = StubHistory([NOW - timedelta(hours=hours) for hours in range(1, 5)])
+    polling = _polling(hourly_posts, backoff_factor=10.0, change_fraction=0.1)
+    polling.record(BLOG_ID, changed=False, last_changed_at=None, now=NOW)
+
+    due = polling.record(BLOG_ID, changed=False, last_changed_at=None, now=NOW)
+
+    assert due - NOW == timedelta(minutes=6)
+
+
+def test_restart_resumes_from_learned_rate() -> None:
+    quarterly = StubHistory([NOW - timedelta(days=90 * quarter) for quarter in range(1, 4)])
+    polling = _polling(quarterly, max_interval=timedelta(hours=6))
+
+    due = polling.record(BLOG_ID, changed=False, last_changed_at=None, now=NOW)
+
+    assert due - NOW == timedelta(hours=6)
+
+
+def test_jitter_stays_within_bounds() -> None:
+    polling = AdaptivePolling(PollingPolicy(jitter=0.2), StubHistory([NOW - timedelta(days=1)]), rng=random.Random(1))  # type: ignore[arg-type]  # noqa: S311
+
+    offsets = {polling.record(f"blog-{index}", changed=False, last_changed_at=None, now=NOW) - NOW for index in range(20)}
+
+    assert len(offsets) > 1
+    assert all(timedelta(minutes=1) <= offset <= timedelta(hours=2.4 * 1.2) for offset in offsets)
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"min_interval": timedelta(0)}, "min_interval must be positive"),
+        ({"max_interval": timedelta(seconds=1)}, "max_interval cannot be shorter than min_interval"),
+        ({"backoff_factor": 0.5}, "backoff_factor must be at least 1"),
+        ({"change_fraction": 0.0}, "change_fraction must be in"),
+        ({"jitter": 1.0}, "jitter must be in"),
+    ],
+)
+def test_policy_rejects_invalid_values(overrides: dict[str, object], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        PollingPolicy(**overrides)  # type: ignore[arg-type]
+
+
+def test_error_backoff_doubles_up_to_the_cap() -> None:
+    backoff = ErrorBackoff(base=timedelta(minutes=1), max_interval=timedelta(minutes=10))
+
+    assert [backoff.delay(errors) for errors in range(1, 6)] == [timedelta(minutes=minutes) for minutes in (1, 2, 4, 8, 10)]
+
+
+def test_error_backoff_rejects_a_cap_below_the_base() -> None:
+    with pytest.raises(ValueError, match="max_interval cannot be shorter than base"):
+        ErrorBackoff(base=timedelta(minutes=5), max_interval=timedelta(minutes=1))
@@ -1,7 +1,7 @@
 import pytest
 
-from blog_watcher.core import WatcherScheduler
-from tests.test_utils.mocks import CountingWatcher
+from blog_watcher.core import QueueScheduler, WatcherScheduler, spread_offset
+from tests.test_utils.mocks import CountingWatcher, RecordingRunner
 
 
 class TestWatcherSchedulerValidation:
@@ -16,3 +16,27 @@ class TestWatcherSchedulerValidation:
     def test_watcher_without_check_all_raises_type_error(self) -> None:
         with pytest.raises(TypeError, match="watcher must define check_all"):
             WatcherScheduler(1, object())
+
+
+class TestQueueSchedulerValidation:
+    def test_zero_interval_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="interval_seconds must be positive"):
+            QueueScheduler(0, RecordingRunner([]))
+
+    def test_zero_workers_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="workers must be positive"):
+            QueueScheduler(1, RecordingRunner([]), workers=0)
+
+
+class TestSpreadOffset:
+    def test_offset_is_stable_and_within_interval(self) -> None:
+        offsets = [spread_offset(f"https://blog-{index}.example.com", 60) for index in range(200)]
+
+        assert offsets == [spread_offset(f"https://blog-{index}.example.com", 60) for index in range(200)]
+        assert all(0 <= offset < 60 for offset in offsets)
+
+    def test_offsets_cover_the_interval(self) -> None:
+        offsets = [spread_offset(f"https://blog-{index}.example.com", 60) for index in range(600)]
+
+        buckets = {int(offset // 10) for offset in offsets}
+        assert buckets == set(range(6))
@@ -0,0 +1,120 @@
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+from blog_watcher.detection.circuit_breaker import CircuitOpenError, CircuitState, HostCircuitBreaker
+from blog_watcher.observability import MetricsRegistry
+from blog_watcher.storage.models import HostCircuit
+
+HOST = "https://example.com"
+
+
+class DictCircuitStore:
+    def __init__(self) -> None:
+        self.circuits: dict[str, HostCircuit] = {}
+
+    def get(self, host: str) -> HostCircuit | None:
+        return self.circuits.get(host)
+
+    def upsert(self, circuit: HostCircuit) -> None:
+        self.circuits[circuit.host] = circuit
+
+    def delete(self, host: str) -> bool:
+        return self.circuits.pop(host, None) is not None
+
+
+def _raise(exc: Exception) -> None:
+    raise exc
+
+
+def _fail(breaker: HostCircuitBreaker, host: str = HOST) -> None:
+    with pytest.raises(httpx.ConnectError), breaker.guard(host):
+        _raise(httpx.ConnectError("refused"))
+
+
+def _reopened_store(retry_at: datetime) -> DictCircuitStore:
+    store = DictCircuitStore()
+    store.upsert(HostCircuit(host=HOST, state=CircuitState.OPEN, failures=5, changed_at=retry_at - timedelta(minutes=5), retry_at=retry_at))
+    return store
+
+
+def test_circuit_opens_after_threshold_failures() -> None:
+    registry = MetricsRegistry()
+    breaker = HostCircuitBreaker(failure_threshold=2, metrics=registry)
+
+    _fail(breaker)
+    assert breaker.state(HOST) is CircuitState.CLOSED
+    _fail(breaker)
+
+    assert breaker.state(HOST) is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError), breaker.guard(HOST):
+        pytest.fail("an open circuit must not admit requests")
+    assert registry.counter("circuit_rejected").value == 1
+
+
+def test_success_resets_the_failure_count() -> None:
+    store = DictCircuitStore()
+    breaker = HostCircuitBreaker(store, failure_threshold=2)
+
+    _fail(breaker)
+    with breaker.guard(HOST):
+        pass
+    _fail(breaker)
+
+    assert breaker.state(HOST) is CircuitState.CLOSED
+    assert store.circuits[HOST].failures == 1
+
+
+def test_other_hosts_and_non_host_errors_are_unaffected() -> None:
+    breaker = HostCircuitBreaker(failure_threshold=1)
+
+    _fail(breaker)
+    with pytest.raises(ValueError, match="parse"), breaker.guard("https://other.example.com"):
+        _raise(ValueError("parse"))
+
+    assert breaker.state("https://other.example.com") is CircuitState.CLOSED
+
+
+def test_open_circuit_is_restored_from_the_store() -> None:
+    breaker = HostCircuitBreaker(_reopened_store(datetime.now(UTC) + timedelta(minutes=5)))
+
+    with pytest.raises(CircuitOpenError) as excinfo, breaker.guard(HOST):
+        pass
+    assert excinfo.value.retry_at is not None
+
+
+def test_after_cooldown_a_single_trial_closes_the_circuit() -> None:
+    store = _reopened_store(datetime.now(UTC) - timedelta(seconds=1))
+    breaker = HostCircuitBreaker(store)
+
+    with breaker.guard(HOST):
+        assert breaker.state(HOST) is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError), breaker.guard(HOST):
+            pass
+
+    assert breaker.state(HOST) is CircuitState.CLOSED
+    assert store.circuits == {}
+
+
+def test_failed_trial_reopens_the_circuit() -> None:
+    store = _reopened_store(datetime.now(UTC) - timedelta(seconds=1))
+    breaker = HostCircuitBreaker(store, cooldown=timedelta(minutes=10))
+
+    _fail(breaker)
+
+    circuit = store.circuits[HOST]
+    assert circuit.state == CircuitState.OPEN
+    assert circuit.retry_at is not None
+    assert circuit.retry_at > datetime.now(UTC) + timedelta(minutes=9)
+
+
+def test_cancelled_trial_lets_the_next_request_through() -> None:
+    breaker = HostCircuitBreaker(_reopened_store(datetime.now(UTC) - timedelta(seconds=1)))
+
+    with pytest.raises(KeyboardInterrupt), breaker.guard(HOST):
+        raise KeyboardInterrupt
+    with breaker.guard(HOST):
+        pass
+
+    assert breaker.state(HOST) is CircuitState.CLOSED
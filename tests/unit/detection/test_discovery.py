@@ -0,0 +1,68 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from blog_watcher.detection.discovery import DiscoveryBackoff, DiscoveryKind
+from blog_watcher.storage.models import DiscoveryMiss
+
+BLOG_ID = "https://example.com"
+NOW = datetime(2025, 1, 27, 12, 0, tzinfo=UTC)
+
+
+class DictMissStore:
+    def __init__(self) -> None:
+        self.misses: dict[tuple[str, str], DiscoveryMiss] = {}
+
+    def get(self, blog_id: str, kind: str) -> DiscoveryMiss | None:
+        return self.misses.get((blog_id, kind))
+
+    def upsert(self, miss: DiscoveryMiss) -> None:
+        self.misses[miss.blog_id, miss.kind] = miss
+
+    def delete(self, blog_id: str, kind: str) -> bool:
+        return self.misses.pop((blog_id, kind), None) is not None
+
+
+def test_retry_interval_doubles_up_to_the_cap() -> None:
+    backoff = DiscoveryBackoff(base_interval=timedelta(hours=1), max_interval=timedelta(hours=6))
+
+    intervals = [backoff.record_miss(BLOG_ID, DiscoveryKind.FEED, now=NOW).retry_after - NOW for _ in range(5)]
+
+    assert intervals == [timedelta(hours=hours) for hours in (1, 2, 4, 6, 6)]
+
+
+def test_probe_is_skipped_until_retry_after() -> None:
+    backoff = DiscoveryBackoff(base_interval=timedelta(hours=1))
+    backoff.record_miss(BLOG_ID, DiscoveryKind.FEED, now=NOW)
+
+    assert backoff.should_probe(BLOG_ID, DiscoveryKind.FEED, now=NOW + timedelta(minutes=59)) is False
+    assert backoff.should_probe(BLOG_ID, DiscoveryKind.FEED, now=NOW + timedelta(hours=1)) is True
+    assert backoff.should_probe(BLOG_ID, DiscoveryKind.SITEMAP, now=NOW) is True
+
+
+def test_hit_clears_the_miss_record() -> None:
+    store = DictMissStore()
+    backoff = DiscoveryBackoff(store)
+    backoff.record_miss(BLOG_ID, DiscoveryKind.SITEMAP, now=NOW)
+
+    backoff.record_hit(BLOG_ID, DiscoveryKind.SITEMAP)
+
+    assert backoff.should_probe(BLOG_ID, DiscoveryKind.SITEMAP, now=NOW) is True
+    assert store.misses == {}
+
+
+def test_misses_are_restored_from_the_store() -> None:
+    store = DictMissStore()
+    DiscoveryBackoff(store).record_miss(BLOG_ID, DiscoveryKind.FEED, now=NOW)
+
+    restarted = DiscoveryBackoff(store)
+
+    assert restarted.should_probe(BLOG_ID, DiscoveryKind.FEED, now=NOW + timedelta(minutes=1)) is False
+    assert restarted.record_miss(BLOG_ID, DiscoveryKind.FEED, now=NOW).misses == 2
+
+
+def test_invalid_intervals_raise_value_error() -> None:
+    with pytest.raises(ValueError, match="base_interval must be positive"):
+        DiscoveryBackoff(base_interval=timedelta(0))
+    with pytest.raises(ValueError, match="max_interval cannot be shorter than base_interval"):
+        DiscoveryBackoff(base_interval=timedelta(hours=2), max_interval=timedelta(hours=1))
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 from blog_watcher.config.models import BlogConfig
+from blog_watcher.detection.discovery import DiscoveryBackoff, DiscoveryKind
 from blog_watcher.detection.feed import FeedChangeDetector
 from blog_watcher.detection.models import DetectorConfig
 from tests.test_utils.factories import BlogStateFactory, FetchResultFactory
@@ -128,6 +129,28 @@ async def test_feed_304_returns_not_changed(
     assert result.etag == '"abc"'
 
 
+async def test_feed_with_the_same_body_hash_is_not_parsed_again(blog: BlogConfig) -> None:
+    urls = blog_urls(blog)
+    # Not a feed at all: parsing it would fail, so only the hash can make this check succeed.
+    same_body = FetchResultFactory.build(content="<not-a-feed/>", body_hash="h1")
+    fetcher = FakeFetcher({urls.feed: same_body})
+    previous_state = BlogStateFactory.build(
+        blog_id=blog.blog_id,
+        feed_url=urls.feed,
+        feed_body_hash="h1",
+        url_fingerprint="prev-fp",
+        recent_entry_keys='["e1"]',
+        last_checked_at=datetime.now(UTC) - timedelta(days=1),
+    )
+    detector = FeedChangeDetector(fetcher=fetcher, config=DetectorConfig())
+
+    result = await detector.detect(FetchResultFactory.build(), blog.url, previous_state)
+
+    assert result.ok is True
+    assert result.changed is False
+    assert (result.fingerprint, result.entry_keys, result.body_hash) == ("prev-fp", ("e1",), "h1")
+
+
 async def test_feed_rediscovers_when_cached_url_fails(
     blog: BlogConfig,
     feed_link_html: FetchResult,
@@ -148,3 +171,40 @@ async def test_feed_rediscovers_when_cached_url_fails(
 
     assert result.ok is True
     assert result.feed_url == urls.feed
+
+
+async def test_common_feed_paths_are_not_reprobed_after_a_miss(blog: BlogConfig) -> None:
+    html = FetchResultFactory.build(content="<html><body>no feed</body></html>")
+    fetcher = build_feed_fetcher(blog, html=html)
+    detector = FeedChangeDetector(fetcher=fetcher, discovery=DiscoveryBackoff())
+
+    await detector.detect(html, blog.url, None)
+    probed = len(fetcher.fetched_urls)
+    result = await detector.detect(html, blog.url, None)
+
+    assert probed == 5
+    assert len(fetcher.fetched_urls) == probed
+    assert result.ok is False
+
+
+async def test_declared_feed_is_probed_despite_a_recorded_miss(blog: BlogConfig, feed_link_html: FetchResult, rss_valid: FetchResult) -> None:
+    discovery = DiscoveryBackoff()
+    discovery.record_miss(blog.blog_id, DiscoveryKind.FEED)
+    fetcher = build_feed_fetcher(blog, html=feed_link_html, feed=rss_valid)
+    detector = FeedChangeDetector(fetcher=fetcher, discovery=discovery)
+
+    result = await detector.detect(feed_link_html, blog.url, None)
+
+    assert result.ok is True
+    assert discovery.should_probe(blog.blog_id, DiscoveryKind.FEED) is True
+
+
+async def test_guessed_feed_paths_pick_the_first_valid_one_in_order(blog: BlogConfig, rss_valid: FetchResult) -> None:
+    html = FetchResultFactory.build(content="<html><body>no feed</body></html>")
+    fetcher = FakeFetcher({blog.url: html, f"{blog.url}/rss.xml": rss_valid, f"{blog.url}/feed.xml": rss_valid})
+    detector = FeedChangeDetector(fetcher=fetcher, config=DetectorConfig(probe_concurrency=5))
+
+    result = await detector.detect(html, blog.url, None)
+
+    assert result.ok is True
+    assert result.feed_url == f"{blog.url}/rss.xml"
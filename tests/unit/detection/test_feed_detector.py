@@ -114,6 +114,25 @@ def test_parse_feed_with_valid_rss() -> None:
     assert entry1.link == "https://example.com/article-1"
 
 
+_SJIS_RSS = '<rss version="2.0"><channel><title>日記</title><item><guid>a</guid><title>新しい記事</title></item></channel></rss>'
+
+
+def test_parse_feed_decodes_bytes_per_the_xml_declaration() -> None:
+    content = ('<?xml version="1.0" encoding="Shift_JIS"?>' + _SJIS_RSS).encode("shift_jis")
+
+    result = parse_feed(content, feed_url="https://example.com/feed")
+
+    assert result is not None
+    assert (result.title, result.entries[0].title) == ("日記", "新しい記事")
+
+
+def test_parse_feed_prefers_the_http_charset() -> None:
+    result = parse_feed(_SJIS_RSS.encode("shift_jis"), feed_url="https://example.com/feed", encoding="shift_jis")
+
+    assert result is not None
+    assert result.title == "日記"
+
+
 def test_parse_feed_with_valid_atom() -> None:
     atom_content = read_fixture("feeds/atom_valid.xml")
     feed_url = "https://example.com/atom.xml"
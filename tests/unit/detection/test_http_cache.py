@@ -0,0 +1,186 @@
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from blog_watcher.detection.http_cache import CachingFetcher
+from blog_watcher.detection.http_fetcher import FetchResult, SpooledBody
+from blog_watcher.observability import MetricsRegistry
+from blog_watcher.storage.models import HttpCacheEntry
+from tests.test_utils.factories import FetchResultFactory
+
+URL = "https://example.com/feed.xml"
+
+
+class DictCacheStore:
+    def __init__(self) -> None:
+        self.entries: dict[str, HttpCacheEntry] = {}
+        self.bodies: dict[str, bytes] = {}
+
+    def get(self, url: str) -> HttpCacheEntry | None:
+        return self.entries.get(url)
+
+    def get_body(self, body_hash: str) -> bytes | None:
+        return self.bodies.get(body_hash)
+
+    def put(self, entry: HttpCacheEntry, body: bytes) -> None:
+        self.entries[entry.url] = entry
+        self.bodies[entry.body_hash] = body
+
+    def update(self, entry: HttpCacheEntry) -> None:
+        self.entries[entry.url] = entry
+
+    def delete(self, url: str) -> bool:
+        return self.entries.pop(url, None) is not None
+
+    def evict(self, max_bytes: int) -> int:
+        _ = max_bytes
+        return 0
+
+
+class ScriptedFetcher:
+    def __init__(self, *results: FetchResult) -> None:
+        self._results = list(results)
+        self.calls: list[tuple[str, str | None, str | None]] = []
+
+    async def fetch(self, url: str, *, etag: str | None = None, last_modified: str | None = None) -> FetchResult:
+        self.calls.append((url, etag, last_modified))
+        return self._results.pop(0)
+
+
+def _ok(body: str = "<rss/>", *, etag: str | None = '"v1"', max_age: timedelta | None = timedelta(minutes=10), no_store: bool = False) -> FetchResult:
+    return FetchResultFactory.build(
+        status_code=200, content=body, etag=etag, last_modified=None, is_modified=True, freshness_lifetime=max_age, no_store=no_store
+    )
+
+
+def _not_modified(*, max_age: timedelta | None = timedelta(minutes=10)) -> FetchResult:
+    return FetchResultFactory.build(status_code=304, content=None, etag='"v1"', last_modified=None, is_modified=False, freshness_lifetime=max_age)
+
+
+async def test_fresh_response_is_served_without_a_request() -> None:
+    registry = MetricsRegistry()
+    inner = ScriptedFetcher(_ok())
+    fetcher = CachingFetcher(inner, DictCacheStore(), metrics=registry)
+
+    await fetcher.fetch(URL)
+    cached = await fetcher.fetch(URL)
+
+    assert len(inner.calls) == 1
+    assert cached.text == "<rss/>"
+    assert cached.body_hash is not None
+    assert cached.freshness_lifetime is not None
+    assert cached.freshness_lifetime <= timedelta(minutes=10)
+    assert (registry.counter("http_cache_misses").value, registry.counter("http_cache_hits").value) == (1, 1)
+
+
+async def test_cached_response_keeps_its_bytes_and_charset() -> None:
+    body = "<p>日記</p>".encode("euc-jp")
+    inner = ScriptedFetcher(FetchResultFactory.build(content=body, encoding="euc-jp", freshness_lifetime=timedelta(minutes=10)))
+    fetcher = CachingFetcher(inner, DictCacheStore())
+
+    await fetcher.fetch(URL)
+    cached = await fetcher.fetch(URL)
+
+    assert (cached.content, cached.encoding, cached.text) == (body, "euc-jp", "<p>日記</p>")
+
+
+async def test_matching_caller_validators_get_a_local_304() -> None:
+    inner = ScriptedFetcher(_ok())
+    fetcher = CachingFetcher(inner, DictCacheStore())
+
+    first = await fetcher.fetch(URL, etag='"v1"')
+    second = await fetcher.fetch(URL, etag='W/"v1"')
+
+    assert inner.calls == [(URL, None, None)]
+    assert (first.status_code, first.content, first.is_modified) == (304, None, False)
+    assert (second.status_code, second.is_modified) == (304, False)
+
+
+async def test_stale_response_is_revalidated_with_stored_validators() -> None:
+    registry = MetricsRegistry()
+    inner = ScriptedFetcher(_ok(max_age=None), _not_modified())
+    fetcher = CachingFetcher(inner, DictCacheStore(), metrics=registry)
+
+    await fetcher.fetch(URL)
+    revalidated = await fetcher.fetch(URL)
+    fresh = await fetcher.fetch(URL)
+
+    assert inner.calls == [(URL, None, None), (URL, '"v1"', None)]
+    assert revalidated.text == fresh.text == "<rss/>"
+    assert registry.counter("http_cache_revalidations").value == 1
+
+
+async def test_changed_response_replaces_the_stored_body() -> None:
+    inner = ScriptedFetcher(_ok(max_age=timedelta(0)), _ok("<rss>new</rss>", etag='"v2"'))
+    fetcher = CachingFetcher(inner, DictCacheStore())
+
+    await fetcher.fetch(URL)
+    changed = await fetcher.fetch(URL, etag='"v1"')
+    cached = await fetcher.fetch(URL)
+
+    assert changed.text == cached.text == "<rss>new</rss>"
+    assert changed.etag == '"v2"'
+    assert len(inner.calls) == 2
+
+
+async def test_no_store_responses_are_not_kept() -> None:
+    store = DictCacheStore()
+    inner = ScriptedFetcher(_ok(no_store=True), _not_modified())
+    fetcher = CachingFetcher(inner, store)
+
+    await fetcher.fetch(URL)
+    result = await fetcher.fetch(URL, etag='"v1"')
+
+    assert store.entries == {}
+    assert inner.calls[1] == (URL, '"v1"', None)
+    assert result.status_code == 304
+
+
+async def test_responses_without_validators_or_freshness_are_not_kept() -> None:
+    store = DictCacheStore()
+    inner = ScriptedFetcher(_ok(etag=None, max_age=None), _ok(etag=None, max_age=timedelta(0)))
+    fetcher = CachingFetcher(inner, store)
+
+    await fetcher.fetch(URL)
+    await fetcher.fetch(URL)
+
+    assert store.entries == {}
+    assert store.bodies == {}
+    assert len(inner.calls) == 2
+
+
+async def test_spooled_responses_are_not_kept() -> None:
+    store = DictCacheStore()
+    spooled = FetchResultFactory.build(content=None, spool=SpooledBody(Path("/nonexistent/body"), 0), etag='"v1"', freshness_lifetime=None)
+    inner = ScriptedFetcher(spooled, _not_modified())
+    fetcher = CachingFetcher(inner, store)
+
+    assert (await fetcher.fetch(URL)).spool is not None
+    await fetcher.fetch(URL, etag='"v1"')
+
+    assert store.entries == {}
+    assert inner.calls[1] == (URL, '"v1"', None)
+
+
+async def test_uncacheable_urls_are_retried_after_an_hour(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr("blog_watcher.detection.http_cache.time", SimpleNamespace(monotonic=lambda: clock[0]))
+    store = DictCacheStore()
+    inner = ScriptedFetcher(_ok(no_store=True), _ok(no_store=True), _ok())
+    fetcher = CachingFetcher(inner, store)
+
+    await fetcher.fetch(URL)
+    clock[0] += 3599
+    await fetcher.fetch(URL, etag='"v1"')
+    clock[0] += 3601
+    await fetcher.fetch(URL, etag='"v1"')
+
+    assert [etag for _, etag, _ in inner.calls] == [None, '"v1"', None]
+    assert URL in store.entries
+
+
+def test_max_bytes_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_bytes must be positive"):
+        CachingFetcher(ScriptedFetcher(), DictCacheStore(), max_bytes=0)
@@ -1,10 +1,18 @@
+import asyncio
+import gc
+import gzip
+import importlib.util
 from collections.abc import AsyncIterator
+from datetime import timedelta
 
 import httpx
 import pytest
 import respx
 
-from blog_watcher.detection.http_fetcher import HttpFetcher
+from blog_watcher.detection import http_fetcher
+from blog_watcher.detection.circuit_breaker import CircuitOpenError, HostCircuitBreaker
+from blog_watcher.detection.http_fetcher import HttpFetcher, accept_encoding, freshness_lifetime, hash_body
+from blog_watcher.observability import MetricsRegistry
 
 
 @pytest.fixture
@@ -13,6 +21,17 @@ async def fetcher() -> AsyncIterator[HttpFetcher]:
         yield HttpFetcher(client)
 
 
+SPOOL_URL = "https://example.com/sitemap.xml"
+SPOOL_BODY = b"<urlset>" + b"<url><loc>https://example.com/posts/a</loc></url>" * 100 + b"</urlset>"
+
+
+async def _yield_to_loop() -> None:
+    # asyncio.sleep is patched out in unit tests.
+    tick = asyncio.get_running_loop().create_future()
+    tick.get_loop().call_soon(tick.set_result, None)
+    await tick
+
+
 class TestHttpFetcher:
     @respx.mock
     async def test_fetch_success_returns_content(self, fetcher: HttpFetcher) -> None:
@@ -23,7 +42,7 @@ class TestHttpFetcher:
         result = await fetcher.fetch(url)
 
         assert result.status_code == 200
-        assert result.content == body
+        assert result.text == body
         assert result.etag is None
         assert result.last_modified is None
         assert result.is_modified is True
@@ -91,7 +110,7 @@ class TestHttpFetcher:
 
         result = await fetcher.fetch(url)
 
-        assert result.content == "success"
+        assert result.text == "success"
         assert route.call_count == 2
 
     @respx.mock
@@ -106,7 +125,7 @@ class TestHttpFetcher:
 
         result = await fetcher.fetch(url)
 
-        assert result.content == "success"
+        assert result.text == "success"
         assert route.call_count == 2
 
     @respx.mock
@@ -135,4 +154,266 @@ class TestHttpFetcher:
 
         result = await fetcher.fetch(url)
 
-        assert result.content == content
+        assert result.text == content
+
+    @respx.mock
+    async def test_fetch_keeps_the_bytes_and_decodes_text_with_the_declared_charset(self, fetcher: HttpFetcher) -> None:
+        body = "<p>日本語のブログ</p>".encode("shift_jis")
+        respx.get("https://example.com/").mock(
+            return_value=httpx.Response(200, content=body, headers={"Content-Type": "text/html; charset=Shift_JIS"})
+        )
+
+        result = await fetcher.fetch("https://example.com/")
+
+        assert result.content == body
+        assert result.encoding == "shift_jis"
+        assert result.text == "<p>日本語のブログ</p>"
+
+    @respx.mock
+    async def test_fetch_tracks_requests_in_flight(self) -> None:
+        registry = MetricsRegistry()
+        respx.get("https://example.com/feed").mock(return_value=httpx.Response(200, text="content"))
+
+        async with httpx.AsyncClient() as client:
+            fetcher = HttpFetcher(client, metrics=registry)
+            await asyncio.gather(fetcher.fetch("https://example.com/feed"), fetcher.fetch("https://example.com/feed"))
+
+        snapshot = registry.snapshot()
+        assert snapshot["http_requests_in_flight"] == 0
+        assert snapshot["http_requests_in_flight_peak"] >= 1
+
+    @respx.mock
+    async def test_fetch_counts_requests_per_origin_and_http2(self) -> None:
+        registry = MetricsRegistry()
+        respx.get("https://example.com/feed").mock(return_value=httpx.Response(200, text="content", extensions={"http_version": b"HTTP/2"}))
+        respx.get("https://example.org/feed").mock(return_value=httpx.Response(200, text="content"))
+
+        async with httpx.AsyncClient() as client:
+            fetcher = HttpFetcher(client, memo_ttl=timedelta(0), metrics=registry)
+            await fetcher.fetch("https://example.com/feed")
+            await fetcher.fetch("https://example.com/feed")
+            await fetcher.fetch("https://example.org/feed")
+
+        snapshot = registry.snapshot()
+        assert snapshot["http_requests:https://example.com"] == 2
+        assert snapshot["http_requests:https://example.org"] == 1
+        assert snapshot["http2_requests"] == 2
+
+    @respx.mock
+    async def test_fetch_counts_untracked_origins_together(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(http_fetcher, "_MAX_TRACKED_ORIGINS", 2)
+        registry = MetricsRegistry()
+        respx.get(url__regex=r"https://blog-\d\.example\.com/feed").mock(return_value=httpx.Response(200, text="content"))
+
+        async with httpx.AsyncClient() as client:
+            fetcher = HttpFetcher(client, metrics=registry)
+            for index in range(4):
+                await fetcher.fetch(f"https://blog-{index}.example.com/feed")
+            await fetcher.fetch("https://blog-0.example.com/feed?again")
+
+        requests = {name: value for name, value in registry.snapshot().items() if name.startswith("http_requests:")}
+        assert requests == {
+            "http_requests:https://blog-0.example.com": 2,
+            "http_requests:https://blog-1.example.com": 1,
+            "http_requests:<other>": 2,
+        }
+
+    @respx.mock
+    async def test_fetch_reports_wire_and_decoded_bytes(self, fetcher: HttpFetcher) -> None:
+        url = "https://example.com/sitemap.xml"
+        body = "<urlset>" + "<url><loc>https://example.com/posts/a</loc></url>" * 200 + "</urlset>"
+        compressed = gzip.compress(body.encode())
+        route = respx.get(url).mock(return_value=httpx.Response(200, content=compressed, headers={"Content-Encoding": "gzip"}))
+
+        result = await fetcher.fetch(url)
+
+        assert "gzip" in route.calls[0].request.headers["Accept-Encoding"]
+        assert result.text == body
+        assert result.content_encoding == "gzip"
+        assert (result.wire_bytes, result.decoded_bytes) == (len(compressed), len(body))
+
+    @respx.mock
+    async def test_fetch_hashes_the_decoded_body(self, fetcher: HttpFetcher) -> None:
+        body = b"<urlset><url><loc>https://example.com/posts/a</loc></url></urlset>"
+        respx.get("https://example.com/a.xml").mock(return_value=httpx.Response(200, content=body))
+        respx.get("https://example.com/b.xml").mock(
+            return_value=httpx.Response(200, content=gzip.compress(body), headers={"Content-Encoding": "gzip"})
+        )
+        respx.get("https://example.com/c.xml").mock(return_value=httpx.Response(200, content=body + b"\n"))
+
+        first, compressed, other = [await fetcher.fetch(f"https://example.com/{name}.xml") for name in "abc"]
+
+        assert first.body_hash == compressed.body_hash == hash_body(body)
+        assert other.body_hash != first.body_hash
+
+    @respx.mock
+    async def test_body_over_the_threshold_is_spooled_to_a_file(self) -> None:
+        registry = MetricsRegistry()
+        respx.get(SPOOL_URL).mock(return_value=httpx.Response(200, content=SPOOL_BODY))
+
+        async with httpx.AsyncClient() as client:
+            result = await HttpFetcher(client, memo_ttl=timedelta(0), spool_threshold=1024, metrics=registry).fetch(SPOOL_URL)
+
+        assert result.content is None
+        assert result.spool is not None
+        assert result.spool.size == result.decoded_bytes == len(SPOOL_BODY)
+        body = result.open_body()
+        assert body is not None
+        with body:
+            assert body.read() == SPOOL_BODY
+        assert result.body_hash == hash_body(SPOOL_BODY)
+        assert registry.counter("http_bodies_spooled").value == 1
+
+    @respx.mock
+    async def test_spool_file_is_removed_with_the_result(self) -> None:
+        respx.get(SPOOL_URL).mock(return_value=httpx.Response(200, content=SPOOL_BODY))
+
+        async with httpx.AsyncClient() as client:
+            result = await HttpFetcher(client, memo_ttl=timedelta(0), spool_threshold=1024).fetch(SPOOL_URL)
+
+        assert result.spool is not None
+        path = result.spool.path
+        assert path.exists()
+        del result
+        await _yield_to_loop()  # let the finished request's callbacks release it
+        gc.collect()
+        assert not path.exists()
+
+    @respx.mock
+    async def test_body_within_the_threshold_stays_in_memory(self) -> None:
+        respx.get(SPOOL_URL).mock(return_value=httpx.Response(200, content=SPOOL_BODY))
+
+        async with httpx.AsyncClient() as client:
+            result = await HttpFetcher(client, spool_threshold=len(SPOOL_BODY)).fetch(SPOOL_URL)
+
+        assert (result.content, result.spool) == (SPOOL_BODY, None)
+
+    async def test_spool_threshold_must_be_positive(self) -> None:
+        async with httpx.AsyncClient() as client:
+            with pytest.raises(ValueError, match="spool_threshold must be positive"):
+                HttpFetcher(client, spool_threshold=0)
+
+    @respx.mock
+    async def test_open_circuit_skips_the_request(self) -> None:
+        route = respx.get("https://down.example.com/feed").mock(side_effect=httpx.ConnectError("refused"))
+
+        async with httpx.AsyncClient() as client:
+            fetcher = HttpFetcher(client, breaker=HostCircuitBreaker(failure_threshold=1))
+            with pytest.raises(httpx.ConnectError):
+                await fetcher.fetch("https://down.example.com/feed")
+            with pytest.raises(CircuitOpenError):
+                await fetcher.fetch("https://down.example.com/sitemap.xml")
+
+        assert route.call_count == 1
+
+
+class TestRequestCoalescing:
+    URL = "https://example.com/sitemap.xml"
+
+    @staticmethod
+    def gated_route(release: asyncio.Event) -> respx.Route:
+        async def respond(_request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return httpx.Response(200, text="<urlset/>")
+
+        return respx.get(TestRequestCoalescing.URL).mock(side_effect=respond)
+
+    @respx.mock
+    async def test_concurrent_identical_requests_share_one_get(self) -> None:
+        registry = MetricsRegistry()
+        release = asyncio.Event()
+        route = self.gated_route(release)
+
+        async with httpx.AsyncClient() as client:
+            fetcher = HttpFetcher(client, metrics=registry)
+            pending = asyncio.gather(*(fetcher.fetch(self.URL) for _ in range(3)))
+            release.set()
+            results = await pending
+
+        assert route.call_count == 1
+        assert [result.text for result in results] == ["<urlset/>"] * 3
+        assert registry.snapshot()["http_requests_coalesced"] == 2
+
+    @respx.mock
+    async def test_different_validators_are_not_coalesced(self, fetcher: HttpFetcher) -> None:
+        route = respx.get(self.URL).mock(return_value=httpx.Response(200, text="<urlset/>"))
+
+        await asyncio.gather(fetcher.fetch(self.URL), fetcher.fetch(self.URL, etag='"v1"'))
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_repeat_within_memo_ttl_reuses_the_response(self) -> None:
+        registry = MetricsRegistry()
+        route = respx.get(self.URL).mock(return_value=httpx.Response(200, text="<urlset/>"))
+
+        async with httpx.AsyncClient() as client:
+            fetcher = HttpFetcher(client, metrics=registry)
+            first = await fetcher.fetch(self.URL)
+            second = await fetcher.fetch(self.URL)
+
+        assert route.call_count == 1
+        assert second == first
+        assert registry.snapshot()["http_memo_hits"] == 1
+
+    @respx.mock
+    async def test_zero_memo_ttl_refetches(self) -> None:
+        route = respx.get(self.URL).mock(return_value=httpx.Response(200, text="<urlset/>"))
+
+        async with httpx.AsyncClient() as client:
+            fetcher = HttpFetcher(client, memo_ttl=timedelta(0))
+            await fetcher.fetch(self.URL)
+            await fetcher.fetch(self.URL)
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_failures_are_not_memoized(self, fetcher: HttpFetcher) -> None:
+        route = respx.get(self.URL).mock(side_effect=[httpx.ConnectError("refused"), httpx.Response(200, text="<urlset/>")])
+
+        with pytest.raises(httpx.ConnectError):
+            await fetcher.fetch(self.URL)
+        result = await fetcher.fetch(self.URL)
+
+        assert route.call_count == 2
+        assert result.text == "<urlset/>"
+
+    @respx.mock
+    async def test_cancelled_waiter_leaves_the_shared_request_running(self, fetcher: HttpFetcher) -> None:
+        release = asyncio.Event()
+        self.gated_route(release)
+
+        abandoned = asyncio.create_task(fetcher.fetch(self.URL))
+        kept = asyncio.create_task(fetcher.fetch(self.URL))
+        await _yield_to_loop()
+        abandoned.cancel()
+        release.set()
+
+        result = await kept
+        assert result.text == "<urlset/>"
+        assert abandoned.cancelled()
+
+
+def test_accept_encoding_only_offers_installed_decoders(monkeypatch: pytest.MonkeyPatch) -> None:
+    installed = {"brotli"}
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: object() if name in installed else None)
+
+    assert accept_encoding() == "br, gzip, deflate"
+
+    installed.add("zstandard")
+    assert accept_encoding() == "zstd, br, gzip, deflate"
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"Cache-Control": "public, max-age=600"}, timedelta(minutes=10)),
+        ({"Cache-Control": "no-cache"}, timedelta(0)),
+        ({"Cache-Control": "max-age=60", "Expires": "Mon, 27 Jan 2025 13:00:00 GMT", "Date": "Mon, 27 Jan 2025 12:00:00 GMT"}, timedelta(minutes=1)),
+        ({"Expires": "Mon, 27 Jan 2025 13:00:00 GMT", "Date": "Mon, 27 Jan 2025 12:00:00 GMT"}, timedelta(hours=1)),
+        ({"Expires": "0", "Date": "Mon, 27 Jan 2025 12:00:00 GMT"}, timedelta(0)),
+    ],
+)
+def test_freshness_lifetime(headers: dict[str, str], expected: timedelta | None) -> None:
+    assert freshness_lifetime(httpx.Headers(headers)) == expected
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from blog_watcher.detection.probing import first_in_order
+
+
+class GatedProbe:
+    """Answers a candidate only once the test opens its gate, recording what ran."""
+
+    def __init__(self, answers: dict[str, str | None]) -> None:
+        self._answers = answers
+        self.gates = {candidate: asyncio.Event() for candidate in answers}
+        self.started: list[str] = []
+        self.cancelled: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def open(self, *candidates: str) -> None:
+        for candidate in candidates:
+            self.gates[candidate].set()
+
+    async def __call__(self, candidate: str) -> str | None:
+        self.started.append(candidate)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await self.gates[candidate].wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(candidate)
+            raise
+        finally:
+            self.in_flight -= 1
+        return self._answers[candidate]
+
+
+async def _settle() -> None:
+    # asyncio.sleep is patched out in unit tests, so yield to the loop by hand.
+    loop = asyncio.get_running_loop()
+    for _ in range(5):
+        tick = loop.create_future()
+        loop.call_soon(tick.set_result, None)
+        await tick
+
+
+async def test_earlier_candidate_wins_over_a_faster_later_one() -> None:
+    probe = GatedProbe({"a": None, "b": "b-result", "c": "c-result"})
+    task = asyncio.create_task(first_in_order(["a", "b", "c"], probe, concurrency=3))
+
+    probe.open("c")
+    await _settle()
+    assert not task.done()
+    probe.open("b", "a")
+
+    assert await task == ("b", "b-result")
+
+
+async def test_candidates_are_probed_concurrently() -> None:
+    probe = GatedProbe(dict.fromkeys("abcd") | {"e": "hit"})
+    task = asyncio.create_task(first_in_order(list("abcde"), probe, concurrency=5))
+
+    await _settle()
+    assert probe.in_flight == 5
+    probe.open(*"abcde")
+
+    assert await task == ("e", "hit")
+
+
+async def test_concurrency_is_bounded_and_in_priority_order() -> None:
+    probe = GatedProbe(dict.fromkeys("abcde"))
+    task = asyncio.create_task(first_in_order(list("abcde"), probe, concurrency=2))
+
+    await _settle()
+    assert probe.started == ["a", "b"]
+    probe.open(*"abcde")
+
+    assert await task is None
+    assert probe.peak == 2
+    assert probe.started == list("abcde")
+
+
+async def test_remaining_probes_are_cancelled_once_the_winner_is_known() -> None:
+    probe = GatedProbe({"a": "hit", "b": None, "c": "late"})
+    probe.open("a")
+
+    assert await first_in_order(["a", "b", "c"], probe, concurrency=3) == ("a", "hit")
+    assert sorted(probe.cancelled) == ["b", "c"]
+    assert probe.in_flight == 0
+
+
+async def test_probe_errors_propagate_and_cancel_the_rest() -> None:
+    probe = GatedProbe({"b": None})
+
+    async def failing(candidate: str) -> str | None:
+        if candidate == "a":
+            await _settle()
+            msg = "boom"
+            raise RuntimeError(msg)
+        return await probe(candidate)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await first_in_order(["a", "b"], failing, concurrency=2)
+    assert probe.cancelled == ["b"]
+
+
+async def test_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="concurrency must be positive"):
+        await first_in_order(["a"], GatedProbe({"a": None}), concurrency=0)
@@ -0,0 +1,142 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from freezegun import freeze_time
+
+from blog_watcher.detection.http_fetcher import FetchResult
+from blog_watcher.detection.robots import RobotsCache, parse_robots
+from blog_watcher.storage.models import RobotsRecord
+from tests.test_utils.factories import FetchResultFactory
+from tests.test_utils.fakes import FakeFetcher
+
+ROBOTS_URL = "https://example.com/robots.txt"
+
+
+class DictRobotsStore:
+    def __init__(self) -> None:
+        self.records: dict[str, RobotsRecord] = {}
+
+    def get(self, host: str) -> RobotsRecord | None:
+        return self.records.get(host)
+
+    def upsert(self, record: RobotsRecord) -> None:
+        self.records[record.host] = record
+
+
+class FailingFetcher:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def fetch(self, url: str, *, etag: str | None = None, last_modified: str | None = None) -> FetchResult:
+        _ = url, etag, last_modified
+        self.calls += 1
+        msg = "connection refused"
+        raise OSError(msg)
+
+
+def test_parse_robots_collects_sitemaps_from_every_group() -> None:
+    robots_txt = """
+User-agent: SomeBot
+Crawl-delay: 30
+
+User-agent: Other
+User-agent: *
+Disallow: /private  # not for crawlers
+Crawl-delay: 1.5
+Sitemap: https://example.com/sitemap.xml
+sitemap: https://example.com/news.xml
+Sitemap: https://example.com/sitemap.xml
+"""
+
+    rules = parse_robots(robots_txt)
+
+    assert rules.sitemaps == ("https://example.com/sitemap.xml", "https://example.com/news.xml")
+
+
+async def test_blogs_on_one_host_share_a_single_fetch() -> None:
+    fetcher = FakeFetcher({ROBOTS_URL: FetchResultFactory.build(content="Sitemap: https://example.com/sitemap.xml")})
+    cache = RobotsCache(fetcher)
+
+    first = await cache.get("https://example.com/blog-a")
+    second = await cache.get("https://example.com/blog-b/")
+
+    assert fetcher.fetched_urls == [ROBOTS_URL]
+    assert first is second
+    assert first is not None
+    assert first.sitemaps == ("https://example.com/sitemap.xml",)
+
+
+async def test_max_age_shortens_the_ttl() -> None:
+    fetcher = FakeFetcher({ROBOTS_URL: FetchResultFactory.build(content="User-agent: *", freshness_lifetime=timedelta(minutes=10))})
+    cache = RobotsCache(fetcher)
+
+    with freeze_time("2025-01-27T12:00:00Z") as frozen:
+        record = await cache.get("https://example.com")
+        assert record is not None
+        assert record.expires_at == datetime(2025, 1, 27, 12, 10, tzinfo=UTC)
+
+        frozen.tick(timedelta(minutes=9))
+        await cache.get("https://example.com")
+        assert len(fetcher.fetched_urls) == 1
+
+        frozen.tick(timedelta(minutes=2))
+        await cache.get("https://example.com")
+        assert len(fetcher.fetched_urls) == 2
+
+
+@pytest.mark.parametrize("lifetime", [None, timedelta(days=7)])
+async def test_ttl_is_capped_at_max_ttl(lifetime: timedelta | None) -> None:
+    fetcher = FakeFetcher({ROBOTS_URL: FetchResultFactory.build(content="User-agent: *", freshness_lifetime=lifetime)})
+    cache = RobotsCache(fetcher, max_ttl=timedelta(hours=6))
+
+    record = await cache.get("https://example.com")
+
+    assert record is not None
+    assert record.expires_at - record.fetched_at == timedelta(hours=6)
+
+
+@pytest.mark.parametrize("lifetime", [timedelta(0), timedelta(seconds=30)])
+async def test_ttl_is_raised_to_min_ttl(lifetime: timedelta) -> None:
+    fetcher = FakeFetcher({ROBOTS_URL: FetchResultFactory.build(content="User-agent: *", freshness_lifetime=lifetime)})
+    cache = RobotsCache(fetcher)
+
+    with freeze_time("2025-01-27T12:00:00Z") as frozen:
+        record = await cache.get("https://example.com")
+        assert record is not None
+        assert record.expires_at - record.fetched_at == timedelta(minutes=5)
+
+        frozen.tick(timedelta(minutes=4))
+        await cache.get("https://example.com")
+        assert len(fetcher.fetched_urls) == 1
+
+
+async def test_persisted_record_survives_a_restart() -> None:
+    store = DictRobotsStore()
+    fetcher = FakeFetcher({ROBOTS_URL: FetchResultFactory.build(content="Sitemap: https://example.com/sitemap.xml")})
+
+    await RobotsCache(fetcher, store).get("https://example.com")
+    record = await RobotsCache(fetcher, store).get("https://example.com")
+
+    assert fetcher.fetched_urls == [ROBOTS_URL]
+    assert record == store.records["https://example.com"]
+
+
+async def test_missing_robots_is_cached_without_sitemaps() -> None:
+    fetcher = FakeFetcher({ROBOTS_URL: FetchResultFactory.build(status_code=404, content="Sitemap: https://example.com/not-robots.xml")})
+    cache = RobotsCache(fetcher)
+
+    record = await cache.get("https://example.com")
+    await cache.get("https://example.com")
+
+    assert record is not None
+    assert (record.status, record.sitemaps) == (404, ())
+    assert len(fetcher.fetched_urls) == 1
+
+
+async def test_fetch_errors_are_not_cached() -> None:
+    fetcher = FailingFetcher()
+    cache = RobotsCache(fetcher)
+
+    assert await cache.get("https://example.com") is None
+    assert await cache.get("https://example.com") is None
+    assert fetcher.calls == 2
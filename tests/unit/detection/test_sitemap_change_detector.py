@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 from blog_watcher.config.models import BlogConfig
+from blog_watcher.detection.discovery import DiscoveryBackoff
 from blog_watcher.detection.models import DetectorConfig
-from blog_watcher.detection.sitemap import SitemapChangeDetector
+from blog_watcher.detection.sitemap import SitemapChangeDetector, SitemapChildCache
 from tests.test_utils.factories import BlogStateFactory, FetchResultFactory
 from tests.test_utils.fakes import FakeFetcher
 from tests.test_utils.helpers import assert_not_fetched, blog_urls, build_sitemap_fetcher
@@ -126,6 +128,88 @@ async def test_sitemap_304_returns_not_changed() -> None:
     assert result.etag == '"xyz"'
 
 
+async def test_sitemap_with_the_same_body_hash_is_not_parsed_again() -> None:
+    blog = BlogConfig(name="example", url="https://example.com")
+    urls_info = blog_urls(blog)
+    same_body = FetchResultFactory.build(content=_build_sitemap_urlset(["https://example.com/posts/new"]), body_hash="h1")
+
+    fetcher = FakeFetcher({urls_info.sitemap: same_body})
+    previous_state = BlogStateFactory.build(
+        blog_id=blog.blog_id,
+        sitemap_url=urls_info.sitemap,
+        sitemap_body_hash="h1",
+        url_fingerprint="prev-sitemap-fp",
+        last_checked_at=datetime.now(UTC) - timedelta(days=1),
+    )
+    detector = SitemapChangeDetector(fetcher=fetcher, config=DetectorConfig())
+
+    result = await detector.detect(blog.url, previous_state)
+
+    assert result.ok is True
+    assert result.changed is False
+    assert (result.fingerprint, result.body_hash) == ("prev-sitemap-fp", "h1")
+
+
+async def test_sitemap_index_is_never_short_circuited_so_child_changes_are_seen() -> None:
+    blog = BlogConfig(name="example", url="https://example.com")
+    urls_info = blog_urls(blog)
+    child_url = "https://example.com/sitemap-posts.xml"
+    index_xml = f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex><sitemap><loc>{child_url}</loc></sitemap></sitemapindex>'
+    index = FetchResultFactory.build(content=index_xml, etag='"index"', body_hash="h-index")
+    results = {urls_info.sitemap: index, child_url: FetchResultFactory.build(content=_build_sitemap_urlset(["https://example.com/posts/a"]))}
+    fetcher = FakeFetcher(results)
+    detector = SitemapChangeDetector(fetcher=fetcher, config=DetectorConfig())
+    previous_state = BlogStateFactory.build(
+        blog_id=blog.blog_id,
+        sitemap_url=urls_info.sitemap,
+        url_fingerprint="prev-sitemap-fp",
+        last_checked_at=datetime.now(UTC) - timedelta(days=1),
+    )
+
+    first = await detector.detect(blog.url, previous_state)
+    results[child_url] = FetchResultFactory.build(content=_build_sitemap_urlset(["https://example.com/posts/b"]))
+    stored = replace(
+        previous_state,
+        url_fingerprint=first.fingerprint,
+        sitemap_etag=first.etag,
+        sitemap_last_modified=first.last_modified,
+        sitemap_body_hash=first.body_hash,
+    )
+    second = await detector.detect(blog.url, stored)
+
+    assert (first.etag, first.last_modified, first.body_hash) == (None, None, None)
+    assert second.changed is True
+    assert fetcher.fetched_urls == [urls_info.sitemap, child_url] * 2
+
+
+async def test_unchanged_child_sitemaps_are_not_parsed_again() -> None:
+    blog = BlogConfig(name="example", url="https://example.com")
+    urls_info = blog_urls(blog)
+    child_url = "https://example.com/sitemap-posts.xml"
+    index_xml = f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex><sitemap><loc>{child_url}</loc></sitemap></sitemapindex>'
+    child = FetchResultFactory.build(content=_build_sitemap_urlset(["https://example.com/posts/a"]), body_hash="h-child")
+    results = {urls_info.sitemap: FetchResultFactory.build(content=index_xml), child_url: child}
+    fetcher = FakeFetcher(results)
+    detector = SitemapChangeDetector(fetcher=fetcher, config=DetectorConfig(), children=SitemapChildCache())
+    previous_state = BlogStateFactory.build(
+        blog_id=blog.blog_id,
+        sitemap_url=urls_info.sitemap,
+        url_fingerprint="prev-sitemap-fp",
+        last_checked_at=datetime.now(UTC) - timedelta(days=1),
+    )
+
+    first = await detector.detect(blog.url, previous_state)
+    # Same hash, unparsable body: the URLs from the first parse must be reused.
+    results[child_url] = FetchResultFactory.build(content="not xml", body_hash="h-child")
+    second = await detector.detect(blog.url, replace(previous_state, url_fingerprint=first.fingerprint))
+    results[child_url] = FetchResultFactory.build(content=_build_sitemap_urlset(["https://example.com/posts/b"]), body_hash="h-child-2")
+    third = await detector.detect(blog.url, replace(previous_state, url_fingerprint=second.fingerprint))
+
+    assert (second.ok, second.changed, second.fingerprint) == (True, False, first.fingerprint)
+    assert third.changed is True
+    assert fetcher.fetched_urls == [urls_info.sitemap, child_url] * 3
+
+
 async def test_sitemap_rediscovers_when_cached_url_fails(robots_allow_all: FetchResult) -> None:
     blog = BlogConfig(name="example", url="https://example.com")
     urls_info = blog_urls(blog)
@@ -145,3 +229,16 @@ async def test_sitemap_rediscovers_when_cached_url_fails(robots_allow_all: Fetch
 
     assert result.ok is True
     assert result.sitemap_url == urls_info.sitemap
+
+
+async def test_common_sitemap_paths_are_not_reprobed_after_a_miss(robots_allow_all: FetchResult) -> None:
+    blog = BlogConfig(name="example", url="https://example.com")
+    fetcher = build_sitemap_fetcher(blog, robots=robots_allow_all)
+    detector = SitemapChangeDetector(fetcher=fetcher, config=DetectorConfig(), discovery=DiscoveryBackoff())
+
+    first = await detector.detect(blog.url, None)
+    probed = list(fetcher.fetched_urls)
+    second = await detector.detect(blog.url, None)
+
+    assert (first.ok, second.ok) == (False, False)
+    assert fetcher.fetched_urls == probed
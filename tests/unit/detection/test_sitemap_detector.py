@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from hypothesis import given
 from hypothesis import strategies as st
 
@@ -10,6 +12,9 @@ from blog_watcher.detection.sitemap.detector import (
 )
 from tests.test_utils.helpers import read_fixture
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestDetectSitemapUrls:
     def test_detect_sitemap_urls_from_robots_txt(self) -> None:
@@ -42,6 +47,12 @@ class TestParseSitemap:
         assert len(result.page_urls) == 3
         assert "https://example.com/posts/article-1" in result.page_urls
 
+    def test_parse_sitemap_decodes_bytes_per_the_xml_declaration(self) -> None:
+        content = '<?xml version="1.0" encoding="ISO-8859-1"?><urlset><url><loc>https://example.com/café</loc></url></urlset>'.encode("latin-1")
+        result = parse_sitemap(content, "https://example.com/sitemap.xml")
+        assert result is not None
+        assert result.page_urls == ("https://example.com/café",)
+
     def test_parse_sitemap_index(self) -> None:
         content = read_fixture("sitemap/index.xml")
         result = parse_sitemap(content, "https://example.com/sitemap.xml")
@@ -57,6 +68,16 @@ class TestParseSitemap:
         assert result.is_index is False
         assert len(result.page_urls) == 2
 
+    def test_parse_sitemap_from_a_file_stream(self, tmp_path: Path) -> None:
+        path = tmp_path / "sitemap.xml"
+        entries = "".join(f"<url><loc>https://example.com/posts/{index}</loc><lastmod>2024-01-01</lastmod></url>" for index in range(1000))
+        path.write_text(f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>', encoding="utf-8")
+        with path.open("rb") as stream:
+            result = parse_sitemap(stream, "https://example.com/sitemap.xml")
+        assert result is not None
+        assert len(result.page_urls) == 1000
+        assert result.page_urls[-1] == "https://example.com/posts/999"
+
     def test_parse_sitemap_malformed_xml(self) -> None:
         result = parse_sitemap("<urlset><broken", "https://example.com/sitemap.xml")
         assert result is None
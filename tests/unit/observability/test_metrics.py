@@ -0,0 +1,30 @@
+from blog_watcher.observability import MetricsRegistry
+
+
+def test_registry_returns_same_instrument_for_name() -> None:
+    registry = MetricsRegistry()
+
+    assert registry.counter("checks") is registry.counter("checks")
+    assert registry.gauge("in_flight") is registry.gauge("in_flight")
+
+
+def test_gauge_track_records_peak() -> None:
+    registry = MetricsRegistry()
+    gauge = registry.gauge("in_flight")
+
+    with gauge.track(), gauge.track():
+        assert gauge.value == 2
+
+    assert registry.snapshot() == {"in_flight": 0, "in_flight_peak": 2}
+
+
+def test_report_resets_peaks_to_current_value() -> None:
+    registry = MetricsRegistry()
+    registry.counter("checks").inc(3)
+    gauge = registry.gauge("in_flight")
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    assert registry.report() == {"checks": 3, "in_flight": 1, "in_flight_peak": 2}
+    assert registry.snapshot() == {"checks": 3, "in_flight": 1, "in_flight_peak": 1}
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from blog_watcher.storage.codec import decode_fingerprint, decode_timestamp, encode_fingerprint, encode_timestamp
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(1970, 1, 1, tzinfo=UTC),
+        datetime(2025, 3, 1, 12, 34, 56, 789000, tzinfo=UTC),
+        datetime(1969, 12, 31, 23, 59, 59, 999000, tzinfo=UTC),
+    ],
+)
+def test_timestamp_round_trip(value: datetime) -> None:
+    assert decode_timestamp(encode_timestamp(value)) == value
+
+
+def test_encode_timestamp_normalizes_offsets_and_truncates_to_milliseconds() -> None:
+    value = datetime(2025, 3, 1, 21, 0, 0, 123456, tzinfo=timezone(timedelta(hours=9)))
+
+    assert decode_timestamp(encode_timestamp(value)) == datetime(2025, 3, 1, 12, 0, 0, 123000, tzinfo=UTC)
+
+
+def test_sha256_fingerprint_is_stored_as_bytes() -> None:
+    digest = "0f" * 32
+
+    encoded = encode_fingerprint(digest)
+
+    assert encoded == bytes.fromhex(digest)
+    assert decode_fingerprint(encoded) == digest
+
+
+@pytest.mark.parametrize("value", ["", "abc", "zz" * 32])
+def test_other_fingerprints_are_kept_verbatim(value: str) -> None:
+    assert encode_fingerprint(value) == value
+    assert decode_fingerprint(value) == value
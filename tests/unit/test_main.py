@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import importlib.util
+from typing import Any
+
+import httpx
+import pytest
+from structlog.testing import capture_logs
+
+from blog_watcher.config import HttpConfig
+from blog_watcher.main import _build_http_client
+
+
+@pytest.fixture
+def client_kwargs(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    captured: dict[str, Any] = {}
+    real_client = httpx.AsyncClient
+
+    def recording_client(**kwargs: object) -> httpx.AsyncClient:
+        captured.update(kwargs)
+        return real_client(**kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(httpx, "AsyncClient", recording_client)
+    return captured
+
+
+async def test_http2_falls_back_to_http1_without_h2(monkeypatch: pytest.MonkeyPatch, client_kwargs: dict[str, Any]) -> None:
+    monkeypatch.setattr(importlib.util, "find_spec", lambda _name: None)
+
+    with capture_logs() as logs:
+        client = _build_http_client(HttpConfig(http2=True))
+    await client.aclose()
+
+    assert client_kwargs["http2"] is False
+    assert [log["event"] for log in logs] == ["http2_unavailable"]
+
+
+async def test_http2_is_enabled_when_h2_is_installed(client_kwargs: dict[str, Any]) -> None:
+    pytest.importorskip("h2")
+
+    with capture_logs() as logs:
+        client = _build_http_client(HttpConfig(http2=True))
+    await client.aclose()
+
+    assert client_kwargs["http2"] is True
+    assert logs == []